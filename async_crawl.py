@@ -345,10 +345,9 @@ async def main():
 
         if resume_state.get("status") == "completed":
             # Check if we have page data saved - if so, offer to regenerate report
-            pages_dir = crawl_dir / "pages"
-            page_files = list(pages_dir.glob("*.json")) if pages_dir.exists() else []
-            if page_files:
-                print(f"Crawl already completed with {len(page_files)} pages saved.")
+            saved_pages = sum(1 for _ in output_mgr.iter_saved_pages(crawl_dir))
+            if saved_pages:
+                print(f"Crawl already completed with {saved_pages} pages saved.")
                 print(f"Regenerating report from saved data...")
                 # Continue to load data and regenerate report
             else:
@@ -15,6 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from seo.llm import LLMClient
 from seo.models import TechnicalIssues, PageMetadata
+from seo.output_manager import iter_saved_pages
 
 
 def load_crawl_data(crawl_dir: Path):
@@ -29,15 +30,12 @@ def load_crawl_data(crawl_dir: Path):
     with open(crawl_state_path) as f:
         crawl_state = json.load(f)
 
-    # Load page data
-    pages_dir = crawl_dir / "pages"
+    # Load page data (pages/*.json or pages.jsonl, plain or gzipped)
     site_data = {}
-    for page_file in pages_dir.glob("*.json"):
-        with open(page_file) as f:
-            page_data = json.load(f)
-            url = page_data.get("url", "")
-            if url:
-                site_data[url] = page_data
+    for page_data in iter_saved_pages(crawl_dir):
+        url = page_data.get("url", "")
+        if url:
+            site_data[url] = page_data
 
     # Load advanced analysis (summary only, skip large data)
     advanced_path = crawl_dir / "advanced_analysis.json"
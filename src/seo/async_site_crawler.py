@@ -20,6 +20,7 @@ from bs4 import BeautifulSoup
 from rebrowser_playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 from seo.models import PageMetadata
+from seo.output_manager import iter_saved_pages
 from seo.core_web_vitals import CoreWebVitalsAnalyzer
 from seo.structured_data import StructuredDataAnalyzer
 from seo.external.pagespeed_insights import PageSpeedInsightsAPI
@@ -389,21 +390,15 @@ class AsyncSiteCrawler:
         """Load existing page data from the pages/ directory.
 
         This enables proper resume by restoring site_data from previously
-        saved page JSON files.
+        saved page JSON files (or pages.jsonl, plain or gzipped).
 
         Args:
             crawl_dir: The crawl directory containing pages/ subdirectory
         """
         from dataclasses import fields
-        pages_dir = crawl_dir / "pages"
-        if not pages_dir.exists():
-            return
 
-        for page_file in pages_dir.glob("*.json"):
+        for data in iter_saved_pages(crawl_dir):
             try:
-                with open(page_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
                 url = data.get("url")
                 if not url:
                     continue
@@ -428,7 +423,7 @@ class AsyncSiteCrawler:
                 self.site_data[url] = PageMetadata(**filtered_data)
 
             except Exception as e:
-                logger.warning(f"Failed to load page data from {page_file}: {e}")
+                logger.warning(f"Failed to load saved page data: {e}")
 
     def _save_page_to_disk(self, url: str, metadata: PageMetadata) -> None:
         """Save a single page's metadata to disk immediately.
@@ -1,5 +1,6 @@
 """Console error analyzer for JavaScript health assessment."""
 
+import heapq
 import re
 from collections import Counter
 from typing import Dict, List, Optional, Pattern
@@ -70,6 +71,7 @@ class ConsoleErrorAnalyzer:
 
         all_errors: List[Dict] = []
         error_messages: List[str] = []
+        error_types: List[str] = []
         pages_errors: List[Dict] = []
 
         for url, page in pages.items():
@@ -88,10 +90,7 @@ class ConsoleErrorAnalyzer:
                 error_messages.append(error[:100])  # For frequency analysis
                 page_error_count += 1
                 page_errors_list.append(error[:100])
-
-                # Count by type
-                analysis.errors_by_type[error_type] = \
-                    analysis.errors_by_type.get(error_type, 0) + 1
+                error_types.append(error_type)
 
             # Process warnings
             for warning in page.console_warnings:
@@ -112,8 +111,9 @@ class ConsoleErrorAnalyzer:
 
             analysis.total_warnings += page_warning_count
 
-        # Totals
+        # Totals (counted in one pass; stored as a plain dict for asdict/JSON)
         analysis.total_errors = len(all_errors)
+        analysis.errors_by_type = dict(Counter(error_types))
 
         # Error-free percentage
         if analysis.total_pages > 0:
@@ -122,9 +122,10 @@ class ConsoleErrorAnalyzer:
                 error_free / analysis.total_pages * 100, 1
             )
 
-        # Sort pages by error count and limit
-        pages_errors.sort(key=lambda x: x['error_count'], reverse=True)
-        analysis.pages_by_error_count = pages_errors[:self.top_pages_count]
+        # Keep the pages with the most errors (partial sort, ties keep page order)
+        analysis.pages_by_error_count = heapq.nlargest(
+            self.top_pages_count, pages_errors, key=lambda x: x['error_count']
+        )
 
         # Find most common errors
         error_counter = Counter(error_messages)
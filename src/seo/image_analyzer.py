@@ -1,5 +1,6 @@
 """Image optimization analyzer for performance improvement."""
 
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -89,7 +90,7 @@ class ImageAnalyzer:
 
         analysis = ImageAnalysis(total_pages=len(pages))
 
-        format_counts: Dict[str, int] = {}
+        image_formats: List[str] = []
         all_issues: List[ImageIssue] = []
 
         # Track issues for evidence (limit samples)
@@ -106,7 +107,7 @@ class ImageAnalyzer:
 
                 # Determine format
                 img_format = self._get_image_format(img_src)
-                format_counts[img_format] = format_counts.get(img_format, 0) + 1
+                image_formats.append(img_format)
 
                 # Check for modern format conversion opportunity
                 if img_format in self.convertible_formats:
@@ -174,7 +175,8 @@ class ImageAnalyzer:
                     'should_lazy': excess
                 })
 
-        # Store format counts
+        # Count formats in one pass (stored as a plain dict for asdict/JSON)
+        format_counts: Dict[str, int] = dict(Counter(image_formats))
         analysis.format_counts = format_counts
 
         # Calculate modern format percentage
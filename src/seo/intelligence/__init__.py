@@ -6,7 +6,7 @@ Ported from Spectrum per EPIC-SEO-INFRA-001.
 Provides persistent storage and retrieval of learned site knowledge:
 - Site profiles with metadata and history
 - Selector libraries with confidence scoring
-- AI response caching (content-addressable)
+- AI response caching (content-addressable and embedding-similarity)
 """
 
 from .site_profile import (
@@ -20,6 +20,7 @@ from .site_profile import (
 )
 from .selector_library import SelectorLibrary, SelectorCandidate
 from .ai_cache import AICache, CacheEntry
+from .semantic_cache import SemanticCache
 from .dynamic_selectors import (
     FrameworkType,
     SelectorStability,
@@ -52,6 +53,7 @@ __all__ = [
     # AI caching
     "AICache",
     "CacheEntry",
+    "SemanticCache",
     # Dynamic selectors (Gap #4)
     "FrameworkType",
     "SelectorStability",
@@ -17,6 +17,26 @@ import json
 import sqlite3
 import threading
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Cached responses carry nested evidence dicts; orjson encodes and decodes
+# them several times faster than the stdlib
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 
 @dataclass
 class CacheEntry:
@@ -169,7 +189,23 @@ class AICache:
         if not self.enabled:
             return None
 
-        key = self._compute_key(prompt, context)
+        return self.get_by_key(self._compute_key(prompt, context))
+
+    def get_by_key(self, key: str) -> dict[str, Any] | None:
+        """
+        Retrieve a cached response by a caller-computed key.
+
+        Lets callers that already hold a digest of their prompt skip
+        re-hashing the full prompt text.
+
+        Args:
+            key: Cache key (as returned by put/put_by_key)
+
+        Returns:
+            Cached response dict or None if not found/expired
+        """
+        if not self.enabled:
+            return None
 
         with self._lock:
             conn = self._get_conn()
@@ -195,8 +231,7 @@ class AICache:
                 self._remove_entry_unlocked(conn, key)
                 return None
 
-            with open(response_path) as f:
-                response = json.load(f)
+            response = _json_loads(response_path.read_bytes())
 
             # Update hit count atomically
             conn.execute(
@@ -231,32 +266,80 @@ class AICache:
         if not self.enabled:
             return ""
 
-        key = self._compute_key(prompt, context)
-        prompt_hash = self._compute_prompt_hash(prompt)
-        response_path = self._get_response_path(key)
-        now = datetime.now()
-        expires_at = now + timedelta(hours=self.ttl_hours)
+        return self.put_by_key(
+            self._compute_key(prompt, context),
+            response,
+            model,
+            prompt_hash=self._compute_prompt_hash(prompt),
+        )
 
-        # Store response to file
-        response_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(response_path, "w") as f:
-            json.dump(response, f, indent=2)
+    def put_by_key(
+        self,
+        key: str,
+        response: dict[str, Any],
+        model: str,
+        prompt_hash: str = "",
+    ) -> str:
+        """
+        Store an AI response under a caller-computed key.
+
+        Args:
+            key: Cache key, e.g. a digest derived from the prompt hash
+            response: The AI response to cache
+            model: The model that generated the response
+            prompt_hash: Prompt digest used for similarity lookup
+
+        Returns:
+            The cache key
+        """
+        if not self.enabled:
+            return ""
+
+        self.put_many([(key, response, model, prompt_hash)])
+        return key
+
+    def put_many(self, entries: list[tuple[str, dict[str, Any], str, str]]) -> int:
+        """
+        Store several AI responses in one index transaction.
+
+        Args:
+            entries: (key, response, model, prompt_hash) tuples
+
+        Returns:
+            Number of entries stored
+        """
+        if not self.enabled or not entries:
+            return 0
+
+        now = datetime.now()
+        created_at = now.isoformat()
+        expires_at = (now + timedelta(hours=self.ttl_hours)).isoformat()
+
+        # Store responses to files
+        rows = []
+        for key, response, model, prompt_hash in entries:
+            response_path = self._get_response_path(key)
+            response_path.parent.mkdir(parents=True, exist_ok=True)
+            response_path.write_bytes(_json_dumps(response))
+            rows.append(
+                (key, prompt_hash[:16], model, str(response_path), created_at, expires_at)
+            )
 
         # Store metadata in SQLite
         with self._lock:
             conn = self._get_conn()
-            conn.execute(
+            conn.executemany(
                 """INSERT OR REPLACE INTO cache_entries
                    (key, prompt_hash, model, response_path, created_at, expires_at, hit_count, last_hit)
                    VALUES (?, ?, ?, ?, ?, ?, 0, NULL)""",
-                (key, prompt_hash, model, str(response_path), now.isoformat(), expires_at.isoformat())
+                rows,
             )
             conn.commit()
 
             # Enforce size limit
             self._enforce_size_limit_unlocked(conn)
 
-        return key
+        return len(rows)
 
     def invalidate(self, prompt: str, context: dict[str, Any] | None = None) -> bool:
         """
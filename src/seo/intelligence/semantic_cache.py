@@ -0,0 +1,98 @@
+"""
+Embedding-similarity cache for AI responses.
+
+Complements the byte-exact AICache: pages whose content is nearly
+identical (paginated listings, templated product pages) map to nearby
+embeddings, so a previous response can be reused instead of paying for
+another LLM call. Entries are kept in memory for the lifetime of the
+cache object.
+"""
+
+from collections import OrderedDict
+from typing import Any
+import math
+import threading
+
+
+class SemanticCache:
+    """
+    In-memory nearest-neighbour cache keyed by embedding vectors.
+
+    Vectors are normalized on insert, so a lookup is a dot product per
+    entry (cosine similarity). The oldest entry is evicted once
+    max_entries is reached.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 1000):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum number of stored embeddings
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[list[float], dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> list[float] | None:
+        """Scale a vector to unit length (None for a zero vector)."""
+        norm = math.sqrt(math.fsum(x * x for x in embedding))
+        if not norm:
+            return None
+        return [x / norm for x in embedding]
+
+    def query(self, embedding: list[float]) -> tuple[str, dict[str, Any], float] | None:
+        """
+        Find the most similar cached response above the threshold.
+
+        Args:
+            embedding: Embedding of the new input
+
+        Returns:
+            (key, response, similarity) of the best match, or None
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+
+        best = None
+        best_score = self.threshold
+        with self._lock:
+            for key, (cached_vector, response) in self._entries.items():
+                score = sum(map(float.__mul__, vector, cached_vector))
+                if score >= best_score:
+                    best, best_score = (key, response), score
+
+        if best is None:
+            return None
+        return best[0], best[1], best_score
+
+    def add(self, key: str, embedding: list[float], response: dict[str, Any]) -> None:
+        """
+        Store a response under its input embedding.
+
+        Args:
+            key: Identifier for the entry (e.g. the page URL)
+            embedding: Embedding of the input that produced the response
+            response: The AI response to reuse for similar inputs
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (vector, response)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
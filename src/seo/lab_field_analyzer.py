@@ -1,7 +1,9 @@
 """Lab vs Field performance analyzer comparing Lighthouse and CrUX data."""
 
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from seo.models import (
     PageMetadata,
@@ -15,6 +17,96 @@ from seo.models import (
 from seo.config import AnalysisThresholds, default_thresholds
 
 
+# Insight messages; templated fields are filled in by _generate_insights
+_INSIGHT_NO_DATA = (
+    "No pages have both Lighthouse and CrUX data. "
+    "Run Lighthouse and ensure sufficient traffic for CrUX data."
+)
+_INSIGHT_OPTIMISTIC = (
+    "Lab tests show better performance than real users experience. "
+    "Real-world factors like network variability and device diversity "
+    "may be impacting actual performance."
+)
+_INSIGHT_PESSIMISTIC = (
+    "Real users experience better performance than lab tests predict. "
+    "This could indicate effective caching or CDN performance in production."
+)
+_INSIGHT_STATUS_MISMATCHES = (
+    "{mismatch_count} pages show different status "
+    "between lab and field. Investigate these pages for optimization opportunities."
+)
+_INSIGHT_LCP_MISMATCH = (
+    "LCP status differs: Lab shows '{lcp.lab_status}' "
+    "but field shows '{lcp.field_status}'."
+)
+_INSIGHT_INTERACTIVITY_MISMATCH = (
+    "Interactivity status differs: TBT (lab) is '{interactivity.lab_status}' "
+    "but FID (field) is '{interactivity.field_status}'. "
+    "This may indicate JavaScript execution issues not captured in lab conditions."
+)
+_INSIGHT_TBT_VS_FID = (
+    "TBT (lab) measures main thread blocking; FID (field) measures actual input delay"
+)
+
+
+@dataclass
+class _MetricColumns:
+    """Per-page LCP columns plus running totals for the averaged metrics.
+
+    Only LCP needs per-page values (for mismatch and gap detection); the
+    other metrics are reduced to sums and counts as pages are scanned.
+    """
+
+    lcp_urls: List[str] = field(default_factory=list)
+    lcp_lab: List[float] = field(default_factory=list)
+    lcp_field: List[float] = field(default_factory=list)
+    lcp_categories: List[Optional[str]] = field(default_factory=list)
+    lcp_lab_total: float = 0.0
+    lcp_field_total: float = 0.0
+    cls_count: int = 0
+    cls_lab_total: float = 0.0
+    cls_field_total: float = 0.0
+    tbt_count: int = 0
+    tbt_total: float = 0.0
+    fid_count: int = 0
+    fid_total: float = 0.0
+
+
+def _mean(total: float, count: int) -> Optional[float]:
+    """Average of a running total, or None when nothing was counted."""
+    return total / count if count else None
+
+
+# Status for values at or below the good bound, at or below the poor bound, above it
+_STATUS_LABELS = ("good", "needs-improvement", "poor")
+
+
+# Middle gap bucket: lab and field within the significant-gap threshold
+_GAP_MATCH = 1
+
+# CrUX speed categories mapped to the standard status labels
+_CRUX_CATEGORY_STATUS = {
+    'FAST': 'good',
+    'AVERAGE': 'needs-improvement',
+    'SLOW': 'poor',
+}
+
+
+def _classify(value: float, bounds: Tuple[float, float]) -> str:
+    """Classify a metric value against its (good, poor) threshold bounds."""
+    return _STATUS_LABELS[bisect_left(bounds, value)]
+
+
+def _round_ms(value: float) -> float:
+    """Round a non-negative millisecond value to a whole number, half up."""
+    return float(int(value + 0.5))
+
+
+def _round_cls(value: float) -> float:
+    """Round a CLS score to three decimal places."""
+    return round(value, 3)
+
+
 class LabFieldAnalyzer:
     """Compares Lighthouse (lab) metrics with CrUX (field) data.
 
@@ -24,6 +116,17 @@ class LabFieldAnalyzer:
     - TBT vs FID: Total Blocking Time (lab) vs First Input Delay (field)
     """
 
+    __slots__ = (
+        "thresholds",
+        "_evidence_collection",
+        "_pending_records",
+        "_lcp_bounds",
+        "_cls_bounds",
+        "_tbt_bounds",
+        "_fid_bounds",
+        "_significant_gap",
+    )
+
     # Source labels for evidence provenance
     LAB_SOURCE = "Lighthouse"
     LAB_SOURCE_FULL = "google_pagespeed_insights"
@@ -34,6 +137,14 @@ class LabFieldAnalyzer:
     CRUX_COLLECTION_PERIOD = "28-day rolling window"
     CRUX_DATA_FRESHNESS_NOTE = "Real user data aggregated over last 28 days"
 
+    # Constant evidence strings, built once rather than per record
+    _COMPONENT_ID = "lab_field_analyzer"
+    _FINDING = "lab_field_comparison"
+    _SOURCE_LABEL = f"{LAB_SOURCE} vs {FIELD_SOURCE}"
+    _REASON_TEMPLATE_MISMATCH = (
+        f"Lab ({LAB_SOURCE}) and field ({FIELD_SOURCE}) data show different status for {{metric}}"
+    )
+
     def __init__(self, thresholds: Optional[AnalysisThresholds] = None):
         """Initialize analyzer with configurable thresholds.
 
@@ -42,51 +153,60 @@ class LabFieldAnalyzer:
         """
         self.thresholds = thresholds or default_thresholds
         self._evidence_collection: Optional[EvidenceCollection] = None
+        self._pending_records: List[EvidenceRecord] = []
+
+        # Snapshot thresholds as sorted (good, poor) bounds for _classify
+        t = self.thresholds
+        self._lcp_bounds = (t.lcp_good, t.lcp_poor)
+        self._cls_bounds = (t.cls_good, t.cls_poor)
+        self._tbt_bounds = (t.tbt_good, t.tbt_poor)
+        self._fid_bounds = (t.fid_good, t.fid_poor)
+        self._significant_gap = t.lab_field_significant_gap
 
     @property
     def lcp_good(self) -> float:
         """LCP threshold for 'good' status (ms)."""
-        return self.thresholds.lcp_good
+        return self._lcp_bounds[0]
 
     @property
     def lcp_poor(self) -> float:
         """LCP threshold for 'poor' status (ms)."""
-        return self.thresholds.lcp_poor
+        return self._lcp_bounds[1]
 
     @property
     def cls_good(self) -> float:
         """CLS threshold for 'good' status."""
-        return self.thresholds.cls_good
+        return self._cls_bounds[0]
 
     @property
     def cls_poor(self) -> float:
         """CLS threshold for 'poor' status."""
-        return self.thresholds.cls_poor
+        return self._cls_bounds[1]
 
     @property
     def tbt_good(self) -> int:
         """TBT threshold for 'good' status (ms)."""
-        return self.thresholds.tbt_good
+        return self._tbt_bounds[0]
 
     @property
     def tbt_poor(self) -> int:
         """TBT threshold for 'poor' status (ms)."""
-        return self.thresholds.tbt_poor
+        return self._tbt_bounds[1]
 
     @property
     def fid_good(self) -> int:
         """FID threshold for 'good' status (ms)."""
-        return self.thresholds.fid_good
+        return self._fid_bounds[0]
 
     @property
     def fid_poor(self) -> int:
         """FID threshold for 'poor' status (ms)."""
-        return self.thresholds.fid_poor
+        return self._fid_bounds[1]
 
     @property
     def significant_gap(self) -> float:
         """Percentage difference considered significant."""
-        return self.thresholds.lab_field_significant_gap
+        return self._significant_gap
 
     def analyze(self, pages: Dict[str, PageMetadata]) -> Tuple[LabFieldComparison, Dict]:
         """Compare lab and field performance metrics.
@@ -98,161 +218,105 @@ class LabFieldAnalyzer:
             Tuple of (LabFieldComparison, evidence_dict)
         """
         self._evidence_collection = EvidenceCollection(
-            finding='lab_field_comparison',
-            component_id='lab_field_analyzer',
+            finding=self._FINDING,
+            component_id=self._COMPONENT_ID,
         )
+        self._pending_records = []
 
         if not pages:
             return LabFieldComparison(), self._evidence_collection.to_dict()
 
         comparison = LabFieldComparison(total_pages=len(pages))
 
-        # Collect metrics from pages with both lab and field data
-        lcp_lab_values: List[float] = []
-        lcp_field_values: List[float] = []
-        cls_lab_values: List[float] = []
-        cls_field_values: List[float] = []
-        tbt_values: List[float] = []
-        fid_values: List[float] = []
-
-        lab_better_count = 0
-        field_better_count = 0
-        match_count = 0
-
-        for url, page in pages.items():
-            has_lab_lcp = page.lighthouse_lcp is not None
-            has_field_lcp = page.crux_lcp_percentile is not None
-
-            if has_lab_lcp and has_field_lcp:
-                comparison.pages_with_both += 1
-
-                # LCP comparison
-                lab_lcp = page.lighthouse_lcp  # ms
-                field_lcp = page.crux_lcp_percentile  # ms
-
-                lcp_lab_values.append(lab_lcp)
-                lcp_field_values.append(field_lcp)
-
-                lab_status = self._get_lcp_status(lab_lcp)
-                field_status = self._normalize_crux_category(
-                    page.crux_lcp_category
-                ) or self._get_lcp_status(field_lcp)
-
-                if lab_status != field_status:
-                    comparison.status_mismatches.append({
+        columns = self._collect_columns(pages)
+        comparison.pages_with_both = len(columns.lcp_urls)
+
+        # Pages per gap bucket: lab better, match, field better
+        gap_counts = [0, 0, 0]
+        lcp_bounds = self._lcp_bounds
+        significant_gap = self._significant_gap
+        normalize_category = self._normalize_crux_category
+        # Bound methods skip an attribute lookup per hit; the lists are
+        # filled in place, so nothing has to be written back afterwards
+        append_mismatch = comparison.status_mismatches.append
+        append_gap = comparison.pages_with_gaps.append
+        add_mismatch_evidence = self._add_mismatch_evidence
+        add_gap_evidence = self._add_gap_evidence
+
+        # Classify LCP column-wise; records are only built for hits
+        for url, lab_lcp, field_lcp, category in zip(
+            columns.lcp_urls,
+            columns.lcp_lab,
+            columns.lcp_field,
+            columns.lcp_categories,
+        ):
+            lab_status = _STATUS_LABELS[bisect_left(lcp_bounds, lab_lcp)]
+            field_status = normalize_category(category) or _STATUS_LABELS[
+                bisect_left(lcp_bounds, field_lcp)
+            ]
+
+            if lab_status != field_status:
+                # The mismatch entry doubles as the evidence arguments
+                mismatch = {
+                    'url': url,
+                    'metric': 'LCP',
+                    'lab_value': lab_lcp,
+                    'lab_status': lab_status,
+                    'field_value': field_lcp,
+                    'field_status': field_status
+                }
+                append_mismatch(mismatch)
+                add_mismatch_evidence(**mismatch)
+
+            # Calculate gap
+            if field_lcp > 0:
+                gap = ((lab_lcp - field_lcp) / field_lcp) * 100
+                # 0 below -threshold, 1 within it, 2 above it
+                bucket = (gap > significant_gap) - (gap < -significant_gap) + 1
+                gap_counts[bucket] += 1
+
+                if bucket != _GAP_MATCH:
+                    page_gap = {
                         'url': url,
                         'metric': 'LCP',
                         'lab_value': lab_lcp,
-                        'lab_status': lab_status,
                         'field_value': field_lcp,
-                        'field_status': field_status
-                    })
-                    # Add evidence for status mismatch
-                    self._add_mismatch_evidence(
-                        url=url,
-                        metric='LCP',
-                        lab_value=lab_lcp,
-                        lab_status=lab_status,
-                        field_value=field_lcp,
-                        field_status=field_status,
-                    )
-
-                # Calculate gap
-                if field_lcp > 0:
-                    gap = ((lab_lcp - field_lcp) / field_lcp) * 100
-                    if abs(gap) > self.significant_gap:
-                        comparison.pages_with_gaps.append({
-                            'url': url,
-                            'metric': 'LCP',
-                            'lab_value': lab_lcp,
-                            'field_value': field_lcp,
-                            'gap_percentage': round(gap, 1)
-                        })
-                        # Add evidence for significant gap
-                        self._add_gap_evidence(
-                            url=url,
-                            metric='LCP',
-                            lab_value=lab_lcp,
-                            field_value=field_lcp,
-                            gap_percentage=round(gap, 1),
-                        )
-
-                    if gap < -self.significant_gap:
-                        lab_better_count += 1
-                    elif gap > self.significant_gap:
-                        field_better_count += 1
-                    else:
-                        match_count += 1
-
-            # CLS comparison
-            if page.lighthouse_cls is not None and page.crux_cls_percentile is not None:
-                cls_lab_values.append(page.lighthouse_cls)
-                cls_field_values.append(page.crux_cls_percentile)
-
-            # TBT (lab) vs FID (field) - interactivity comparison
-            if page.lighthouse_tbt is not None:
-                tbt_values.append(page.lighthouse_tbt)
-            if page.crux_fid_percentile is not None:
-                fid_values.append(page.crux_fid_percentile)
+                        'gap_percentage': round(gap, 1)
+                    }
+                    append_gap(page_gap)
+                    add_gap_evidence(**page_gap)
 
+        lab_better_count, match_count, field_better_count = gap_counts
         comparison.overall_lab_better = lab_better_count
         comparison.overall_field_better = field_better_count
         comparison.overall_match = match_count
 
-        # Calculate aggregate LCP comparison
-        if lcp_lab_values and lcp_field_values:
-            avg_lab_lcp = sum(lcp_lab_values) / len(lcp_lab_values)
-            avg_field_lcp = sum(lcp_field_values) / len(lcp_field_values)
-
-            comparison.lcp_comparison = MetricComparison(
-                metric_name="Largest Contentful Paint",
-                lab_value=round(avg_lab_lcp, 0),
-                field_value=round(avg_field_lcp, 0),
-                lab_status=self._get_lcp_status(avg_lab_lcp),
-                field_status=self._get_lcp_status(avg_field_lcp),
-                difference_percentage=round(
-                    ((avg_lab_lcp - avg_field_lcp) / avg_field_lcp * 100)
-                    if avg_field_lcp > 0 else 0, 1
-                ),
-                status_match=self._get_lcp_status(avg_lab_lcp) == self._get_lcp_status(avg_field_lcp)
-            )
-
-        # Calculate aggregate CLS comparison
-        if cls_lab_values and cls_field_values:
-            avg_lab_cls = sum(cls_lab_values) / len(cls_lab_values)
-            avg_field_cls = sum(cls_field_values) / len(cls_field_values)
-
-            comparison.cls_comparison = MetricComparison(
-                metric_name="Cumulative Layout Shift",
-                lab_value=round(avg_lab_cls, 3),
-                field_value=round(avg_field_cls, 3),
-                lab_status=self._get_cls_status(avg_lab_cls),
-                field_status=self._get_cls_status(avg_field_cls),
-                difference_percentage=round(
-                    ((avg_lab_cls - avg_field_cls) / avg_field_cls * 100)
-                    if avg_field_cls > 0 else 0, 1
-                ),
-                status_match=self._get_cls_status(avg_lab_cls) == self._get_cls_status(avg_field_cls)
-            )
-
-        # Calculate TBT vs FID comparison (interactivity)
-        if tbt_values and fid_values:
-            avg_tbt = sum(tbt_values) / len(tbt_values)
-            avg_fid = sum(fid_values) / len(fid_values)
-
-            comparison.fid_inp_comparison = MetricComparison(
-                metric_name="Interactivity (TBT vs FID)",
-                lab_value=round(avg_tbt, 0),
-                field_value=round(avg_fid, 0),
-                lab_status=self._get_tbt_status(avg_tbt),
-                field_status=self._get_fid_status(avg_fid),
-                difference_percentage=round(
-                    ((avg_tbt - avg_fid) / avg_fid * 100)
-                    if avg_fid > 0 else 0, 1
-                ),
-                status_match=self._get_tbt_status(avg_tbt) == self._get_fid_status(avg_fid),
-                insight="TBT (lab) measures main thread blocking; FID (field) measures actual input delay"
-            )
+        # Aggregate per-metric comparisons
+        comparison.lcp_comparison = self._build_metric_comparison(
+            "Largest Contentful Paint",
+            _mean(columns.lcp_lab_total, comparison.pages_with_both),
+            _mean(columns.lcp_field_total, comparison.pages_with_both),
+            self._get_lcp_status,
+            self._get_lcp_status,
+            _round_ms,
+        )
+        comparison.cls_comparison = self._build_metric_comparison(
+            "Cumulative Layout Shift",
+            _mean(columns.cls_lab_total, columns.cls_count),
+            _mean(columns.cls_field_total, columns.cls_count),
+            self._get_cls_status,
+            self._get_cls_status,
+            _round_cls,
+        )
+        comparison.fid_inp_comparison = self._build_metric_comparison(
+            "Interactivity (TBT vs FID)",
+            _mean(columns.tbt_total, columns.tbt_count),
+            _mean(columns.fid_total, columns.fid_count),
+            self._get_tbt_status,
+            self._get_fid_status,
+            _round_ms,
+            insight=_INSIGHT_TBT_VS_FID,
+        )
 
         # Determine lab tendency
         if lab_better_count > field_better_count * 1.5:
@@ -268,96 +332,148 @@ class LabFieldAnalyzer:
         # Add aggregate evidence for the comparison
         self._add_aggregate_evidence(comparison)
 
+        # Flush buffered evidence in one batch
+        self._evidence_collection.add_records(self._pending_records)
+
         return comparison, self._evidence_collection.to_dict()
 
+    @staticmethod
+    def _collect_columns(pages: Dict[str, PageMetadata]) -> _MetricColumns:
+        """Extract lab and field metrics in a single pass over the pages.
+
+        LCP columns only hold pages that have both lab and field values;
+        CLS, TBT and FID are accumulated into totals independently.
+
+        Args:
+            pages: Dictionary mapping URLs to PageMetadata
+
+        Returns:
+            _MetricColumns with LCP columns and per-metric totals
+        """
+        columns = _MetricColumns()
+
+        for url, page in pages.items():
+            lab_lcp = page.lighthouse_lcp  # ms
+            field_lcp = page.crux_lcp_percentile  # ms
+            if lab_lcp is not None and field_lcp is not None:
+                columns.lcp_urls.append(url)
+                columns.lcp_lab.append(lab_lcp)
+                columns.lcp_field.append(field_lcp)
+                columns.lcp_categories.append(page.crux_lcp_category)
+                columns.lcp_lab_total += lab_lcp
+                columns.lcp_field_total += field_lcp
+
+            # CLS comparison
+            lab_cls = page.lighthouse_cls
+            field_cls = page.crux_cls_percentile
+            if lab_cls is not None and field_cls is not None:
+                columns.cls_count += 1
+                columns.cls_lab_total += lab_cls
+                columns.cls_field_total += field_cls
+
+            # TBT (lab) vs FID (field) - interactivity comparison
+            tbt = page.lighthouse_tbt
+            if tbt is not None:
+                columns.tbt_count += 1
+                columns.tbt_total += tbt
+            fid = page.crux_fid_percentile
+            if fid is not None:
+                columns.fid_count += 1
+                columns.fid_total += fid
+
+        return columns
+
+    @staticmethod
+    def _build_metric_comparison(
+        metric_name: str,
+        avg_lab: Optional[float],
+        avg_field: Optional[float],
+        lab_status_fn: Callable[[float], str],
+        field_status_fn: Callable[[float], str],
+        round_value: Callable[[float], float],
+        insight: str = "",
+    ) -> Optional[MetricComparison]:
+        """Build an aggregate comparison from averaged lab and field values.
+
+        Args:
+            metric_name: Display name of the metric
+            avg_lab: Average lab measurement, None if there was none
+            avg_field: Average field measurement, None if there was none
+            lab_status_fn: Classifies a lab value as good/needs-improvement/poor
+            field_status_fn: Classifies a field value
+            round_value: Rounds the averaged values for display
+            insight: Optional note attached to the comparison
+
+        Returns:
+            MetricComparison, or None if either side has no values
+        """
+        if avg_lab is None or avg_field is None:
+            return None
+
+        lab_status = lab_status_fn(avg_lab)
+        field_status = field_status_fn(avg_field)
+        difference = ((avg_lab - avg_field) / avg_field * 100) if avg_field > 0 else 0
+
+        return MetricComparison(
+            metric_name=metric_name,
+            lab_value=round_value(avg_lab),
+            field_value=round_value(avg_field),
+            lab_status=lab_status,
+            field_status=field_status,
+            difference_percentage=round(difference, 1),
+            status_match=lab_status == field_status,
+            insight=insight,
+        )
+
     def _get_lcp_status(self, value: float) -> str:
         """Determine LCP status."""
-        if value <= self.lcp_good:
-            return "good"
-        elif value <= self.lcp_poor:
-            return "needs-improvement"
-        return "poor"
+        return _classify(value, self._lcp_bounds)
 
     def _get_cls_status(self, value: float) -> str:
         """Determine CLS status."""
-        if value <= self.cls_good:
-            return "good"
-        elif value <= self.cls_poor:
-            return "needs-improvement"
-        return "poor"
+        return _classify(value, self._cls_bounds)
 
     def _get_tbt_status(self, value: float) -> str:
         """Determine TBT status."""
-        if value <= self.tbt_good:
-            return "good"
-        elif value <= self.tbt_poor:
-            return "needs-improvement"
-        return "poor"
+        return _classify(value, self._tbt_bounds)
 
     def _get_fid_status(self, value: float) -> str:
         """Determine FID status."""
-        if value <= self.fid_good:
-            return "good"
-        elif value <= self.fid_poor:
-            return "needs-improvement"
-        return "poor"
+        return _classify(value, self._fid_bounds)
 
     def _normalize_crux_category(self, category: Optional[str]) -> Optional[str]:
         """Normalize CrUX category to standard status."""
         if not category:
             return None
-        category = category.upper()
-        if category == 'FAST':
-            return 'good'
-        elif category == 'AVERAGE':
-            return 'needs-improvement'
-        elif category == 'SLOW':
-            return 'poor'
-        return None
+        return _CRUX_CATEGORY_STATUS.get(category.upper())
 
     def _generate_insights(self, comparison: LabFieldComparison) -> List[str]:
         """Generate insights from lab/field comparison."""
-        insights = []
-
         if comparison.pages_with_both == 0:
-            insights.append(
-                "No pages have both Lighthouse and CrUX data. "
-                "Run Lighthouse and ensure sufficient traffic for CrUX data."
-            )
-            return insights
-
-        if comparison.lab_tendency == "optimistic":
-            insights.append(
-                "Lab tests show better performance than real users experience. "
-                "Real-world factors like network variability and device diversity "
-                "may be impacting actual performance."
-            )
-        elif comparison.lab_tendency == "pessimistic":
-            insights.append(
-                "Real users experience better performance than lab tests predict. "
-                "This could indicate effective caching or CDN performance in production."
-            )
-
-        if len(comparison.status_mismatches) > 0:
-            insights.append(
-                f"{len(comparison.status_mismatches)} pages show different status "
-                "between lab and field. Investigate these pages for optimization opportunities."
-            )
-
-        if comparison.lcp_comparison and not comparison.lcp_comparison.status_match:
-            insights.append(
-                f"LCP status differs: Lab shows '{comparison.lcp_comparison.lab_status}' "
-                f"but field shows '{comparison.lcp_comparison.field_status}'."
-            )
-
-        if comparison.fid_inp_comparison and not comparison.fid_inp_comparison.status_match:
-            insights.append(
-                f"Interactivity status differs: TBT (lab) is '{comparison.fid_inp_comparison.lab_status}' "
-                f"but FID (field) is '{comparison.fid_inp_comparison.field_status}'. "
-                "This may indicate JavaScript execution issues not captured in lab conditions."
+            return [_INSIGHT_NO_DATA]
+
+        mismatch_count = len(comparison.status_mismatches)
+        lcp = comparison.lcp_comparison
+        interactivity = comparison.fid_inp_comparison
+
+        candidates = (
+            (comparison.lab_tendency == "optimistic", _INSIGHT_OPTIMISTIC),
+            (comparison.lab_tendency == "pessimistic", _INSIGHT_PESSIMISTIC),
+            (mismatch_count > 0, _INSIGHT_STATUS_MISMATCHES),
+            (lcp is not None and not lcp.status_match, _INSIGHT_LCP_MISMATCH),
+            (
+                interactivity is not None and not interactivity.status_match,
+                _INSIGHT_INTERACTIVITY_MISMATCH,
+            ),
+        )
+        # Templates are only formatted for the insights that apply
+        return [
+            message.format(
+                mismatch_count=mismatch_count, lcp=lcp, interactivity=interactivity
             )
-
-        return insights
+            for applies, message in candidates
+            if applies
+        ]
 
     def _add_mismatch_evidence(
         self,
@@ -379,12 +495,12 @@ class LabFieldAnalyzer:
             field_status: Field status (good/needs-improvement/poor)
         """
         record = EvidenceRecord(
-            component_id='lab_field_analyzer',
+            component_id=self._COMPONENT_ID,
             finding=f'{metric.lower()}_status_mismatch',
             evidence_string=f'{metric} status mismatch: {self.LAB_SOURCE} shows {lab_status}, {self.FIELD_SOURCE} shows {field_status}',
             confidence=ConfidenceLevel.HIGH,  # Direct measurement comparison
             timestamp=datetime.now(),
-            source=f'{self.LAB_SOURCE} vs {self.FIELD_SOURCE}',
+            source=self._SOURCE_LABEL,
             source_type=EvidenceSourceType.MEASUREMENT,
             source_location=url,
             measured_value={
@@ -403,9 +519,9 @@ class LabFieldAnalyzer:
                 },
             },
             ai_generated=False,
-            reasoning=f'Lab ({self.LAB_SOURCE}) and field ({self.FIELD_SOURCE}) data show different status for {metric}',
+            reasoning=self._REASON_TEMPLATE_MISMATCH.format(metric=metric),
         )
-        self._evidence_collection.add_record(record)
+        self._pending_records.append(record)
 
     def _add_gap_evidence(
         self,
@@ -426,12 +542,12 @@ class LabFieldAnalyzer:
         """
         direction = "faster" if gap_percentage < 0 else "slower"
         record = EvidenceRecord(
-            component_id='lab_field_analyzer',
+            component_id=self._COMPONENT_ID,
             finding=f'{metric.lower()}_significant_gap',
             evidence_string=f'{metric} gap: {self.LAB_SOURCE} is {abs(gap_percentage):.1f}% {direction} than {self.FIELD_SOURCE}',
             confidence=ConfidenceLevel.HIGH,
             timestamp=datetime.now(),
-            source=f'{self.LAB_SOURCE} vs {self.FIELD_SOURCE}',
+            source=self._SOURCE_LABEL,
             source_type=EvidenceSourceType.CALCULATION,
             source_location=url,
             measured_value={
@@ -448,10 +564,10 @@ class LabFieldAnalyzer:
                     'data_freshness': self.CRUX_DATA_FRESHNESS_NOTE,
                 },
                 'gap_percentage': gap_percentage,
-                'threshold': self.significant_gap,
+                'threshold': self._significant_gap,
             },
             ai_generated=False,
-            reasoning=f'Gap exceeds threshold of {self.significant_gap}%',
+            reasoning=f'Gap exceeds threshold of {self._significant_gap}%',
             input_summary={
                 'formula': '((lab_value - field_value) / field_value) * 100',
                 'lab_source': self.LAB_SOURCE,
@@ -460,7 +576,7 @@ class LabFieldAnalyzer:
                 'field_api': self.FIELD_SOURCE_FULL,
             },
         )
-        self._evidence_collection.add_record(record)
+        self._pending_records.append(record)
 
     def _add_aggregate_evidence(self, comparison: LabFieldComparison) -> None:
         """Add aggregate evidence for the overall lab/field comparison.
@@ -469,12 +585,12 @@ class LabFieldAnalyzer:
             comparison: The completed LabFieldComparison
         """
         record = EvidenceRecord(
-            component_id='lab_field_analyzer',
+            component_id=self._COMPONENT_ID,
             finding='lab_field_summary',
             evidence_string=f'Lab tendency: {comparison.lab_tendency}; {len(comparison.status_mismatches)} mismatches, {len(comparison.pages_with_gaps)} gaps',
             confidence=ConfidenceLevel.HIGH,
             timestamp=datetime.now(),
-            source=f'{self.LAB_SOURCE} vs {self.FIELD_SOURCE}',
+            source=self._SOURCE_LABEL,
             source_type=EvidenceSourceType.CALCULATION,
             source_location='aggregate',
             measured_value={
@@ -496,7 +612,7 @@ class LabFieldAnalyzer:
                 'field_api': self.FIELD_SOURCE_FULL,
                 'field_collection_period': self.CRUX_COLLECTION_PERIOD,
                 'field_data_note': self.CRUX_DATA_FRESHNESS_NOTE,
-                'gap_threshold': f'{self.significant_gap}%',
+                'gap_threshold': f'{self._significant_gap}%',
             },
         )
-        self._evidence_collection.add_record(record)
+        self._pending_records.append(record)
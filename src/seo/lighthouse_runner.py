@@ -5,16 +5,84 @@ Runs Google Lighthouse via CLI to collect real performance metrics,
 Core Web Vitals, and optimization opportunities.
 """
 
+import asyncio
+import hashlib
 import json
+import os
+import shutil
 import subprocess
 import tempfile
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Lighthouse reports are several MB; orjson parses them much faster
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Key performance opportunities to extract, in report order
+OPPORTUNITY_AUDITS = (
+    "unused-css-rules",
+    "unused-javascript",
+    "modern-image-formats",
+    "offscreen-images",
+    "render-blocking-resources",
+    "unminified-css",
+    "unminified-javascript",
+    "efficient-animated-content",
+    "duplicated-javascript",
+    "legacy-javascript",
+    "total-byte-weight",
+    "uses-optimized-images",
+    "uses-text-compression",
+    "uses-responsive-images",
+)
+
+# Unscored audits whose output is never read here; full-page-screenshot and
+# script-treemap-data alone are often most of the report's bytes
+DEFAULT_SKIP_AUDITS = (
+    "full-page-screenshot",
+    "final-screenshot",
+    "script-treemap-data",
+)
+
+# Parallel audits for run_many(); each Lighthouse run drives a full Chrome
+DEFAULT_CONCURRENCY = max(1, min((os.cpu_count() or 2) // 2, 4))
+
+
+def _find_chrome() -> Optional[str]:
+    """Locate a Chrome/Chromium executable, honouring CHROME_PATH."""
+    env_path = os.environ.get("CHROME_PATH")
+    if env_path:
+        return env_path
+    for name in (
+        "google-chrome",
+        "google-chrome-stable",
+        "chromium",
+        "chromium-browser",
+        "chrome",
+    ):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
 
 class LighthouseRunner:
     """Runs Lighthouse audits and parses results."""
@@ -24,6 +92,9 @@ class LighthouseRunner:
         chrome_flags: Optional[list[str]] = None,
         timeout: int = 60,
         only_categories: Optional[list[str]] = None,
+        cache_dir: Optional[Path] = None,
+        cache_ttl_s: int = 3600,
+        skip_audits: Optional[list[str]] = None,
     ):
         """
         Initialize the Lighthouse runner.
@@ -32,6 +103,10 @@ class LighthouseRunner:
             chrome_flags: Additional Chrome flags (e.g., ['--headless'])
             timeout: Timeout for Lighthouse execution in seconds
             only_categories: Specific categories to run (performance, accessibility, best-practices, seo, pwa)
+            cache_dir: Directory for cached results; caching is off when None
+            cache_ttl_s: Age in seconds after which a cached result is ignored
+            skip_audits: Audit ids Lighthouse should not run (defaults to
+                DEFAULT_SKIP_AUDITS; pass [] to run everything)
         """
         self.chrome_flags = chrome_flags or ["--headless", "--no-sandbox"]
         self.timeout = timeout
@@ -41,6 +116,100 @@ class LighthouseRunner:
             "best-practices",
             "seo",
         ]
+        self.skip_audits = (
+            list(DEFAULT_SKIP_AUDITS) if skip_audits is None else skip_audits
+        )
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl_s = cache_ttl_s
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Shared Chrome instance, set by start_chrome()
+        self._chrome_proc: Optional[subprocess.Popen] = None
+        self._chrome_profile_dir: Optional[str] = None
+        self._port: Optional[int] = None
+
+        # Lighthouse CLI version, read on first use (see _get_lighthouse_version)
+        self._lighthouse_version: Optional[str] = None
+
+    def __enter__(self) -> "LighthouseRunner":
+        self.start_chrome()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def start_chrome(
+        self, chrome_path: Optional[str] = None, startup_timeout: float = 30.0
+    ) -> int:
+        """
+        Launch one Chrome instance for subsequent audits to connect to.
+
+        Lighthouse then attaches with --port instead of starting a new
+        browser per URL. Storage is still reset by Lighthouse between runs.
+        Audits against a shared browser must not overlap, so run_many()
+        runs them one at a time while Chrome is started.
+
+        Args:
+            chrome_path: Chrome executable (defaults to CHROME_PATH or PATH lookup)
+            startup_timeout: Seconds to wait for the DevTools port
+
+        Returns:
+            The remote debugging port Chrome is listening on
+        """
+        if self._chrome_proc is not None:
+            return self._port
+
+        chrome = chrome_path or _find_chrome()
+        if not chrome:
+            raise RuntimeError(
+                "Chrome executable not found. Set CHROME_PATH or pass chrome_path."
+            )
+
+        self._chrome_profile_dir = tempfile.mkdtemp(prefix="seo-lighthouse-")
+        self._chrome_proc = subprocess.Popen(
+            [
+                chrome,
+                "--remote-debugging-port=0",
+                f"--user-data-dir={self._chrome_profile_dir}",
+                *self.chrome_flags,
+                "about:blank",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        # Chrome writes the port it picked to DevToolsActivePort
+        port_file = Path(self._chrome_profile_dir) / "DevToolsActivePort"
+        deadline = time.monotonic() + startup_timeout
+        while time.monotonic() < deadline:
+            if self._chrome_proc.poll() is not None:
+                break
+            try:
+                self._port = int(port_file.read_text().split()[0])
+                logger.info("Started shared Chrome on port %d", self._port)
+                return self._port
+            except (FileNotFoundError, IndexError, ValueError):
+                time.sleep(0.1)
+
+        self.close()
+        raise RuntimeError("Chrome did not report a DevTools port")
+
+    def close(self) -> None:
+        """Stop the shared Chrome instance, if one was started."""
+        if self._chrome_proc is not None:
+            self._chrome_proc.terminate()
+            try:
+                self._chrome_proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._chrome_proc.kill()
+                self._chrome_proc.wait()
+            self._chrome_proc = None
+        if self._chrome_profile_dir:
+            shutil.rmtree(self._chrome_profile_dir, ignore_errors=True)
+            self._chrome_profile_dir = None
+        self._port = None
 
     def run_lighthouse(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -52,60 +221,218 @@ class LighthouseRunner:
         Returns:
             Dictionary containing Lighthouse results, or None if failed
         """
-        try:
-            logger.info(f"Running Lighthouse on {url}")
-
-            # Create temporary file for output
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as tmp_file:
-                output_path = tmp_file.name
-
-            # Build Lighthouse command
-            cmd = [
-                "lighthouse",
-                url,
-                "--output=json",
-                f"--output-path={output_path}",
-                "--quiet",
-                "--chrome-flags=" + " ".join(self.chrome_flags),
-            ]
+        cached = self._load_cached(url)
+        if cached is not None:
+            return cached
 
-            # Add only-categories if specified
-            if self.only_categories:
-                for category in self.only_categories:
-                    cmd.append(f"--only-categories={category}")
+        try:
+            logger.info("Running Lighthouse on %s", url)
 
-            # Run Lighthouse
+            # Run Lighthouse; the JSON report is streamed on stdout
             result = subprocess.run(
-                cmd,
+                self._build_command(url),
                 capture_output=True,
-                text=True,
                 timeout=self.timeout,
                 check=False,
             )
 
             if result.returncode != 0:
-                logger.error(f"Lighthouse failed for {url}: {result.stderr}")
+                logger.error(
+                    "Lighthouse failed for %s: %s",
+                    url,
+                    result.stderr.decode(errors="replace"),
+                )
                 return None
 
-            # Read and parse JSON output
-            with open(output_path, "r") as f:
-                lighthouse_data = json.load(f)
-
-            # Clean up temp file
-            Path(output_path).unlink(missing_ok=True)
+            lighthouse_data = _json_loads(result.stdout)
 
-            logger.info(f"Lighthouse completed successfully for {url}")
-            return self._parse_lighthouse_results(lighthouse_data)
+            logger.info("Lighthouse completed successfully for %s", url)
+            return self._store_cached(url, self._parse_lighthouse_results(lighthouse_data))
 
         except subprocess.TimeoutExpired:
-            logger.error(f"Lighthouse timeout for {url} after {self.timeout}s")
+            logger.error("Lighthouse timeout for %s after %ds", url, self.timeout)
+            return None
+        except Exception as e:
+            logger.error("Error running Lighthouse on %s: %s", url, e)
+            return None
+
+    async def run_lighthouse_async(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Run Lighthouse on a URL without blocking the event loop.
+
+        Args:
+            url: The URL to audit
+
+        Returns:
+            Dictionary containing Lighthouse results, or None if failed
+        """
+        cached = self._load_cached(url)
+        if cached is not None:
+            return cached
+
+        try:
+            logger.info("Running Lighthouse on %s", url)
+
+            proc = await asyncio.create_subprocess_exec(
+                *self._build_command(url),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                logger.error("Lighthouse timeout for %s after %ds", url, self.timeout)
+                return None
+
+            if proc.returncode != 0:
+                logger.error(
+                    "Lighthouse failed for %s: %s", url, stderr.decode(errors="replace")
+                )
+                return None
+
+            lighthouse_data = _json_loads(stdout)
+
+            logger.info("Lighthouse completed successfully for %s", url)
+            return self._store_cached(url, self._parse_lighthouse_results(lighthouse_data))
+
+        except Exception as e:
+            logger.error("Error running Lighthouse on %s: %s", url, e)
+            return None
+
+    async def run_many(
+        self,
+        urls: list[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Run Lighthouse on several URLs, with a bounded number in flight.
+
+        Each audit drives its own Chrome instance, so concurrency is kept
+        low to avoid exhausting memory.
+
+        Args:
+            urls: URLs to audit
+            concurrency: Maximum number of simultaneous Lighthouse processes
+
+        Returns:
+            Dictionary mapping each URL to its results (None if failed)
+        """
+        if self._port is not None:
+            # A shared Chrome can only host one audit at a time
+            concurrency = 1
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _guarded(url: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.run_lighthouse_async(url)
+
+        results = await asyncio.gather(*(_guarded(url) for url in urls))
+        return dict(zip(urls, results))
+
+    def _build_command(self, url: str) -> list[str]:
+        """Build the Lighthouse CLI command for a URL (report on stdout)."""
+        cmd = [
+            "lighthouse",
+            url,
+            "--output=json",
+            "--output-path=stdout",
+            "--quiet",
+        ]
+
+        if self._port is not None:
+            cmd.append(f"--port={self._port}")
+        else:
+            cmd.append("--chrome-flags=" + " ".join(self.chrome_flags))
+
+        # Add only-categories if specified
+        if self.only_categories:
+            for category in self.only_categories:
+                cmd.append(f"--only-categories={category}")
+
+        if self.skip_audits:
+            cmd.append("--skip-audits=" + ",".join(self.skip_audits))
+
+        return cmd
+
+    def _version_command(self) -> list[str]:
+        """Build the command printing the Lighthouse CLI version."""
+        return ["lighthouse", "--version"]
+
+    def _get_lighthouse_version(self) -> str:
+        """Return the Lighthouse CLI version, running the CLI only once.
+
+        Returns:
+            Version string, or "unknown" if the CLI cannot report it
+        """
+        if self._lighthouse_version is None:
+            try:
+                result = subprocess.run(
+                    self._version_command(),
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+                self._lighthouse_version = result.stdout.strip() or "unknown"
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.warning("Could not read Lighthouse version: %s", e)
+                self._lighthouse_version = "unknown"
+        return self._lighthouse_version
+
+    def _cache_path(self, url: str) -> Optional[Path]:
+        """Cache file for a URL, keyed by everything that shapes the audit.
+
+        The Lighthouse version is part of the key, so upgrading the CLI
+        does not serve reports produced by the old version.
+        """
+        if not self.cache_dir:
+            return None
+        key_source = "|".join([
+            url,
+            self._get_lighthouse_version(),
+            " ".join(sorted(self.chrome_flags)),
+            " ".join(sorted(self.only_categories)),
+            " ".join(sorted(self.skip_audits)),
+        ])
+        key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _load_cached(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return cached results for a URL if present and fresh."""
+        path = self._cache_path(url)
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime > self.cache_ttl_s:
+                return None
+            results = _json_loads(path.read_bytes())
+        except FileNotFoundError:
             return None
         except Exception as e:
-            logger.error(f"Error running Lighthouse on {url}: {e}")
+            logger.warning("Ignoring unreadable Lighthouse cache entry %s: %s", path, e)
             return None
 
+        logger.info("Using cached Lighthouse results for %s", url)
+        return results
+
+    def _store_cached(
+        self, url: str, results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Write successfully parsed results to the cache and return them."""
+        path = self._cache_path(url)
+        if path is None or not results:
+            return results
+        try:
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(_json_dumps(results))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("Could not cache Lighthouse results for %s: %s", url, e)
+        return results
+
     def _parse_lighthouse_results(
         self, lhr: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -184,7 +511,7 @@ class LighthouseRunner:
             }
 
         except Exception as e:
-            logger.error(f"Error parsing Lighthouse results: {e}")
+            logger.error("Error parsing Lighthouse results: %s", e)
             return {}
 
     def _get_score(self, category: Optional[Dict]) -> Optional[float]:
@@ -206,56 +533,42 @@ class LighthouseRunner:
 
         Returns list of opportunities with potential savings.
         """
-        opportunities = []
-
-        # Key performance opportunities to extract
-        opportunity_audits = [
-            "unused-css-rules",
-            "unused-javascript",
-            "modern-image-formats",
-            "offscreen-images",
-            "render-blocking-resources",
-            "unminified-css",
-            "unminified-javascript",
-            "efficient-animated-content",
-            "duplicated-javascript",
-            "legacy-javascript",
-            "total-byte-weight",
-            "uses-optimized-images",
-            "uses-text-compression",
-            "uses-responsive-images",
-        ]
+        candidates = (
+            self._build_opportunity(audit_id, audits.get(audit_id))
+            for audit_id in OPPORTUNITY_AUDITS
+        )
+        return [opportunity for opportunity in candidates if opportunity is not None]
+
+    @staticmethod
+    def _build_opportunity(
+        audit_id: str, audit: Optional[Dict]
+    ) -> Optional[Dict[str, Any]]:
+        """Build one opportunity entry, or None if the audit has no details."""
+        if not audit:
+            return None
+        details = audit.get("details")
+        if not details:
+            return None
 
-        for audit_id in opportunity_audits:
-            audit = audits.get(audit_id)
-            if audit and audit.get("details"):
-                # Extract savings information
-                opportunity = {
-                    "id": audit_id,
-                    "title": audit.get("title", ""),
-                    "description": audit.get("description", ""),
-                    "score": audit.get("score"),
-                }
+        # Extract savings information
+        opportunity = {
+            "id": audit_id,
+            "title": audit.get("title", ""),
+            "description": audit.get("description", ""),
+            "score": audit.get("score"),
+        }
+
+        # Add savings metrics if available
+        if "overallSavingsMs" in details:
+            opportunity["savings_ms"] = details["overallSavingsMs"]
+        if "overallSavingsBytes" in details:
+            opportunity["savings_bytes"] = details["overallSavingsBytes"]
+
+        # Count of items (e.g., number of unoptimized images)
+        if "items" in details:
+            opportunity["item_count"] = len(details["items"])
 
-                # Add savings metrics if available
-                if "overallSavingsMs" in audit.get("details", {}):
-                    opportunity["savings_ms"] = audit["details"][
-                        "overallSavingsMs"
-                    ]
-                if "overallSavingsBytes" in audit.get("details", {}):
-                    opportunity["savings_bytes"] = audit["details"][
-                        "overallSavingsBytes"
-                    ]
-
-                # Count of items (e.g., number of unoptimized images)
-                if "items" in audit.get("details", {}):
-                    opportunity["item_count"] = len(
-                        audit["details"]["items"]
-                    )
-
-                opportunities.append(opportunity)
-
-        return opportunities
+        return opportunity
 
     def _extract_diagnostics(self, lhr: Dict) -> Dict[str, Any]:
         """Extract diagnostic information from Lighthouse report."""
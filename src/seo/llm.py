@@ -1,13 +1,19 @@
 """LLM client for SEO analysis."""
 
+from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 from pathlib import Path
+import asyncio
 import hashlib
 import os
+import queue
+import re
+import threading
 import time
+import weakref
+import csv
 import logging
-import toon
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +26,284 @@ from seo.models import (
 
 # Import AICache for response caching (ported from Spectrum)
 try:
-    from seo.intelligence import AICache
+    from seo.intelligence import AICache, SemanticCache
     AICACHE_AVAILABLE = True
 except ImportError:
     AICACHE_AVAILABLE = False
     AICache = None
+    SemanticCache = None
+
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+    openai = None
+
+try:
+    import anthropic
+    ANTHROPIC_AVAILABLE = True
+except ImportError:
+    ANTHROPIC_AVAILABLE = False
+    anthropic = None
+
+# With h2 installed (httpx[http2]), concurrent async requests are multiplexed
+# over one HTTP/2 connection instead of opening a connection each
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def _async_http_client(sdk):
+    """Build the SDK's default async httpx client with HTTP/2 when available.
+
+    DefaultAsyncHttpxClient is missing from older openai/anthropic releases;
+    None then lets the SDK create its usual client (HTTP/1.1).
+
+    Args:
+        sdk: The openai or anthropic module
+    """
+    client_class = getattr(sdk, 'DefaultAsyncHttpxClient', None)
+    if client_class is None:
+        return None
+    return client_class(http2=HTTP2_AVAILABLE)
+
+
+# TOON field lines: "field_name: value" or "field_name[N]: values"
+_TOON_LINE_RE = re.compile(
+    r'^[ \t]*(\w[\w ]*(?:\[\d+\])?[ \t]*:.*?)[ \t\r]*$', re.MULTILINE
+)
+
+# Providers cache a prompt prefix only from 1024 tokens; at roughly four
+# characters per token, shorter system prompts get no cache breakpoint
+_PROMPT_CACHE_MIN_CHARS = 4 * 1024
+
+# Characters of page content shown to the LLM
+_CONTENT_PREVIEW_CHARS = 1000
+
+# Per-page part of the SEO prompt; the fixed instructions are in
+# LLMClient.SEO_SYSTEM_PROMPT
+_SEO_USER_PROMPT_TEMPLATE = """URL: {url}
+
+Metadata:
+- Title: {title} (Length: {title_length} characters)
+- Description: {description} (Length: {description_length} characters)
+- H1 Tags: {h1_tags} (Count: {h1_count})
+- Word Count: {word_count}
+
+Content Preview (first 1000 chars):
+{content_preview}
+"""
+
+# Individual score fields recorded as evidence alongside the overall score
+_SCORE_FIELDS = (
+    ('title_score', 'Title optimization score'),
+    ('description_score', 'Meta description score'),
+    ('content_score', 'Content quality score'),
+    ('technical_score', 'Technical SEO score'),
+)
+
+_LLM_SCORE_CAP_REASON = (
+    'LLM-only evaluations capped at MEDIUM per hallucination mitigation policy'
+)
+
+# Leading key of a TOON line, without any [N] suffix
+_TOON_KEY_RE = re.compile(r'[ \t]*(\w+)(?:\[\d+\])?[ \t]*:')
+
+# Leading (optionally signed, decimal) number of a score value
+_TOON_NUMBER_RE = re.compile(r'[ \t]*([-+]?\d+(?:\.\d+)?)')
+
+
+def _parse_toon_number(value: str) -> int | float:
+    """Parse a TOON score value (integer, or float if the model adds decimals).
+
+    Only the leading number is used, so "85/100" and "85%" parse as 85;
+    a value without one (e.g. "N/A") raises ValueError.
+    """
+    match = _TOON_NUMBER_RE.match(value)
+    if not match:
+        raise ValueError(f"Not a number: {value.strip()!r}")
+    number = match.group(1)
+    try:
+        return int(number)
+    except ValueError:
+        return float(number)
+
+
+def _parse_toon_list(value: str) -> list[str]:
+    """Parse the comma-separated values of a TOON array line."""
+    if not value.strip():
+        return []
+    return [item.strip() for item in next(csv.reader([value], skipinitialspace=True))]
+
+
+def _parse_toon_text(value: str) -> str:
+    """Parse a TOON string value, dropping optional surrounding quotes."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+# Fields of the SEO analysis response and how to parse each value
+_SEO_RESPONSE_PARSERS = {
+    'overall_score': _parse_toon_number,
+    'title_score': _parse_toon_number,
+    'description_score': _parse_toon_number,
+    'content_score': _parse_toon_number,
+    'technical_score': _parse_toon_number,
+    'strengths': _parse_toon_list,
+    'weaknesses': _parse_toon_list,
+    'recommendations': _parse_toon_list,
+    'reasoning': _parse_toon_text,
+}
+_SEO_RESPONSE_KEYS = frozenset(_SEO_RESPONSE_PARSERS)
+
+
+class _StreamCollector:
+    """Accumulates streamed response text and tracks expected TOON keys.
+
+    feed() reports completion once every expected key has arrived on a
+    finished line, so the caller can stop reading the stream early.
+    """
+
+    __slots__ = ('_parts', '_partial_line', '_missing')
+
+    def __init__(self, expected_keys: Optional[frozenset] = None):
+        self._parts: list[str] = []
+        self._partial_line = ''
+        self._missing = set(expected_keys) if expected_keys else None
+
+    def feed(self, text: Optional[str]) -> bool:
+        """Add a chunk; True once all expected keys have been seen."""
+        if not text:
+            return False
+        self._parts.append(text)
+        if self._missing is None:
+            return False
+
+        lines = (self._partial_line + text).split('\n')
+        self._partial_line = lines.pop()
+        for line in lines:
+            match = _TOON_KEY_RE.match(line)
+            if match:
+                self._missing.discard(match.group(1))
+        return not self._missing
+
+    @property
+    def text(self) -> str:
+        """Response text received so far."""
+        return ''.join(self._parts)
+
+
+# Errors that retrying cannot fix (bad credentials, unknown model)
+_NON_RETRYABLE_RE = re.compile(
+    r'invalid api key|authentication|unauthorized|invalid_api_key'
+    r'|model not found|invalid model',
+    re.IGNORECASE,
+)
+
+# Cache writes are handed to a background thread and committed in batches
+_CACHE_WRITE_BATCH = 32
+_CACHE_QUEUE_SIZE = 1024
+
+
+def _run_cache_writer(
+    cache_queue: queue.Queue,
+    cache: 'AICache',
+    pending: dict,
+    pending_lock: threading.Lock,
+) -> None:
+    """Drain queued cache writes in batches until a None sentinel arrives."""
+    stop = False
+    while not stop:
+        batch = [cache_queue.get()]
+        while len(batch) < _CACHE_WRITE_BATCH:
+            try:
+                batch.append(cache_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if None in batch:
+            stop = True
+            batch = [entry for entry in batch if entry is not None]
+
+        try:
+            cache.put_many(batch)
+        except Exception as e:
+            logger.warning(f"Failed to cache responses: {e}")
+
+        with pending_lock:
+            for key, response, _, _ in batch:
+                if pending.get(key) is response:
+                    del pending[key]
+
+
+def _stop_cache_writer(cache_queue: queue.Queue, writer: threading.Thread) -> None:
+    """Flush outstanding cache writes and stop the writer thread."""
+    cache_queue.put(None)
+    writer.join()
+
+
+@dataclass(slots=True)
+class _PageMetaView:
+    """Page fields used by the SEO prompt and input summary.
+
+    Holds the metadata values with their lengths and the content preview,
+    each computed once per analysis.
+    """
+
+    title: str
+    title_length: int
+    description: str
+    description_length: int
+    h1_tags: list
+    h1_count: int
+    word_count: int
+    keywords: list
+    content_preview: str = ''
+    content_length: int = 0
+
+    @classmethod
+    def from_metadata(cls, metadata: dict, content: str = '') -> '_PageMetaView':
+        """Read and measure the metadata fields and slice the content once."""
+        title = metadata.get('title') or ''
+        description = metadata.get('description') or ''
+        h1_tags = metadata.get('h1_tags') or []
+        content = content or ''
+        return cls(
+            title=title,
+            title_length=len(title),
+            description=description,
+            description_length=len(description),
+            h1_tags=h1_tags,
+            h1_count=len(h1_tags),
+            word_count=metadata.get('word_count', 0),
+            keywords=metadata.get('keywords') or [],
+            content_preview=content[:_CONTENT_PREVIEW_CHARS],
+            content_length=len(content),
+        )
+
+
+@dataclass(slots=True)
+class _SEORequest:
+    """One SEO analysis that missed the exact-match cache.
+
+    Built by LLMClient._prepare_seo_request; analyze_seo and
+    analyze_seo_async only differ in how they embed the page and call the
+    provider for it.
+    """
+
+    url: str
+    page_meta: _PageMetaView
+    prompt: str
+    prompt_hash: str
+    cache_key: str
+    # Text to embed for the semantic cache (None when it is not consulted)
+    semantic_text: Optional[str] = None
+    embedding: Optional[list[float]] = None
 
 
 class LLMClient:
@@ -36,6 +315,58 @@ class LLMClient:
     # Source label for evidence provenance
     SOURCE_LABEL = "LLM Inference"
 
+    # Embedding model for the semantic (near-duplicate) cache
+    EMBEDDING_MODEL = "text-embedding-3-small"
+
+    # Default system prompt for free-form calls
+    SYSTEM_PROMPT = "You are an expert SEO analyst."
+
+    # Fixed SEO analysis instructions, sent ahead of the per-page data so the
+    # prompt prefix is identical across pages. Providers only cache prefixes
+    # of 1024+ tokens, which these ~400 tokens of instructions do not reach
+    # (see _PROMPT_CACHE_MIN_CHARS)
+    SEO_SYSTEM_PROMPT = """You are an expert SEO analyst.
+
+Analyze the web page described in the user message for SEO quality and provide recommendations.
+
+Please provide:
+1. An overall SEO score (0-100)
+2. Individual scores for:
+   - Title optimization (consider: length 50-60 chars ideal, keyword presence)
+   - Meta description (consider: length 120-160 chars ideal, compelling copy)
+   - Content quality (consider: word count > 300, readability, structure)
+   - Technical SEO (consider: proper tags, structure, accessibility)
+3. List of strengths
+4. List of weaknesses
+5. Actionable recommendations for improvement
+6. A DETAILED reasoning explaining the overall score
+
+CRITICAL REASONING REQUIREMENTS:
+- You MUST reference EXACT measured values from the page metadata
+- For title issues: cite the actual title length (e.g., "Title is 23 characters, below the recommended 50-60")
+- For content issues: cite the actual word count (e.g., "Only 187 words, well below 300 minimum")
+- For description issues: cite the actual length (e.g., "Description at 45 chars is too short")
+- For H1 issues: cite the actual count (e.g., "Page has 0 H1 tags" or "Page has 3 H1 tags, should have exactly 1")
+- Reference thresholds when explaining deductions
+
+Format your response ONLY as TOON (Token-Oriented Object Notation) with NO additional text.
+Use this exact structure:
+overall_score: <number>
+title_score: <number>
+description_score: <number>
+content_score: <number>
+technical_score: <number>
+strengths[N]: <comma-separated values>
+weaknesses[N]: <comma-separated values>
+recommendations[N]: <comma-separated values>
+reasoning: <paragraph with SPECIFIC data references like "title at X chars", "word count of Y", "Z H1 tags">
+
+Where [N] is the count of items in each array.
+"""
+
+    # Folded into cache keys so editing the instructions invalidates old entries
+    SEO_SYSTEM_PROMPT_HASH = hashlib.sha256(SEO_SYSTEM_PROMPT.encode('utf-8')).hexdigest()[:16]
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -45,6 +376,9 @@ class LLMClient:
         cache_enabled: bool = True,
         cache_dir: Optional[Path] = None,
         cache_ttl_hours: int = 24,
+        include_content_snippet: bool = False,
+        semantic_cache_threshold: Optional[float] = None,
+        stream_responses: bool = False,
     ):
         """Initialize the LLM client.
 
@@ -56,22 +390,48 @@ class LLMClient:
             cache_enabled: Whether to cache LLM responses (default: True)
             cache_dir: Directory for cache storage (default: ~/.seo/cache)
             cache_ttl_hours: Cache TTL in hours (default: 24)
+            include_content_snippet: Keep the raw 1000-char content snippet in
+                evidence input summaries instead of only its hash (debugging)
+            semantic_cache_threshold: Cosine similarity (e.g. 0.92) above which
+                a near-duplicate page reuses an earlier analysis. Requires the
+                openai provider for embeddings (default: None, disabled)
+            stream_responses: Stream completions and stop reading once every
+                SEO response field has arrived (default: False)
         """
         self.api_key = api_key or os.getenv("LLM_API_KEY")
         self.model = model
         self.provider = provider
+        # Full source API identifier for evidence provenance (e.g. openai_gpt_4)
+        self.source_api = f"{provider}_{model}".replace("-", "_").replace(".", "_")
         self.max_tokens = max_tokens
+        self.include_content_snippet = include_content_snippet
+        self.stream_responses = stream_responses
 
         if not self.api_key:
             raise ValueError(
                 "API key must be provided or set in LLM_API_KEY environment variable"
             )
 
+        # Provider clients are created on first use and reused so the
+        # underlying HTTP connection pool stays warm across calls
+        self._openai_client = None
+        self._anthropic_client = None
+        self._async_openai_client = None
+        self._async_anthropic_client = None
+
         # Initialize cache if available and enabled
         self._cache: Optional[AICache] = None
         self._cache_hits = 0
         self._cache_misses = 0
 
+        # Successful results are persisted by a background writer; entries
+        # still in its queue are served from _pending_cache_writes
+        self._cache_queue: Optional[queue.Queue] = None
+        self._cache_writer: Optional[threading.Thread] = None
+        self._cache_writer_finalizer: Optional[weakref.finalize] = None
+        self._pending_cache_writes: dict[str, dict] = {}
+        self._pending_lock = threading.Lock()
+
         if cache_enabled and AICACHE_AVAILABLE:
             cache_path = cache_dir or Path.home() / ".seo" / "cache"
             try:
@@ -86,13 +446,21 @@ class LLMClient:
                 logger.warning(f"Failed to initialize LLM cache: {e}")
                 self._cache = None
 
-    @property
-    def source_api(self) -> str:
-        """Get full source API identifier for evidence provenance."""
-        return f"{self.provider}_{self.model}".replace("-", "_").replace(".", "_")
+        # Optional embedding-similarity cache for near-duplicate pages
+        self._semantic_cache: Optional[SemanticCache] = None
+        self._semantic_hits = 0
+
+        if semantic_cache_threshold is not None and AICACHE_AVAILABLE:
+            if provider == "openai" and OPENAI_AVAILABLE:
+                self._semantic_cache = SemanticCache(threshold=semantic_cache_threshold)
+            else:
+                logger.warning(
+                    "Semantic cache needs OpenAI embeddings; disabled for provider %s",
+                    provider,
+                )
 
     def analyze_seo(
-        self, content: str, metadata: dict, url: str
+        self, content: str, metadata: dict, url: str, use_cache: bool = True
     ) -> dict[str, any]:
         """Analyze SEO using LLM.
 
@@ -100,22 +468,227 @@ class LLMClient:
             content: Page content (HTML or text)
             metadata: Page metadata dictionary
             url: Page URL
+            use_cache: Look up earlier responses before calling the LLM
+                (False forces a fresh call; the result is still cached)
+
+        Returns:
+            Dictionary containing SEO analysis results with evidence trail
+        """
+        request = self._prepare_seo_request(content, metadata, url, use_cache)
+        if isinstance(request, dict):
+            return request
+
+        # Near-duplicate pages can reuse an earlier analysis
+        if request.semantic_text is not None:
+            semantic_response = self._lookup_semantic(
+                request, self._embed(request.semantic_text)
+            )
+            if semantic_response:
+                return semantic_response
+
+        try:
+            response = self._call_llm(
+                request.prompt,
+                system_prompt=self.SEO_SYSTEM_PROMPT,
+                stop_at_keys=_SEO_RESPONSE_KEYS,
+            )
+            return self._finish_seo_request(request, response)
+        except Exception as e:
+            return self._failed_seo_request(request, e)
+
+    async def analyze_seo_async(
+        self, content: str, metadata: dict, url: str, use_cache: bool = True
+    ) -> dict[str, any]:
+        """Analyze SEO using LLM without blocking the event loop.
+
+        Same steps as analyze_seo, but the embedding and LLM calls await the
+        provider's async client, so many pages can be in flight at once
+        (see analyze_seo_batch).
+
+        Args:
+            content: Page content (HTML or text)
+            metadata: Page metadata dictionary
+            url: Page URL
+            use_cache: Look up earlier responses before calling the LLM
+                (False forces a fresh call; the result is still cached)
 
         Returns:
             Dictionary containing SEO analysis results with evidence trail
         """
-        # Capture input summary for evidence trail
-        input_summary = self._build_input_summary(content, metadata, url)
+        request = self._prepare_seo_request(content, metadata, url, use_cache)
+        if isinstance(request, dict):
+            return request
+
+        if request.semantic_text is not None:
+            semantic_response = self._lookup_semantic(
+                request, await self._embed_async(request.semantic_text)
+            )
+            if semantic_response:
+                return semantic_response
+
+        try:
+            response = await self._call_llm_async(
+                request.prompt,
+                system_prompt=self.SEO_SYSTEM_PROMPT,
+                stop_at_keys=_SEO_RESPONSE_KEYS,
+            )
+            return self._finish_seo_request(request, response)
+        except Exception as e:
+            return self._failed_seo_request(request, e)
+
+    def _prepare_seo_request(
+        self, content: str, metadata: dict, url: str, use_cache: bool
+    ) -> _SEORequest | dict:
+        """Build the prompt and answer from the exact-match cache if possible.
+
+        Args:
+            content: Page content (HTML or text)
+            metadata: Page metadata dictionary
+            url: Page URL
+            use_cache: Look up earlier responses before calling the LLM
+
+        Returns:
+            A final result dict (empty page or cache hit), or the request to
+            send to the LLM
+        """
+        # Read the metadata fields once for both the summary and the prompt
+        page_meta = _PageMetaView.from_metadata(metadata, content)
 
-        prompt = self._build_seo_prompt(content, metadata, url)
+        # Dead pages have nothing to score - skip the prompt and the API call
+        if self._is_empty_input(page_meta):
+            return self._create_empty_input_result(
+                self._build_input_summary(page_meta, url), url
+            )
+
+        prompt = self._build_seo_prompt(page_meta, url)
 
-        # Generate prompt hash for reproducibility
-        prompt_hash = self._compute_prompt_hash(prompt)
+        # Generate prompt hash for reproducibility (encode the prompt once)
+        prompt_hash = self._compute_prompt_hash(prompt.encode('utf-8'))
 
         # Check cache first
-        cache_context = {'model': self.model, 'provider': self.provider, 'url': url}
+        cache_key = self._compute_cache_key(prompt_hash, url)
+        cached_response = self._get_cached_result(cache_key, url) if use_cache else None
+        if cached_response:
+            return cached_response
+
+        semantic_text = None
+        if use_cache and self._semantic_cache is not None:
+            semantic_text = self._build_semantic_text(page_meta)
+
+        return _SEORequest(
+            url=url,
+            page_meta=page_meta,
+            prompt=prompt,
+            prompt_hash=prompt_hash,
+            cache_key=cache_key,
+            semantic_text=semantic_text,
+        )
+
+    def _lookup_semantic(
+        self, request: _SEORequest, embedding: Optional[list[float]]
+    ) -> Optional[dict]:
+        """Record the page embedding and return a semantic cache hit, if any."""
+        request.embedding = embedding
+        return self._get_semantic_result(embedding)
+
+    def _finish_seo_request(self, request: _SEORequest, response: str) -> dict:
+        """Turn the LLM response into the result and remember it for similar pages."""
+        # Input summary for the evidence trail (only needed on a miss)
+        result = self._build_seo_result(
+            response,
+            request.prompt_hash,
+            self._build_input_summary(request.page_meta, request.url),
+            request.cache_key,
+            request.url,
+        )
+        self._store_semantic_result(request.embedding, result, request.url)
+        return result
+
+    def _failed_seo_request(self, request: _SEORequest, error: Exception) -> dict:
+        """Create the error result for an LLM call that raised."""
+        # Edge case: LLM API failure - still capture partial evidence
+        logger.error(f"LLM analysis failed for {request.url}: {error}")
+        return self._create_error_result(
+            error_message=str(error),
+            input_summary=self._build_input_summary(request.page_meta, request.url),
+            prompt_hash=request.prompt_hash,
+            url=request.url,
+            raw_response=None,
+        )
+
+    async def analyze_seo_batch(
+        self,
+        items: list[tuple[str, dict, str]],
+        concurrency: int = 16,
+        use_cache: bool = True,
+    ) -> list[dict[str, any]]:
+        """Analyze several pages concurrently.
+
+        Args:
+            items: (content, metadata, url) tuples to analyze
+            concurrency: Maximum number of LLM requests in flight
+            use_cache: Look up earlier responses before calling the LLM
+
+        Returns:
+            Analysis results in the same order as items
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def bounded(content: str, metadata: dict, url: str) -> dict[str, any]:
+            async with semaphore:
+                return await self.analyze_seo_async(
+                    content, metadata, url, use_cache=use_cache
+                )
+
+        return await asyncio.gather(*(bounded(*item) for item in items))
+
+    @staticmethod
+    def _is_empty_input(page_meta: _PageMetaView) -> bool:
+        """Check for pages with no content, title or description to analyze."""
+        return not (page_meta.content_length or page_meta.title or page_meta.description)
+
+    def _create_empty_input_result(self, input_summary: dict, url: str) -> dict:
+        """Create the error result for an empty page without calling the LLM."""
+        logger.debug(f"Skipping LLM analysis for empty page {url}")
+        return self._create_error_result(
+            error_message="Empty input: no content, title or description",
+            input_summary=input_summary,
+            prompt_hash='',
+            url=url,
+            raw_response=None,
+        )
+
+    def _compute_cache_key(self, prompt_hash: str, url: str) -> str:
+        """Derive the AICache key for an SEO analysis.
+
+        Built from the already computed prompt hash, so the key costs a
+        fixed-size hash regardless of prompt length.
+
+        Args:
+            prompt_hash: SHA-256 hash of the user prompt
+            url: Page URL
+
+        Returns:
+            Cache key hex digest
+        """
+        key_material = '|'.join((
+            prompt_hash, self.SEO_SYSTEM_PROMPT_HASH, self.model, self.provider, url,
+        ))
+        return hashlib.sha256(key_material.encode('utf-8')).hexdigest()
+
+    def _get_cached_result(self, cache_key: str, url: str) -> Optional[dict]:
+        """Look up a cached analysis and update hit/miss counters.
+
+        Returns:
+            The cached result marked with from_cache=True, or None on a miss
+        """
         if self._cache:
-            cached_response = self._cache.get(prompt, context=cache_context)
+            with self._pending_lock:
+                pending = self._pending_cache_writes.get(cache_key)
+            if pending is not None:
+                cached_response = dict(pending)
+            else:
+                cached_response = self._cache.get_by_key(cache_key)
             if cached_response:
                 self._cache_hits += 1
                 logger.debug(f"Cache hit for {url} (total hits: {self._cache_hits})")
@@ -124,74 +697,164 @@ class LLMClient:
                 return cached_response
 
         self._cache_misses += 1
+        return None
 
+    @staticmethod
+    def _build_semantic_text(page_meta: _PageMetaView) -> str:
+        """Text embedded for the semantic cache (what the LLM sees of the page)."""
+        return f"{page_meta.title}\n{page_meta.description}\n{page_meta.content_preview}"
+
+    def _embed(self, text: str) -> Optional[list[float]]:
+        """Embed text for the semantic cache; None if the call fails."""
         try:
-            response = self._call_llm(prompt)
+            if self._openai_client is None:
+                self._openai_client = openai.OpenAI(api_key=self.api_key)
+            response = self._openai_client.embeddings.create(
+                model=self.EMBEDDING_MODEL, input=text
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(f"Embedding failed, skipping semantic cache: {e}")
+            return None
 
-            # Handle empty response (edge case)
-            if not response or not response.strip():
-                return self._create_error_result(
-                    error_message="LLM returned empty response",
-                    input_summary=input_summary,
-                    prompt_hash=prompt_hash,
-                    url=url,
-                    raw_response=response,
-                )
+    async def _embed_async(self, text: str) -> Optional[list[float]]:
+        """Async counterpart of _embed."""
+        try:
+            response = await self._get_async_openai_client().embeddings.create(
+                model=self.EMBEDDING_MODEL, input=text
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(f"Embedding failed, skipping semantic cache: {e}")
+            return None
+
+    def _get_semantic_result(self, embedding: Optional[list[float]]) -> Optional[dict]:
+        """Reuse the analysis of a sufficiently similar page, if any.
 
-            result = self._parse_seo_response(response)
+        Returns:
+            A copy of the matched result marked from_cache='semantic', with the
+            matched page URL and similarity, or None
+        """
+        if embedding is None:
+            return None
+
+        match = self._semantic_cache.query(embedding)
+        if match is None:
+            return None
 
-            # Check for parsing failure (edge case)
-            if not result or result.get('parse_error'):
-                return self._create_error_result(
-                    error_message=result.get('parse_error', 'Failed to parse LLM response'),
-                    input_summary=input_summary,
-                    prompt_hash=prompt_hash,
-                    url=url,
-                    raw_response=response,
+        matched_url, response, similarity = match
+        self._semantic_hits += 1
+        logger.debug(
+            f"Semantic cache hit from {matched_url} (similarity {similarity:.3f})"
+        )
+        result = dict(response)
+        result['from_cache'] = 'semantic'
+        result['semantic_match_url'] = matched_url
+        result['semantic_similarity'] = round(similarity, 4)
+        return result
+
+    def _store_semantic_result(
+        self, embedding: Optional[list[float]], result: dict, url: str
+    ) -> None:
+        """Remember a successful analysis for near-duplicate pages."""
+        if embedding is None:
+            return
+        # Failed or unparseable analyses must not be served to other pages
+        if result.get('error_flag') or 'error' in result or 'parse_error' in result:
+            return
+        self._semantic_cache.add(url, embedding, result)
+
+    def _queue_cache_write(self, cache_key: str, result: dict, prompt_hash: str) -> None:
+        """Hand a result to the background cache writer, starting it if needed."""
+        with self._pending_lock:
+            if self._cache_writer is None:
+                self._cache_queue = queue.Queue(maxsize=_CACHE_QUEUE_SIZE)
+                self._cache_writer = threading.Thread(
+                    target=_run_cache_writer,
+                    args=(
+                        self._cache_queue,
+                        self._cache,
+                        self._pending_cache_writes,
+                        self._pending_lock,
+                    ),
+                    name="llm-cache-writer",
+                    daemon=True,
+                )
+                self._cache_writer.start()
+                # Flush on close(), garbage collection or interpreter exit
+                self._cache_writer_finalizer = weakref.finalize(
+                    self, _stop_cache_writer, self._cache_queue, self._cache_writer
                 )
+            self._pending_cache_writes[cache_key] = result
+
+        # Blocks only if the writer falls _CACHE_QUEUE_SIZE entries behind
+        self._cache_queue.put((cache_key, result, self.model, prompt_hash))
+
+    def _build_seo_result(
+        self,
+        response: str,
+        prompt_hash: str,
+        input_summary: dict,
+        cache_key: str,
+        url: str,
+    ) -> dict:
+        """Turn a raw LLM response into a result with evidence and cache it.
 
-            # Create evidence collection for this LLM analysis
-            evidence = self._create_evidence(
-                result=result,
+        Args:
+            response: Raw LLM response text
+            prompt_hash: Hash of the prompt
+            input_summary: Summary of inputs to LLM
+            cache_key: AICache key for this analysis
+            url: URL being analyzed
+
+        Returns:
+            Result dict, or an error result for empty/unparseable responses
+        """
+        # Handle empty response (edge case)
+        if not response or not response.strip():
+            return self._create_error_result(
+                error_message="LLM returned empty response",
                 input_summary=input_summary,
                 prompt_hash=prompt_hash,
-                raw_response=response,
                 url=url,
+                raw_response=response,
             )
 
-            # Add evidence to result
-            result['evidence'] = evidence
-            result['ai_generated'] = True
-            result['model_id'] = self.model
-            result['provider'] = self.provider
-            result['from_cache'] = False
-
-            # Cache the successful result
-            if self._cache:
-                try:
-                    self._cache.put(
-                        prompt=prompt,
-                        response=result,
-                        model=self.model,
-                        context=cache_context,
-                    )
-                    logger.debug(f"Cached LLM response for {url}")
-                except Exception as e:
-                    logger.warning(f"Failed to cache response: {e}")
-
-            return result
+        result = self._parse_seo_response(response)
 
-        except Exception as e:
-            # Edge case: LLM API failure - still capture partial evidence
-            logger.error(f"LLM analysis failed for {url}: {e}")
+        # Check for parsing failure (edge case)
+        if not result or result.get('parse_error'):
             return self._create_error_result(
-                error_message=str(e),
+                error_message=result.get('parse_error', 'Failed to parse LLM response'),
                 input_summary=input_summary,
                 prompt_hash=prompt_hash,
                 url=url,
-                raw_response=None,
+                raw_response=response,
             )
 
+        # Create evidence collection for this LLM analysis
+        evidence = self._create_evidence(
+            result=result,
+            input_summary=input_summary,
+            prompt_hash=prompt_hash,
+            raw_response=response,
+            url=url,
+        )
+
+        # Add evidence to result
+        result['evidence'] = evidence
+        result['ai_generated'] = True
+        result['model_id'] = self.model
+        result['provider'] = self.provider
+        result['from_cache'] = False
+
+        # Cache the successful result (written in the background)
+        if self._cache:
+            self._queue_cache_write(cache_key, result, prompt_hash)
+            logger.debug(f"Queued LLM response for {url} for caching")
+
+        return result
+
     def _create_error_result(
         self,
         error_message: str,
@@ -299,48 +962,51 @@ class LLMClient:
         }
 
     def _build_input_summary(
-        self, content: str, metadata: dict, url: str
+        self, page_meta: _PageMetaView, url: str
     ) -> dict:
         """Build a summary of inputs provided to the LLM.
 
         This captures what data was sent to the LLM for audit trail purposes.
 
         Args:
-            content: Page content
-            metadata: Page metadata
+            page_meta: Page metadata and content preview
             url: Page URL
 
         Returns:
             Dictionary summarizing inputs
         """
-        title = metadata.get('title', '')
-        description = metadata.get('description', '')
-        h1_tags = metadata.get('h1_tags', [])
+        snippet = page_meta.content_preview
 
-        return {
+        summary = {
             'url': url,
-            'title': title,
-            'title_length': len(title) if title else 0,
-            'description': description,
-            'description_length': len(description) if description else 0,
-            'h1_count': len(h1_tags) if h1_tags else 0,
-            'h1_tags': h1_tags[:5] if h1_tags else [],  # First 5 H1s
-            'word_count': metadata.get('word_count', 0),
-            'content_snippet': content[:1000] if content else '',
-            'content_length': len(content) if content else 0,
-            'keywords': metadata.get('keywords', [])[:10],  # First 10 keywords
+            'title': page_meta.title,
+            'title_length': page_meta.title_length,
+            'description': page_meta.description,
+            'description_length': page_meta.description_length,
+            'h1_count': page_meta.h1_count,
+            'h1_tags': page_meta.h1_tags[:5],  # First 5 H1s
+            'word_count': page_meta.word_count,
+            'content_snippet_hash': hashlib.sha256(snippet.encode('utf-8')).hexdigest(),
+            'content_snippet_length': len(snippet),
+            'content_length': page_meta.content_length,
+            'keywords': page_meta.keywords[:10],  # First 10 keywords
         }
+        # The snippet is already in the prompt (see prompt_hash); only keep a
+        # copy in the persisted evidence when debugging
+        if self.include_content_snippet:
+            summary['content_snippet'] = snippet
+        return summary
 
-    def _compute_prompt_hash(self, prompt: str) -> str:
+    def _compute_prompt_hash(self, prompt_bytes: bytes) -> str:
         """Compute SHA-256 hash of the prompt for reproducibility.
 
         Args:
-            prompt: The full prompt text
+            prompt_bytes: The full prompt text, already UTF-8 encoded
 
         Returns:
             SHA-256 hash string
         """
-        return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        return hashlib.sha256(prompt_bytes).hexdigest()
 
     def _create_evidence(
         self,
@@ -367,6 +1033,10 @@ class LLMClient:
             component_id='llm_scoring',
         )
 
+        # One clock read for the whole collection; records from a single
+        # analysis share a timestamp
+        now = datetime.now()
+
         # Extract reasoning if present
         reasoning = result.get('reasoning', '')
         if not reasoning and 'weaknesses' in result:
@@ -383,109 +1053,71 @@ class LLMClient:
             prompt_hash=prompt_hash,
             provider=self.provider,
         )
+        overall_record.timestamp = now
         overall_record.source_location = url
         overall_record.measured_value = result.get('overall_score', 0)
-        evidence_collection.add_record(overall_record)
-
-        # Create evidence records for individual scores
-        score_fields = [
-            ('title_score', 'Title optimization score'),
-            ('description_score', 'Meta description score'),
-            ('content_score', 'Content quality score'),
-            ('technical_score', 'Technical SEO score'),
-        ]
 
-        for field, description in score_fields:
-            if field in result:
-                record = EvidenceRecord(
-                    component_id='llm_scoring',
-                    finding=f"{field}:{result[field]}",
-                    evidence_string=description,
-                    confidence=ConfidenceLevel.MEDIUM,  # LLM outputs capped at MEDIUM
-                    timestamp=datetime.now(),
-                    source=self.SOURCE_LABEL,
-                    source_type=EvidenceSourceType.LLM_INFERENCE,
-                    source_location=url,
-                    ai_generated=True,
-                    model_id=self.model,
-                    provider=self.provider,
-                    source_api=self.source_api,
-                    measured_value=result[field],
-                    confidence_override_reason='LLM-only evaluations capped at MEDIUM per hallucination mitigation policy',
-                )
-                evidence_collection.add_record(record)
+        # Create evidence records for individual scores; the fields they
+        # share are resolved once and splatted into each record
+        common = dict(
+            component_id='llm_scoring',
+            confidence=ConfidenceLevel.MEDIUM,  # LLM outputs capped at MEDIUM
+            timestamp=now,
+            source=self.SOURCE_LABEL,
+            source_type=EvidenceSourceType.LLM_INFERENCE,
+            source_location=url,
+            ai_generated=True,
+            model_id=self.model,
+            provider=self.provider,
+            source_api=self.source_api,
+            confidence_override_reason=_LLM_SCORE_CAP_REASON,
+        )
+        score_records = [
+            EvidenceRecord(
+                finding=f"{score_field}:{result[score_field]}",
+                evidence_string=description,
+                measured_value=result[score_field],
+                **common,
+            )
+            for score_field, description in _SCORE_FIELDS
+            if score_field in result
+        ]
+        evidence_collection.add_records([overall_record, *score_records])
 
         return evidence_collection.to_dict()
 
     def _build_seo_prompt(
-        self, content: str, metadata: dict, url: str
+        self, page_meta: _PageMetaView, url: str
     ) -> str:
-        """Build the prompt for SEO analysis.
+        """Build the per-page user prompt for SEO analysis.
+
+        Only the page-specific data goes here; the fixed instructions live in
+        SEO_SYSTEM_PROMPT so every request shares the same prompt prefix.
 
         Args:
-            content: Page content
-            metadata: Page metadata
+            page_meta: Page metadata and content preview
             url: Page URL
 
         Returns:
             Formatted prompt string
         """
-        title = metadata.get('title', 'N/A')
-        description = metadata.get('description', 'N/A')
-        h1_tags = metadata.get('h1_tags', [])
-        word_count = metadata.get('word_count', 0)
-
-        return f"""Analyze the following web page for SEO quality and provide recommendations.
-
-URL: {url}
-
-Metadata:
-- Title: {title} (Length: {len(title) if title != 'N/A' else 0} characters)
-- Description: {description} (Length: {len(description) if description != 'N/A' else 0} characters)
-- H1 Tags: {', '.join(h1_tags) if h1_tags else 'None'} (Count: {len(h1_tags)})
-- Word Count: {word_count}
-
-Content Preview (first 1000 chars):
-{content[:1000]}
-
-Please provide:
-1. An overall SEO score (0-100)
-2. Individual scores for:
-   - Title optimization (consider: length 50-60 chars ideal, keyword presence)
-   - Meta description (consider: length 120-160 chars ideal, compelling copy)
-   - Content quality (consider: word count > 300, readability, structure)
-   - Technical SEO (consider: proper tags, structure, accessibility)
-3. List of strengths
-4. List of weaknesses
-5. Actionable recommendations for improvement
-6. A DETAILED reasoning explaining the overall score
-
-CRITICAL REASONING REQUIREMENTS:
-- You MUST reference EXACT measured values from the metadata above
-- For title issues: cite the actual title length (e.g., "Title is 23 characters, below the recommended 50-60")
-- For content issues: cite the actual word count (e.g., "Only 187 words, well below 300 minimum")
-- For description issues: cite the actual length (e.g., "Description at 45 chars is too short")
-- For H1 issues: cite the actual count (e.g., "Page has 0 H1 tags" or "Page has 3 H1 tags, should have exactly 1")
-- Reference thresholds when explaining deductions
-
-Format your response ONLY as TOON (Token-Oriented Object Notation) with NO additional text.
-Use this exact structure:
-overall_score: <number>
-title_score: <number>
-description_score: <number>
-content_score: <number>
-technical_score: <number>
-strengths[N]: <comma-separated values>
-weaknesses[N]: <comma-separated values>
-recommendations[N]: <comma-separated values>
-reasoning: <paragraph with SPECIFIC data references like "title at X chars", "word count of Y", "Z H1 tags">
-
-Where [N] is the count of items in each array.
-"""
+        return _SEO_USER_PROMPT_TEMPLATE.format_map({
+            'url': url,
+            'title': page_meta.title or 'N/A',
+            'title_length': page_meta.title_length,
+            'description': page_meta.description or 'N/A',
+            'description_length': page_meta.description_length,
+            'h1_tags': ', '.join(page_meta.h1_tags) if page_meta.h1_tags else 'None',
+            'h1_count': page_meta.h1_count,
+            'word_count': page_meta.word_count,
+            'content_preview': page_meta.content_preview,
+        })
 
     def _call_llm(
         self,
         prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_at_keys: Optional[frozenset] = None,
         max_retries: int = 3,
         retry_delay: float = 2.0,
         backoff_factor: float = 2.0,
@@ -498,6 +1130,8 @@ Where [N] is the count of items in each array.
 
         Args:
             prompt: The prompt to send
+            system_prompt: System instructions (OpenAI default: SYSTEM_PROMPT)
+            stop_at_keys: TOON keys after which a streamed response is complete
             max_retries: Maximum number of retry attempts (default: 3)
             retry_delay: Initial delay between retries in seconds (default: 2.0)
             backoff_factor: Multiplier for delay after each retry (default: 2.0)
@@ -508,49 +1142,101 @@ Where [N] is the count of items in each array.
         Raises:
             Exception: If all retries are exhausted or non-retryable error occurs
         """
-        last_exception = None
         current_delay = retry_delay
 
         for attempt in range(max_retries + 1):
             try:
                 if self.provider == "openai":
-                    return self._call_openai(prompt)
+                    return self._call_openai(prompt, system_prompt, stop_at_keys)
                 elif self.provider == "anthropic":
-                    return self._call_anthropic(prompt)
+                    return self._call_anthropic(prompt, system_prompt, stop_at_keys)
                 else:
                     raise ValueError(f"Unsupported provider: {self.provider}")
 
             except Exception as e:
-                error_str = str(e).lower()
-                last_exception = e
-
-                # Non-retryable errors - fail fast
-                non_retryable = [
-                    'invalid api key',
-                    'authentication',
-                    'unauthorized',
-                    'invalid_api_key',
-                    'model not found',
-                    'invalid model',
-                ]
-                if any(err in error_str for err in non_retryable):
-                    logger.error(f"Non-retryable LLM error: {e}")
+                if not self._should_retry(e, attempt, max_retries, current_delay):
                     raise
+                time.sleep(current_delay)
+                current_delay *= backoff_factor
+
+    async def _call_llm_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_at_keys: Optional[frozenset] = None,
+        max_retries: int = 3,
+        retry_delay: float = 2.0,
+        backoff_factor: float = 2.0,
+    ) -> str:
+        """Async counterpart of _call_llm with the same retry policy.
+
+        Args:
+            prompt: The prompt to send
+            system_prompt: System instructions (OpenAI default: SYSTEM_PROMPT)
+            stop_at_keys: TOON keys after which a streamed response is complete
+            max_retries: Maximum number of retry attempts (default: 3)
+            retry_delay: Initial delay between retries in seconds (default: 2.0)
+            backoff_factor: Multiplier for delay after each retry (default: 2.0)
+
+        Returns:
+            LLM response text
+
+        Raises:
+            Exception: If all retries are exhausted or non-retryable error occurs
+        """
+        current_delay = retry_delay
 
-                # Retryable errors - connection, rate limit, timeout
-                if attempt < max_retries:
-                    logger.warning(
-                        f"LLM call failed (attempt {attempt + 1}/{max_retries + 1}): {e}. "
-                        f"Retrying in {current_delay:.1f}s..."
+        for attempt in range(max_retries + 1):
+            try:
+                if self.provider == "openai":
+                    return await self._call_openai_async(prompt, system_prompt, stop_at_keys)
+                elif self.provider == "anthropic":
+                    return await self._call_anthropic_async(
+                        prompt, system_prompt, stop_at_keys
                     )
-                    time.sleep(current_delay)
-                    current_delay *= backoff_factor
                 else:
-                    logger.error(
-                        f"LLM call failed after {max_retries + 1} attempts: {e}"
-                    )
+                    raise ValueError(f"Unsupported provider: {self.provider}")
 
-        raise last_exception
+            except Exception as e:
+                if not self._should_retry(e, attempt, max_retries, current_delay):
+                    raise
+                await asyncio.sleep(current_delay)
+                current_delay *= backoff_factor
+
+    def _should_retry(
+        self, error: Exception, attempt: int, max_retries: int, delay: float
+    ) -> bool:
+        """Apply the retry policy of _call_llm/_call_llm_async to a failed attempt.
+
+        Args:
+            error: Exception raised by the provider call
+            attempt: Zero-based attempt number
+            max_retries: Maximum number of retry attempts
+            delay: Seconds the caller will wait before the next attempt
+
+        Returns:
+            True to retry after the delay, False to re-raise the error
+        """
+        # Non-retryable errors - fail fast
+        if self._is_non_retryable(error):
+            logger.error(f"Non-retryable LLM error: {error}")
+            return False
+
+        # Retryable errors - connection, rate limit, timeout
+        if attempt < max_retries:
+            logger.warning(
+                f"LLM call failed (attempt {attempt + 1}/{max_retries + 1}): {error}. "
+                f"Retrying in {delay:.1f}s..."
+            )
+            return True
+
+        logger.error(f"LLM call failed after {max_retries + 1} attempts: {error}")
+        return False
+
+    @staticmethod
+    def _is_non_retryable(error: Exception) -> bool:
+        """Check whether an LLM error should fail fast (auth, invalid model)."""
+        return _NON_RETRYABLE_RE.search(str(error)) is not None
 
     def generate_recommendations_with_evidence(
         self,
@@ -571,10 +1257,8 @@ Where [N] is the count of items in each array.
         Returns:
             Tuple of (recommendations_text, evidence_records_list)
         """
-        import hashlib
-
         # Create prompt hash for traceability
-        prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+        prompt_hash = self._compute_prompt_hash(prompt.encode('utf-8'))[:16]
         input_summary = f"Site: {site_url}, Pages: {crawl_stats.get('total_pages', 0)}"
 
         evidence_records = []
@@ -600,7 +1284,7 @@ Where [N] is the count of items in each array.
                 prompt_hash=prompt_hash,
                 input_summary=input_summary,
                 reasoning=f'LLM analysis of {crawl_stats.get("total_pages", 0)} pages',
-                confidence_override_reason='LLM-only evaluations capped at MEDIUM per hallucination mitigation policy',
+                confidence_override_reason=_LLM_SCORE_CAP_REASON,
             )
             evidence_records.append(record.to_dict())
 
@@ -628,61 +1312,210 @@ Where [N] is the count of items in each array.
             evidence_records.append(error_record.to_dict())
             raise
 
-    def _call_openai(self, prompt: str) -> str:
+    def _openai_request(self, prompt: str, system_prompt: Optional[str]) -> dict:
+        """Build the chat.completions.create arguments."""
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": system_prompt or self.SYSTEM_PROMPT,
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.3,
+            "max_tokens": self.max_tokens,
+        }
+
+    def _anthropic_request(self, prompt: str, system_prompt: Optional[str]) -> dict:
+        """Build the messages.create arguments.
+
+        Calls without a system prompt send none. A system prompt long enough
+        for Anthropic's prompt cache is marked as an ephemeral cache
+        breakpoint; shorter ones are sent as plain text.
+        """
+        request = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system_prompt:
+            system_block = {"type": "text", "text": system_prompt}
+            if len(system_prompt) >= _PROMPT_CACHE_MIN_CHARS:
+                system_block["cache_control"] = {"type": "ephemeral"}
+            request["system"] = [system_block]
+        return request
+
+    def _call_openai(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_at_keys: Optional[frozenset] = None,
+    ) -> str:
         """Call OpenAI API.
 
         Args:
             prompt: The prompt to send
+            system_prompt: System instructions (default: SYSTEM_PROMPT)
+            stop_at_keys: With stream_responses, stop reading once these
+                TOON keys have all arrived
 
         Returns:
             Response text
         """
-        try:
-            import openai
-
-            client = openai.OpenAI(api_key=self.api_key)
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert SEO analyst.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=self.max_tokens,
-            )
-            return response.choices[0].message.content
-        except ImportError:
+        if not OPENAI_AVAILABLE:
             raise ImportError(
                 "openai package not installed. Install with: poetry add openai"
             )
 
-    def _call_anthropic(self, prompt: str) -> str:
+        if self._openai_client is None:
+            self._openai_client = openai.OpenAI(api_key=self.api_key)
+
+        request = self._openai_request(prompt, system_prompt)
+        if not self.stream_responses:
+            response = self._openai_client.chat.completions.create(**request)
+            return response.choices[0].message.content
+
+        collector = _StreamCollector(stop_at_keys)
+        stream = self._openai_client.chat.completions.create(stream=True, **request)
+        try:
+            for chunk in stream:
+                if chunk.choices and collector.feed(chunk.choices[0].delta.content):
+                    break
+        finally:
+            stream.close()
+        return collector.text
+
+    def _call_anthropic(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_at_keys: Optional[frozenset] = None,
+    ) -> str:
         """Call Anthropic API.
 
         Args:
             prompt: The prompt to send
+            system_prompt: System instructions (default: none)
+            stop_at_keys: With stream_responses, stop reading once these
+                TOON keys have all arrived
 
         Returns:
             Response text
         """
-        try:
-            import anthropic
-
-            client = anthropic.Anthropic(api_key=self.api_key)
-            response = client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                messages=[{"role": "user", "content": prompt}],
+        if not ANTHROPIC_AVAILABLE:
+            raise ImportError(
+                "anthropic package not installed. Install with: poetry add anthropic"
             )
+
+        if self._anthropic_client is None:
+            self._anthropic_client = anthropic.Anthropic(api_key=self.api_key)
+
+        request = self._anthropic_request(prompt, system_prompt)
+        if not self.stream_responses:
+            response = self._anthropic_client.messages.create(**request)
             return response.content[0].text
-        except ImportError:
+
+        collector = _StreamCollector(stop_at_keys)
+        with self._anthropic_client.messages.stream(**request) as stream:
+            for text in stream.text_stream:
+                if collector.feed(text):
+                    break
+        return collector.text
+
+    def _get_async_openai_client(self):
+        """Return the shared async OpenAI client, creating it on first use.
+
+        The SDK's default httpx client settings (timeouts, pool limits) are
+        kept; HTTP/2 is enabled when h2 is installed.
+        """
+        if self._async_openai_client is None:
+            self._async_openai_client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=_async_http_client(openai),
+            )
+        return self._async_openai_client
+
+    async def _call_openai_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_at_keys: Optional[frozenset] = None,
+    ) -> str:
+        """Call OpenAI API with the async client.
+
+        Args:
+            prompt: The prompt to send
+            system_prompt: System instructions (default: SYSTEM_PROMPT)
+            stop_at_keys: With stream_responses, stop reading once these
+                TOON keys have all arrived
+
+        Returns:
+            Response text
+        """
+        if not OPENAI_AVAILABLE:
+            raise ImportError(
+                "openai package not installed. Install with: poetry add openai"
+            )
+
+        client = self._get_async_openai_client()
+        request = self._openai_request(prompt, system_prompt)
+        if not self.stream_responses:
+            response = await client.chat.completions.create(**request)
+            return response.choices[0].message.content
+
+        collector = _StreamCollector(stop_at_keys)
+        stream = await client.chat.completions.create(
+            stream=True, **request
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices and collector.feed(chunk.choices[0].delta.content):
+                    break
+        finally:
+            await stream.close()
+        return collector.text
+
+    async def _call_anthropic_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_at_keys: Optional[frozenset] = None,
+    ) -> str:
+        """Call Anthropic API with the async client.
+
+        Args:
+            prompt: The prompt to send
+            system_prompt: System instructions (default: none)
+            stop_at_keys: With stream_responses, stop reading once these
+                TOON keys have all arrived
+
+        Returns:
+            Response text
+        """
+        if not ANTHROPIC_AVAILABLE:
             raise ImportError(
                 "anthropic package not installed. Install with: poetry add anthropic"
             )
 
+        if self._async_anthropic_client is None:
+            self._async_anthropic_client = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                http_client=_async_http_client(anthropic),
+            )
+
+        request = self._anthropic_request(prompt, system_prompt)
+        if not self.stream_responses:
+            response = await self._async_anthropic_client.messages.create(**request)
+            return response.content[0].text
+
+        collector = _StreamCollector(stop_at_keys)
+        async with self._async_anthropic_client.messages.stream(**request) as stream:
+            async for text in stream.text_stream:
+                if collector.feed(text):
+                    break
+        return collector.text
+
     def _parse_seo_response(self, response: str) -> dict[str, any]:
         """Parse the LLM response into structured data.
 
@@ -693,39 +1526,22 @@ Where [N] is the count of items in each array.
             Parsed dictionary
         """
         try:
-            # Extract TOON content (remove any markdown or explanatory text)
-            lines = response.strip().split('\n')
-            toon_lines = []
-
-            # Look for lines that match TOON format (key: value or key[N]: values)
-            for line in lines:
-                stripped = line.strip()
-                # Match TOON format: field_name: value or field_name[N]: values
-                if stripped and (':' in stripped):
-                    # Check if it's a valid TOON field
-                    key_part = stripped.split(':', 1)[0].strip()
-                    # Valid if it's alphanumeric with underscores, optionally with [N]
-                    if key_part.replace('[', '').replace(']', '').replace('_', '').replace(' ', '').isalnum():
-                        toon_lines.append(stripped)
-
-            toon_str = '\n'.join(toon_lines) if toon_lines else response
-
-            # Decode TOON format to Python dict
-            result = toon.decode(toon_str)
-
-            # Clean up result if it contains unexpected keys
-            expected_keys = {
-                'overall_score', 'title_score', 'description_score',
-                'content_score', 'technical_score', 'strengths',
-                'weaknesses', 'recommendations', 'reasoning'
-            }
-
-            # Filter to only expected keys
-            filtered_result = {k: v for k, v in result.items() if k in expected_keys}
-
-            # Return filtered result if it has the main keys, otherwise return all
-            if 'overall_score' in filtered_result:
-                return filtered_result
+            # The response schema is fixed, so parse the known keys directly
+            # from the TOON lines (markdown and explanatory text are skipped)
+            result = {}
+            for line in _TOON_LINE_RE.findall(response):
+                match = _TOON_KEY_RE.match(line)
+                parser = match and _SEO_RESPONSE_PARSERS.get(match.group(1))
+                if parser:
+                    try:
+                        result[match.group(1)] = parser(line[match.end():])
+                    except ValueError:
+                        # Skip one malformed value (e.g. "N/A") rather than
+                        # discarding the whole response
+                        continue
+
+            if not result:
+                raise ValueError("No SEO fields found in response")
             return result
 
         except Exception as e:
@@ -741,6 +1557,9 @@ Where [N] is the count of items in each array.
                     "Unable to analyze - please try again"
                 ],
                 "error": str(e),
+                # Checked by _build_seo_result: routes the reply to an error
+                # result, which is never cached
+                "parse_error": str(e),
             }
 
     def get_cache_stats(self) -> dict:
@@ -760,6 +1579,12 @@ Where [N] is the count of items in each array.
             ),
         }
 
+        if self._semantic_cache is not None:
+            stats.update({
+                'semantic_cache_hits': self._semantic_hits,
+                'semantic_cache_entries': len(self._semantic_cache),
+            })
+
         if self._cache:
             cache_stats = self._cache.stats()
             stats.update({
@@ -770,8 +1595,19 @@ Where [N] is the count of items in each array.
 
         return stats
 
+    def close(self) -> None:
+        """Flush pending cache writes and stop the background writer."""
+        if self._cache_writer_finalizer is not None:
+            self._cache_writer_finalizer()
+            self._cache_writer_finalizer = None
+            self._cache_writer = None
+            self._cache_queue = None
+
     def clear_cache(self) -> None:
         """Clear all cached responses."""
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
         if self._cache:
+            self.close()
             self._cache.clear()
             logger.info("LLM cache cleared")
@@ -1,10 +1,20 @@
 """Logging configuration for SEO analyzer."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Log file rotation: 50 MB per file, five backups
+LOG_FILE_MAX_BYTES = 50_000_000
+LOG_FILE_BACKUP_COUNT = 5
+
+# Background listener that owns the real (I/O) handlers; see setup_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(
     level: str = "INFO",
@@ -13,11 +23,17 @@ def setup_logging(
 ) -> None:
     """Configure logging for the SEO analyzer.
 
+    The root logger only enqueues records; a QueueListener thread formats
+    them and writes to stdout and the log file, so worker threads never
+    block on console or disk I/O.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
         format_string: Optional custom format string
     """
+    global _listener
+
     if format_string is None:
         format_string = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
@@ -32,16 +48,37 @@ def setup_logging(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_file)
+        # delay=True: the file is only opened once something is logged
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            encoding='utf-8',
+            delay=True,
+        )
         handlers.append(file_handler)
 
-    # Configure root logger
-    logging.basicConfig(
-        level=numeric_level,
-        format=format_string,
-        handlers=handlers,
-        force=True  # Override any existing configuration
+    formatter = logging.Formatter(format_string)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Override any existing configuration (flushing a previous listener)
+    shutdown_logging()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+    # Configure root logger. The QueueHandler keeps the default formatter so
+    # it only merges args; the listener's handlers apply format_string.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(numeric_level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
     )
+    _listener.start()
 
     # Set levels for noisy third-party libraries
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -50,6 +87,20 @@ def setup_logging(
     logging.getLogger('anthropic').setLevel(logging.WARNING)
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance.
 
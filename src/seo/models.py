@@ -1,10 +1,11 @@
 """Data models for SEO analysis."""
 
-from dataclasses import dataclass, field
-from typing import Optional, Any, Literal
+from dataclasses import dataclass, field, fields
+from typing import Optional, Any, Iterable, Literal, Sequence
 from datetime import datetime
 from enum import Enum
 import os
+import sys
 
 
 # ============================================================================
@@ -81,7 +82,7 @@ LLM_CONFIDENCE_CAP_REASON = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidenceRecord:
     """Standardized evidence container for all evaluations.
 
@@ -375,7 +376,7 @@ class EvidenceRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidenceCollection:
     """Collection of evidence records for a single evaluation or finding.
 
@@ -392,6 +393,11 @@ class EvidenceCollection:
         self.records.append(record)
         self._update_confidence()
 
+    def add_records(self, records: Iterable[EvidenceRecord]) -> None:
+        """Add several evidence records, recomputing confidence only once."""
+        self.records.extend(records)
+        self._update_confidence()
+
     def _update_confidence(self) -> None:
         """Update combined confidence based on all records."""
         if not self.records:
@@ -428,9 +434,31 @@ class EvidenceCollection:
 # Page and Content Models
 # ============================================================================
 
-@dataclass
+# PageMetadata string fields drawn from a small vocabulary ("good", "nginx",
+# "WordPress", third-party hosts, ...). They are interned on construction so
+# a large crawl keeps one copy of each value instead of one per page.
+_INTERNED_STR_FIELDS = (
+    'cwv_lcp_status', 'cwv_inp_status', 'cwv_cls_status', 'cwv_overall_status',
+    'crux_lcp_category', 'crux_fid_category', 'crux_cls_category',
+    'crux_overall_category', 'tech_ecommerce', 'tech_cms', 'tech_web_server',
+)
+_INTERNED_LIST_FIELDS = ('technologies', 'third_party_domains', 'sd_schema_types')
+
+
+def _full_repr(obj: Any) -> str:
+    """The default dataclass repr, for models that override __repr__."""
+    args = ', '.join(f'{f.name}={getattr(obj, f.name)!r}' for f in fields(obj))
+    return f'{type(obj).__name__}({args})'
+
+
+@dataclass(slots=True, repr=False)
 class PageMetadata:
-    """Metadata extracted from a web page."""
+    """Metadata extracted from a web page.
+
+    List fields that most pages never populate (broken_links, redirect_chain,
+    console messages, Lighthouse extras, ...) default to a shared empty tuple
+    rather than a new list per instance; producers assign a full list.
+    """
 
     url: str
     title: Optional[str] = None
@@ -459,15 +487,15 @@ class PageMetadata:
     # Advanced SEO fields
     viewport_meta: Optional[str] = None
     lang_attribute: Optional[str] = None
-    hreflang_tags: list[dict[str, str]] = field(default_factory=list)
+    hreflang_tags: Sequence[dict[str, str]] = ()
     charset: Optional[str] = None
     content_text: str = ""
     readability_score: float = 0.0
     has_https: bool = False
     security_headers: dict[str, str] = field(default_factory=dict)
     twitter_card: dict[str, str] = field(default_factory=dict)
-    broken_links: list[str] = field(default_factory=list)
-    redirect_chain: list[str] = field(default_factory=list)
+    broken_links: Sequence[str] = ()
+    redirect_chain: Sequence[str] = ()
 
     # Core Web Vitals (Basic estimates)
     cwv_lcp_estimate: Optional[float] = None  # Largest Contentful Paint (seconds)
@@ -497,9 +525,9 @@ class PageMetadata:
     # Lighthouse Additional Metrics
     lighthouse_first_meaningful_paint: Optional[float] = None  # ms
     lighthouse_max_potential_fid: Optional[float] = None  # ms
-    lighthouse_screenshot_thumbnails: list[dict] = field(default_factory=list)
+    lighthouse_screenshot_thumbnails: Sequence[dict] = ()
     lighthouse_diagnostics: dict = field(default_factory=dict)  # Additional diagnostic info
-    lighthouse_opportunities: list[dict] = field(default_factory=list)  # Optimization opportunities
+    lighthouse_opportunities: Sequence[dict] = ()  # Optimization opportunities
     lighthouse_fetch_time: Optional[str] = None  # When Lighthouse was run
 
     # Chrome User Experience Report (CrUX) - Real User Data from PageSpeed Insights
@@ -555,8 +583,8 @@ class PageMetadata:
     above_fold_images: int = 0  # Images visible without scrolling
 
     # Console & Errors
-    console_errors: list[str] = field(default_factory=list)  # JS console errors
-    console_warnings: list[str] = field(default_factory=list)  # JS console warnings
+    console_errors: Sequence[str] = ()  # JS console errors
+    console_warnings: Sequence[str] = ()  # JS console warnings
 
     # Lazy Loading
     lazy_images_count: int = 0  # Images with lazy loading
@@ -568,10 +596,31 @@ class PageMetadata:
     third_party_size_bytes: int = 0  # Size of third-party resources
 
     # Fonts
-    web_fonts: list[dict] = field(default_factory=list)  # Font details (name, size, format)
-
-
-@dataclass
+    web_fonts: Sequence[dict] = ()  # Font details (name, size, format)
+
+    def __post_init__(self) -> None:
+        """Intern the small-vocabulary string fields."""
+        for name in _INTERNED_STR_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+        for name in _INTERNED_LIST_FIELDS:
+            values = getattr(self, name)
+            if values:
+                setattr(self, name, [
+                    sys.intern(v) if type(v) is str else v for v in values
+                ])
+
+    def __repr__(self) -> str:
+        # Compact: the full repr formats ~100 fields (see full_repr)
+        return f'PageMetadata(url={self.url!r}, status={self.status_code})'
+
+    def full_repr(self) -> str:
+        """Repr listing every field."""
+        return _full_repr(self)
+
+
+@dataclass(slots=True)
 class SEOScore:
     """SEO evaluation score and recommendations."""
 
@@ -587,7 +636,7 @@ class SEOScore:
     analyzed_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlResult:
     """Result of crawling a website."""
 
@@ -598,7 +647,7 @@ class CrawlResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TechnicalIssues:
     """Technical SEO issues found during analysis."""
 
@@ -624,7 +673,7 @@ class TechnicalIssues:
     poor_readability: list[tuple[str, float]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentQualityMetrics:
     """Content quality analysis metrics."""
 
@@ -640,7 +689,7 @@ class ContentQualityMetrics:
     difficult_words: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityAnalysis:
     """Security analysis results."""
 
@@ -652,7 +701,7 @@ class SecurityAnalysis:
     security_score: float = 0.0  # 0-100
 
 
-@dataclass
+@dataclass(slots=True)
 class URLStructureAnalysis:
     """URL structure analysis."""
 
@@ -666,7 +715,7 @@ class URLStructureAnalysis:
     issues: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ICEJustification:
     """Structured justification for ICE score components."""
 
@@ -678,7 +727,7 @@ class ICEJustification:
     source_value: Optional[int] = None  # Actual value from crawl data
 
 
-@dataclass
+@dataclass(slots=True)
 class ICEScore:
     """ICE Framework score for prioritization."""
 
@@ -693,7 +742,7 @@ class ICEScore:
     justification: Optional[ICEJustification] = None  # Structured ICE justification
 
 
-@dataclass
+@dataclass(slots=True)
 class ComprehensiveSEOReport:
     """Comprehensive SEO analysis report."""
 
@@ -713,7 +762,7 @@ class ComprehensiveSEOReport:
 # Resource Analysis Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ResourceBreakdown:
     """Breakdown of resources for a single page."""
     url: str
@@ -738,7 +787,7 @@ class ResourceBreakdown:
         return (self.image_bytes / self.total_bytes * 100) if self.total_bytes > 0 else 0
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class ResourceAnalysis:
     """Site-wide resource analysis results."""
 
@@ -782,12 +831,22 @@ class ResourceAnalysis:
     # Recommendations
     recommendations: list = field(default_factory=list)
 
+    def __repr__(self) -> str:
+        return (
+            f'ResourceAnalysis(total_pages={self.total_pages}, '
+            f'total_all_bytes={self.total_all_bytes})'
+        )
+
+    def full_repr(self) -> str:
+        """Repr listing every field, including the per-page breakdowns."""
+        return _full_repr(self)
+
 
 # ============================================================================
 # Console Error Analysis Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConsoleErrorAnalysis:
     """Analysis of JavaScript console errors and warnings."""
 
@@ -817,7 +876,7 @@ class ConsoleErrorAnalysis:
 # Third-Party Analysis Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ThirdPartyDomain:
     """Analysis of a single third-party domain."""
     domain: str
@@ -827,7 +886,7 @@ class ThirdPartyDomain:
     resource_types: list = field(default_factory=list)  # ['script', 'image', 'font']
 
 
-@dataclass
+@dataclass(slots=True)
 class ThirdPartyAnalysis:
     """Analysis of third-party resources across site."""
 
@@ -868,7 +927,7 @@ class ThirdPartyAnalysis:
 # Social Meta Analysis Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SocialMetaPageResult:
     """Social meta analysis for a single page."""
     url: str
@@ -889,7 +948,7 @@ class SocialMetaPageResult:
     issues: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SocialMetaAnalysis:
     """Site-wide social meta analysis."""
 
@@ -926,7 +985,7 @@ class SocialMetaAnalysis:
 # Lab vs Field Comparison Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MetricComparison:
     """Comparison of a single metric between lab and field."""
     metric_name: str
@@ -939,7 +998,7 @@ class MetricComparison:
     insight: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class LabFieldComparison:
     """Comparison between Lighthouse (lab) and CrUX (field) data."""
 
@@ -973,7 +1032,7 @@ class LabFieldComparison:
 # Redirect Analysis Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RedirectChain:
     """A single redirect chain analysis."""
     source_url: str
@@ -983,7 +1042,7 @@ class RedirectChain:
     estimated_time_ms: int = 0  # Estimated time cost
 
 
-@dataclass
+@dataclass(slots=True)
 class RedirectAnalysis:
     """Site-wide redirect chain analysis."""
 
@@ -1019,7 +1078,7 @@ class RedirectAnalysis:
 # Image Analysis Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ImageIssue:
     """A single image optimization issue."""
     url: str
@@ -1030,7 +1089,7 @@ class ImageIssue:
     estimated_savings_bytes: int = 0
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class ImageAnalysis:
     """Site-wide image optimization analysis."""
 
@@ -1071,3 +1130,13 @@ class ImageAnalysis:
 
     # Recommendations
     recommendations: list = field(default_factory=list)
+
+    def __repr__(self) -> str:
+        return (
+            f'ImageAnalysis(total_pages={self.total_pages}, '
+            f'total_images={self.total_images})'
+        )
+
+    def full_repr(self) -> str:
+        """Repr listing every field, including all image issues."""
+        return _full_repr(self)
@@ -1,17 +1,150 @@
 """Output manager for organizing crawl results with timestamps."""
 
+import gzip
 import json
 import logging
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, fields
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from urllib.parse import urlparse
 
 from seo.models import PageMetadata, TechnicalIssues
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Threads used to write per-page files; file writes release the GIL, so
+# several pages can be on their way to disk at once
+MAX_WRITE_WORKERS = 8
+
+# gzip level for compress=True output: JSON shrinks several-fold already at
+# low levels, which keep compression cheaper than the bytes it saves
+GZIP_COMPRESS_LEVEL = 3
+
+
+# Fields written to pages/*.json (content_text is replaced by its length)
+_PAGE_FIELD_NAMES = tuple(f.name for f in fields(PageMetadata) if f.name != "content_text")
+
+
+# advanced_analysis.json sections, in output order
+_DATACLASS_LIST_KEYS = ("content_quality", "security", "url_structure")
+_PASSTHROUGH_KEYS = (
+    "mobile",
+    "international",
+    "metadata_list",
+    "crawlability",
+    "technology",
+    "llm_evidence",
+    "cwv_evidence",
+)
+
+
+def _gz_path(filepath: Path) -> Path:
+    """Path of the gzipped variant of a file (name + .gz)."""
+    return filepath.with_name(filepath.name + ".gz")
+
+
+def load_json_file(filepath: Path) -> dict:
+    """Load a JSON file, gunzipping it if the name ends in .gz.
+
+    Args:
+        filepath: Path to JSON file
+
+    Returns:
+        Loaded data
+    """
+    opener = gzip.open if filepath.suffix == ".gz" else open
+    with opener(filepath, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_saved_json(filepath: Path) -> Optional[dict]:
+    """Load a crawl JSON file saved either plain or gzipped (compress=True).
+
+    Args:
+        filepath: Path of the plain file (e.g. crawl_dir / "advanced_analysis.json")
+
+    Returns:
+        Loaded data, or None if neither variant exists
+    """
+    for path in (filepath, _gz_path(filepath)):
+        if path.exists():
+            return load_json_file(path)
+    return None
+
+
+def iter_saved_pages(crawl_dir: Path) -> Iterator[dict]:
+    """Yield the saved page dicts of a crawl, one at a time.
+
+    Reads pages.jsonl line by line when the crawl was saved with
+    pages_jsonl=True, otherwise the per-page files in pages/. Gzipped
+    output (compress=True) is read the same way. Unreadable pages are
+    logged and skipped.
+
+    Args:
+        crawl_dir: Crawl directory
+
+    Yields:
+        Page metadata dictionaries
+    """
+    jsonl_path = crawl_dir / "pages.jsonl"
+    for path, opener in ((jsonl_path, open), (_gz_path(jsonl_path), gzip.open)):
+        if path.exists():
+            with opener(path, "rt", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError as e:
+                        logger.warning(f"Skipping unreadable page at {path}:{line_number}: {e}")
+            return
+
+    pages_dir = crawl_dir / "pages"
+    if pages_dir.is_dir():
+        page_files = [*pages_dir.glob("*.json"), *pages_dir.glob("*.json.gz")]
+        for page_file in sorted(page_files):
+            try:
+                page = load_json_file(page_file)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable page file {page_file}: {e}")
+                continue
+            yield page
+
+
+# Anything but (Unicode) letters, digits, "_" and "-"; same set as isalnum()
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w-]")
+
+
+@lru_cache(maxsize=100_000)
+def _url_to_filename(url: str) -> str:
+    """Convert URL to safe filename (see OutputManager._url_to_filename).
+
+    Cached: page files and Lighthouse reports are named from the same URLs.
+    """
+    parsed = urlparse(url)
+    domain = parsed.netloc.replace(":", "_")
+    path = parsed.path.strip("/").replace("/", "_").replace(".", "_")
+
+    if not path:
+        path = "index"
+
+    # Limit length
+    filename = f"{domain}_{path}"[:200]
+
+    # Remove any remaining unsafe characters
+    return _UNSAFE_FILENAME_CHARS.sub("_", filename)
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """JSON encoder that handles datetime objects."""
@@ -22,6 +155,23 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+# Crawl output (issues, advanced analysis, one file per page) is the bulk of
+# save time; orjson encodes it several times faster and handles datetimes
+# natively. Both paths produce the same 2-space indented UTF-8 JSON (or a
+# single line with indent=False, for JSON Lines).
+if ORJSON_AVAILABLE:
+    def _json_dumps(obj, indent: bool = True) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+else:
+    def _json_dumps(obj, indent: bool = True) -> bytes:
+        return json.dumps(
+            obj, indent=2 if indent else None, ensure_ascii=False, cls=DateTimeEncoder
+        ).encode("utf-8")
+
+
 class OutputManager:
     """Manages organized output of crawl results with timestamps and directories."""
 
@@ -32,7 +182,19 @@ class OutputManager:
             base_output_dir: Base directory for all crawl outputs
         """
         self.base_output_dir = Path(base_output_dir)
-        self.base_output_dir.mkdir(exist_ok=True)
+        # Directories this manager has already created (see _ensure_dir)
+        self._created_dirs: set[Path] = set()
+        self._ensure_dir(self.base_output_dir)
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory unless this manager already created it.
+
+        Args:
+            path: Directory to create (with parents)
+        """
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
 
     def create_crawl_directory(self, start_url: str, timestamp: Optional[datetime] = None) -> Path:
         """Create a timestamped directory for this crawl.
@@ -72,10 +234,10 @@ class OutputManager:
 
         # Create directory structure
         crawl_dir = self.base_output_dir / domain / timestamp_str
-        crawl_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(crawl_dir)
 
         # Create pages subdirectory
-        (crawl_dir / "pages").mkdir(exist_ok=True)
+        self._ensure_dir(crawl_dir / "pages")
 
         return crawl_dir
 
@@ -88,6 +250,8 @@ class OutputManager:
         llm_recommendations: str,
         crawl_stats: Optional[Dict] = None,
         advanced_analysis: Optional[Dict] = None,
+        pages_jsonl: bool = False,
+        compress: bool = False,
     ) -> None:
         """Save complete crawl results to the directory.
 
@@ -99,6 +263,14 @@ class OutputManager:
             llm_recommendations: LLM-generated recommendations
             crawl_stats: Optional crawl statistics
             advanced_analysis: Optional advanced analysis results
+            pages_jsonl: Write all pages to a single pages.jsonl (one JSON
+                object per line) instead of one file per page in pages/
+            compress: Gzip the page data and advanced_analysis.json (written
+                with an added .gz suffix)
+
+        Reports and crawl resume read pages.jsonl and gzipped files through
+        load_saved_json/iter_saved_pages. The standalone backfill_psi.py
+        script only handles the default layout: plain files in pages/.
         """
         # 1. Save metadata.json (overall crawl info)
         metadata = {
@@ -163,15 +335,17 @@ class OutputManager:
         if advanced_analysis:
             # Convert advanced analysis to JSON-serializable format
             advanced_dict = self._serialize_advanced_analysis(advanced_analysis)
-            self._save_json(crawl_dir / "advanced_analysis.json", advanced_dict)
+            self._save_json(crawl_dir / "advanced_analysis.json", advanced_dict, compress)
 
         # 4. Save individual page data
-        pages_dir = crawl_dir / "pages"
-        for url, page in site_data.items():
-            page_data = self._page_metadata_to_dict(page)
-            # Create safe filename from URL
-            filename = self._url_to_filename(url)
-            self._save_json(pages_dir / f"{filename}.json", page_data)
+        if pages_jsonl:
+            self._save_pages_jsonl(crawl_dir / "pages.jsonl", site_data, compress)
+        else:
+            pages_dir = crawl_dir / "pages"
+            self._run_writes(
+                lambda item: self._write_page(pages_dir, *item, compress=compress),
+                self._last_per_filename(site_data.items()),
+            )
 
         # 5. Save summary.txt (human-readable)
         self._save_summary(crawl_dir / "summary.txt", start_url, site_data, technical_issues, crawl_stats)
@@ -194,45 +368,12 @@ class OutputManager:
             return
 
         lighthouse_dir = crawl_dir / "lighthouse"
-        lighthouse_dir.mkdir(exist_ok=True)
-
-        for url, psi_data in psi_results.items():
-            # Create safe filename from URL
-            filename = self._url_to_filename(url)
-            report_path = lighthouse_dir / f"{filename}.json"
-
-            # Add URL to data for reference
-            # Include Lighthouse metadata for full provenance (Epic 3)
-            report_data = {
-                "url": url,
-                "strategy": psi_data.get("strategy", "mobile"),
-                "fetch_time": psi_data.get("fetch_time"),
-                "lighthouse_metadata": {
-                    "version": psi_data.get("lighthouse_version"),
-                    "user_agent": psi_data.get("user_agent"),
-                    "final_url": psi_data.get("final_url"),
-                    "run_warnings": psi_data.get("run_warnings", []),
-                },
-                "scores": {
-                    "performance": psi_data.get("performance_score"),
-                    "accessibility": psi_data.get("accessibility_score"),
-                    "best_practices": psi_data.get("best_practices_score"),
-                    "seo": psi_data.get("seo_score"),
-                    "pwa": psi_data.get("pwa_score"),
-                },
-                "metrics": {
-                    "fcp": psi_data.get("fcp"),
-                    "lcp": psi_data.get("lcp"),
-                    "cls": psi_data.get("cls"),
-                    "tbt": psi_data.get("tbt"),
-                    "si": psi_data.get("si"),
-                    "tti": psi_data.get("tti"),
-                },
-                "opportunities": psi_data.get("opportunities", []),
-                "crux_data": psi_data.get("crux_data"),
-            }
-
-            self._save_json(report_path, report_data)
+        self._ensure_dir(lighthouse_dir)
+
+        self._run_writes(
+            lambda item: self._write_lighthouse_report(lighthouse_dir, *item),
+            self._last_per_filename(psi_results.items()),
+        )
 
         # Copy the viewer HTML template
         viewer_src = Path(__file__).parent.parent.parent / "templates" / "lighthouse_viewer.html"
@@ -241,6 +382,51 @@ class OutputManager:
             import shutil
             shutil.copy(viewer_src, viewer_dst)
 
+    def _write_lighthouse_report(self, lighthouse_dir: Path, url: str, psi_data: dict) -> None:
+        """Write one PageSpeed Insights report to lighthouse/<filename>.json.
+
+        Args:
+            lighthouse_dir: Directory to save the report in
+            url: Audited URL
+            psi_data: Raw PSI result data for the URL
+        """
+        # Create safe filename from URL
+        filename = self._url_to_filename(url)
+        report_path = lighthouse_dir / f"{filename}.json"
+
+        # Add URL to data for reference
+        # Include Lighthouse metadata for full provenance (Epic 3)
+        report_data = {
+            "url": url,
+            "strategy": psi_data.get("strategy", "mobile"),
+            "fetch_time": psi_data.get("fetch_time"),
+            "lighthouse_metadata": {
+                "version": psi_data.get("lighthouse_version"),
+                "user_agent": psi_data.get("user_agent"),
+                "final_url": psi_data.get("final_url"),
+                "run_warnings": psi_data.get("run_warnings", []),
+            },
+            "scores": {
+                "performance": psi_data.get("performance_score"),
+                "accessibility": psi_data.get("accessibility_score"),
+                "best_practices": psi_data.get("best_practices_score"),
+                "seo": psi_data.get("seo_score"),
+                "pwa": psi_data.get("pwa_score"),
+            },
+            "metrics": {
+                "fcp": psi_data.get("fcp"),
+                "lcp": psi_data.get("lcp"),
+                "cls": psi_data.get("cls"),
+                "tbt": psi_data.get("tbt"),
+                "si": psi_data.get("si"),
+                "tti": psi_data.get("tti"),
+            },
+            "opportunities": psi_data.get("opportunities", []),
+            "crux_data": psi_data.get("crux_data"),
+        }
+
+        self._save_json(report_path, report_data)
+
     def save_psi_coverage(
         self,
         crawl_dir: Path,
@@ -256,7 +442,7 @@ class OutputManager:
             return
 
         lighthouse_dir = crawl_dir / "lighthouse"
-        lighthouse_dir.mkdir(exist_ok=True)
+        self._ensure_dir(lighthouse_dir)
 
         coverage_path = lighthouse_dir / "_coverage.json"
 
@@ -266,8 +452,7 @@ class OutputManager:
             **coverage_stats,
         }
 
-        with open(coverage_path, "w") as f:
-            json.dump(coverage_data, f, indent=2)
+        self._save_json(coverage_path, coverage_data)
 
         logger.info(f"PSI coverage stats saved to {coverage_path}")
 
@@ -279,6 +464,81 @@ class OutputManager:
                 f"is below {threshold}% threshold"
             )
 
+    def _write_page(
+        self, pages_dir: Path, url: str, page: PageMetadata, compress: bool = False
+    ) -> None:
+        """Write one page's metadata to pages/<filename>.json.
+
+        Args:
+            pages_dir: The crawl's pages directory
+            url: Page URL
+            page: Page metadata
+            compress: Gzip the file (pages/<filename>.json.gz)
+        """
+        # Create safe filename from URL
+        filename = self._url_to_filename(url)
+        self._save_json(
+            pages_dir / f"{filename}.json", self._page_metadata_to_dict(page), compress
+        )
+
+    def _save_pages_jsonl(
+        self, filepath: Path, site_data: Dict[str, PageMetadata], compress: bool = False
+    ) -> None:
+        """Save all pages as JSON Lines through a single file handle.
+
+        Args:
+            filepath: Path to save to
+            site_data: Dictionary of URL -> PageMetadata
+            compress: Gzip the file (written with an added .gz suffix)
+        """
+        if compress:
+            f = gzip.open(_gz_path(filepath), "wb", compresslevel=GZIP_COMPRESS_LEVEL)
+        else:
+            f = open(filepath, "wb")
+        with f:
+            for page in site_data.values():
+                f.write(_json_dumps(self._page_metadata_to_dict(page), indent=False))
+                f.write(b"\n")
+
+    def iter_saved_pages(self, crawl_dir: Path) -> Iterator[dict]:
+        """Yield the saved page dicts of a crawl (see iter_saved_pages)."""
+        return iter_saved_pages(crawl_dir)
+
+    @staticmethod
+    def _last_per_filename(items) -> list:
+        """Keep only the last (url, value) item for each target filename.
+
+        Filenames ignore query strings, so URLs such as ?page=1 and ?page=2
+        share a file. Writing both concurrently would interleave them; the
+        last URL wins, as it did when the files were written in order.
+
+        Args:
+            items: (url, value) pairs
+
+        Returns:
+            (url, value) pairs with unique filenames
+        """
+        return list({_url_to_filename(item[0]): item for item in items}.values())
+
+    @staticmethod
+    def _run_writes(write, items) -> None:
+        """Apply a file-writing function to each item using a thread pool.
+
+        Args:
+            write: Function writing one item
+            items: Items to write
+        """
+        items = list(items)
+        if len(items) <= 1:
+            for item in items:
+                write(item)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, len(items))) as executor:
+            # Consume the results so the first write error is raised here
+            for _ in executor.map(write, items):
+                pass
+
     def _page_metadata_to_dict(self, page: PageMetadata) -> dict:
         """Convert PageMetadata to dictionary for JSON serialization.
 
@@ -288,18 +548,16 @@ class OutputManager:
         Returns:
             Dictionary representation
         """
-        from dataclasses import asdict
-
-        data = asdict(page)
+        # Shallow: the field values are plain lists/dicts that are only
+        # serialized, so asdict's recursive copy is not needed
+        data = {name: getattr(page, name) for name in _PAGE_FIELD_NAMES}
 
         # Convert datetime to ISO format
         if data.get("crawled_at"):
             data["crawled_at"] = page.crawled_at.isoformat()
 
-        # Remove large content_text to keep files smaller
-        if "content_text" in data:
-            data["content_text_length"] = len(data.get("content_text", ""))
-            del data["content_text"]
+        # Leave out large content_text to keep files smaller
+        data["content_text_length"] = len(page.content_text or "")
 
         return data
 
@@ -317,30 +575,21 @@ class OutputManager:
             https://example.com/about -> example.com_about
             https://example.com/blog/post-1 -> example.com_blog_post-1
         """
-        parsed = urlparse(url)
-        domain = parsed.netloc.replace(":", "_")
-        path = parsed.path.strip("/").replace("/", "_").replace(".", "_")
-
-        if not path:
-            path = "index"
-
-        # Limit length
-        filename = f"{domain}_{path}"[:200]
-
-        # Remove any remaining unsafe characters
-        filename = "".join(c if c.isalnum() or c in "_-" else "_" for c in filename)
+        return _url_to_filename(url)
 
-        return filename
-
-    def _save_json(self, filepath: Path, data: dict) -> None:
+    def _save_json(self, filepath: Path, data: dict, compress: bool = False) -> None:
         """Save data as formatted JSON.
 
         Args:
             filepath: Path to save to
             data: Data to save
+            compress: Gzip the file (written with an added .gz suffix)
         """
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, cls=DateTimeEncoder)
+        if compress:
+            with gzip.open(_gz_path(filepath), "wb", compresslevel=GZIP_COMPRESS_LEVEL) as f:
+                f.write(_json_dumps(data))
+        else:
+            filepath.write_bytes(_json_dumps(data))
 
     def _save_summary(
         self,
@@ -359,41 +608,44 @@ class OutputManager:
             technical_issues: Technical issues
             crawl_stats: Crawl statistics
         """
+        lines = [
+            "=" * 60 + "\n",
+            "SEO CRAWL SUMMARY\n",
+            "=" * 60 + "\n\n",
+            f"Start URL: {start_url}\n",
+            f"Crawled at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Total pages: {len(site_data)}\n\n",
+        ]
+
+        if crawl_stats:
+            lines.append("CRAWL STATISTICS\n")
+            lines.append("-" * 60 + "\n")
+            lines.extend(f"{key}: {value}\n" for key, value in crawl_stats.items())
+            lines.append("\n")
+
+        lines += [
+            "TECHNICAL ISSUES\n",
+            "-" * 60 + "\n",
+            f"Missing titles: {len(technical_issues.missing_titles)}\n",
+            f"Duplicate titles: {len(technical_issues.duplicate_titles)}\n",
+            f"Missing meta descriptions: {len(technical_issues.missing_meta_descriptions)}\n",
+            f"Short meta descriptions: {len(technical_issues.short_meta_descriptions)}\n",
+            f"Missing H1 tags: {len(technical_issues.missing_h1)}\n",
+            f"Images without alt: {len(technical_issues.images_without_alt)}\n",
+            f"Slow pages (>3s): {len(technical_issues.slow_pages)}\n",
+            f"Thin content (<300w): {len(technical_issues.thin_content)}\n",
+            f"Missing canonical: {len(technical_issues.missing_canonical)}\n",
+            f"Missing viewport: {len(technical_issues.missing_viewport)}\n",
+            f"Non-HTTPS pages: {len(technical_issues.non_https)}\n",
+            "\n",
+            "PAGES CRAWLED\n",
+            "-" * 60 + "\n",
+        ]
+        lines.extend(f"{i:3d}. {url}\n" for i, url in enumerate(site_data.keys(), 1))
+
+        # Build the whole text first: one write (and one encode) per summary
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write("=" * 60 + "\n")
-            f.write("SEO CRAWL SUMMARY\n")
-            f.write("=" * 60 + "\n\n")
-
-            f.write(f"Start URL: {start_url}\n")
-            f.write(f"Crawled at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total pages: {len(site_data)}\n\n")
-
-            if crawl_stats:
-                f.write("CRAWL STATISTICS\n")
-                f.write("-" * 60 + "\n")
-                for key, value in crawl_stats.items():
-                    f.write(f"{key}: {value}\n")
-                f.write("\n")
-
-            f.write("TECHNICAL ISSUES\n")
-            f.write("-" * 60 + "\n")
-            f.write(f"Missing titles: {len(technical_issues.missing_titles)}\n")
-            f.write(f"Duplicate titles: {len(technical_issues.duplicate_titles)}\n")
-            f.write(f"Missing meta descriptions: {len(technical_issues.missing_meta_descriptions)}\n")
-            f.write(f"Short meta descriptions: {len(technical_issues.short_meta_descriptions)}\n")
-            f.write(f"Missing H1 tags: {len(technical_issues.missing_h1)}\n")
-            f.write(f"Images without alt: {len(technical_issues.images_without_alt)}\n")
-            f.write(f"Slow pages (>3s): {len(technical_issues.slow_pages)}\n")
-            f.write(f"Thin content (<300w): {len(technical_issues.thin_content)}\n")
-            f.write(f"Missing canonical: {len(technical_issues.missing_canonical)}\n")
-            f.write(f"Missing viewport: {len(technical_issues.missing_viewport)}\n")
-            f.write(f"Non-HTTPS pages: {len(technical_issues.non_https)}\n")
-            f.write("\n")
-
-            f.write("PAGES CRAWLED\n")
-            f.write("-" * 60 + "\n")
-            for i, url in enumerate(site_data.keys(), 1):
-                f.write(f"{i:3d}. {url}\n")
+            f.write("".join(lines))
 
     def _create_latest_link(self, crawl_dir: Path) -> None:
         """Create/update 'latest' symlink to this crawl.
@@ -402,14 +654,14 @@ class OutputManager:
             crawl_dir: Directory for this crawl
         """
         latest_link = crawl_dir.parent / "latest"
+        tmp_link = crawl_dir.parent / ".latest.tmp"
 
-        # Remove old symlink if exists
-        if latest_link.exists() or latest_link.is_symlink():
-            latest_link.unlink()
-
-        # Create new symlink (relative)
+        # Create new symlink (relative) beside the old one, then swap it in
+        # atomically; there is no moment without a 'latest' link
         try:
-            latest_link.symlink_to(crawl_dir.name)
+            tmp_link.unlink(missing_ok=True)
+            tmp_link.symlink_to(crawl_dir.name)
+            os.replace(tmp_link, latest_link)
         except (OSError, NotImplementedError):
             # Symlinks might not work on all systems (Windows)
             # Create a text file instead
@@ -429,13 +681,28 @@ class OutputManager:
         if not domain_dir.exists():
             return []
 
-        crawl_dirs = [
-            d for d in domain_dir.iterdir()
-            if d.is_dir() and d.name != "latest"
-        ]
-
         # Sort by timestamp (directory name)
-        return sorted(crawl_dirs, reverse=True)
+        names = sorted(self._crawl_dir_names(domain_dir), reverse=True)
+        return [domain_dir / name for name in names]
+
+    @staticmethod
+    def _crawl_dir_names(domain_dir: Path) -> List[str]:
+        """List the crawl directory names under a domain directory.
+
+        Uses os.scandir so no Path is built for entries that are skipped.
+
+        Args:
+            domain_dir: Domain output directory
+
+        Returns:
+            Directory names, excluding the 'latest' link and hidden entries
+        """
+        with os.scandir(domain_dir) as entries:
+            return [
+                entry.name for entry in entries
+                if entry.name != "latest" and not entry.name.startswith(".")
+                and entry.is_dir()
+            ]
 
     def compare_crawls(self, domain: str, crawl1: str, crawl2: str) -> dict:
         """Compare two crawls for the same domain.
@@ -482,65 +749,26 @@ class OutputManager:
         Returns:
             JSON-serializable dictionary
         """
-        from dataclasses import asdict, is_dataclass
-
-        def to_dict(item):
-            """Convert item to dict, handling both dataclasses and dicts."""
-            if is_dataclass(item) and not isinstance(item, type):
-                return asdict(item)
-            return item
-
         result = {}
 
-        # Serialize content quality metrics
-        if 'content_quality' in advanced_analysis:
-            result['content_quality'] = [
-                to_dict(item) for item in advanced_analysis['content_quality']
-            ]
-
-        # Serialize security analysis
-        if 'security' in advanced_analysis:
-            result['security'] = [
-                to_dict(item) for item in advanced_analysis['security']
-            ]
-
-        # Serialize URL structure analysis
-        if 'url_structure' in advanced_analysis:
-            result['url_structure'] = [
-                to_dict(item) for item in advanced_analysis['url_structure']
-            ]
-
-        # Mobile and international are already dicts
-        if 'mobile' in advanced_analysis:
-            result['mobile'] = advanced_analysis['mobile']
-
-        if 'international' in advanced_analysis:
-            result['international'] = advanced_analysis['international']
+        # Lists of analysis dataclasses (content quality, security, URL structure)
+        for key in _DATACLASS_LIST_KEYS:
+            if key in advanced_analysis:
+                result[key] = [
+                    asdict(item) if hasattr(type(item), "__dataclass_fields__") else item
+                    for item in advanced_analysis[key]
+                ]
 
-        # Add metadata_list for Lighthouse and CWV data
-        if 'metadata_list' in advanced_analysis:
-            result['metadata_list'] = advanced_analysis['metadata_list']
-
-        # Add crawlability analysis
-        if 'crawlability' in advanced_analysis:
-            result['crawlability'] = advanced_analysis['crawlability']
-
-        # Add technology analysis
-        if 'technology' in advanced_analysis:
-            result['technology'] = advanced_analysis['technology']
-
-        # Add LLM evidence (Epic 1)
-        if 'llm_evidence' in advanced_analysis:
-            result['llm_evidence'] = advanced_analysis['llm_evidence']
-
-        # Add CWV evidence (Epic 3)
-        if 'cwv_evidence' in advanced_analysis:
-            result['cwv_evidence'] = advanced_analysis['cwv_evidence']
+        # Already JSON-ready (mobile, international, Lighthouse/CWV metadata,
+        # crawlability, technology, LLM and CWV evidence)
+        for key in _PASSTHROUGH_KEYS:
+            if key in advanced_analysis:
+                result[key] = advanced_analysis[key]
 
         return result
 
     def _load_json(self, filepath: Path) -> dict:
-        """Load JSON file.
+        """Load JSON file (gzipped if the name ends in .gz).
 
         Args:
             filepath: Path to JSON file
@@ -548,8 +776,7 @@ class OutputManager:
         Returns:
             Loaded data
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_file(filepath)
 
     def save_crawl_state(self, crawl_dir: Path, state: dict) -> None:
         """Save crawl state for resume capability.
@@ -604,17 +831,12 @@ class OutputManager:
         if not domain_dir.exists():
             return None
 
-        # Get all timestamp directories
-        crawl_dirs = [
-            d for d in domain_dir.iterdir()
-            if d.is_dir() and d.name != "latest"
-        ]
-
-        if not crawl_dirs:
+        # Timestamp directory names sort chronologically
+        latest = max(self._crawl_dir_names(domain_dir), default=None)
+        if latest is None:
             return None
 
-        # Sort by timestamp (directory name) and return the latest
-        return sorted(crawl_dirs, reverse=True)[0]
+        return domain_dir / latest
 
     def find_resumable_crawls(self, domain: str) -> List[Path]:
         """Find all crawl directories for a domain that can be resumed.
@@ -630,10 +852,10 @@ class OutputManager:
             return []
 
         resumable = []
-        for d in domain_dir.iterdir():
-            if d.is_dir() and d.name != "latest":
-                state = self.load_crawl_state(d)
-                if state and state.get("status") == "paused":
-                    resumable.append(d)
+        for name in sorted(self._crawl_dir_names(domain_dir), reverse=True):
+            d = domain_dir / name
+            state = self.load_crawl_state(d)
+            if state and state.get("status") == "paused":
+                resumable.append(d)
 
-        return sorted(resumable, reverse=True)
+        return resumable
@@ -75,6 +75,7 @@ from typing import Optional
 
 from seo.analyzer import SEOAnalyzer
 from seo.models import TechnicalIssues, PageMetadata, EvidenceRecord, EvidenceCollection, ConfidenceLevel, EvidenceSourceType
+from seo.output_manager import load_saved_json
 from seo.report_generator import ReportGenerator
 
 
@@ -102,10 +103,7 @@ def load_crawl_data(crawl_dir: Path) -> tuple[dict, dict, dict, list]:
         with open(technical_issues_path, 'r', encoding='utf-8') as f:
             technical_issues = json.load(f)
 
-    advanced_analysis = {}
-    if advanced_analysis_path.exists():
-        with open(advanced_analysis_path, 'r', encoding='utf-8') as f:
-            advanced_analysis = json.load(f)
+    advanced_analysis = load_saved_json(advanced_analysis_path) or {}
 
     # Extract site_data from advanced_analysis if available
     site_data_list = advanced_analysis.get('metadata_list', [])
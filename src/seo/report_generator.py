@@ -8,6 +8,7 @@ from typing import Dict, List, Optional
 from jinja2 import Environment, FileSystemLoader
 
 from seo.models import TechnicalIssues, PageMetadata
+from seo.output_manager import load_saved_json
 from seo.resource_analyzer import ResourceAnalyzer
 from seo.console_analyzer import ConsoleErrorAnalyzer
 from seo.social_analyzer import SocialMetaAnalyzer
@@ -291,11 +292,8 @@ class ReportGenerator:
         technical_issues = self._load_json(crawl_dir / "technical_issues.json")
         recommendations = self._load_text(crawl_dir / "recommendations.txt")
 
-        # Load advanced analysis if available
-        advanced_analysis_path = crawl_dir / "advanced_analysis.json"
-        advanced_analysis = None
-        if advanced_analysis_path.exists():
-            advanced_analysis = self._load_json(advanced_analysis_path)
+        # Load advanced analysis if available (plain or gzipped)
+        advanced_analysis = load_saved_json(crawl_dir / "advanced_analysis.json")
 
         # Organize into patterns
         patterns = self._organize_patterns(technical_issues)
@@ -5,6 +5,7 @@ the crawler. Currently, only aggregate page.third_party_size_bytes is available.
 When per-resource sizes become available, enable per-domain byte tracking.
 """
 
+import heapq
 from collections import defaultdict
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
@@ -182,9 +183,10 @@ class ThirdPartyAnalyzer:
             else:
                 analysis.other_domains.append(d.domain)
 
-        # Pages with most third-party resources
-        page_third_party.sort(key=lambda x: x['request_count'], reverse=True)
-        analysis.heaviest_pages = page_third_party[:10]
+        # Pages with most third-party resources (partial sort, ties keep page order)
+        analysis.heaviest_pages = heapq.nlargest(
+            10, page_third_party, key=lambda x: x['request_count']
+        )
 
         # Generate recommendations
         analysis.recommendations = self._generate_recommendations(analysis)
@@ -70,6 +70,14 @@ class TestImageAnalyzer:
         assert analysis.total_images == 6  # 4 + 2 images
         assert analysis.total_pages == 2
 
+    def test_analyze_counts_formats(self, analyzer, sample_pages):
+        """Test that format counts are a plain dict in first-seen order."""
+        analysis, _ = analyzer.analyze(sample_pages)
+
+        assert type(analysis.format_counts) is dict
+        assert analysis.format_counts == {"jpg": 3, "png": 2, "webp": 1}
+        assert list(analysis.format_counts) == ["jpg", "png", "webp"]
+
     def test_analyze_detects_missing_alt(self, analyzer, sample_pages):
         """Test detection of images without alt text."""
         analysis, _ = analyzer.analyze(sample_pages)
@@ -0,0 +1,150 @@
+# tests/test_lab_field_analyzer.py
+"""Tests for the lab (Lighthouse) vs field (CrUX) analyzer."""
+
+import pytest
+from seo.config import AnalysisThresholds
+from seo.lab_field_analyzer import LabFieldAnalyzer
+from seo.models import (
+    PageMetadata,
+    EvidenceCollection,
+    EvidenceRecord,
+    ConfidenceLevel,
+)
+
+
+class TestLabFieldAnalyzer:
+    """Test suite for LabFieldAnalyzer."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create a LabFieldAnalyzer instance."""
+        return LabFieldAnalyzer()
+
+    @pytest.fixture
+    def pages(self):
+        """Create pages with a mix of lab and field data."""
+        optimistic = PageMetadata(url="https://example.com/fast-lab")
+        optimistic.lighthouse_lcp = 1500.0
+        optimistic.crux_lcp_percentile = 4200
+        optimistic.crux_lcp_category = "SLOW"
+        optimistic.lighthouse_cls = 0.05
+        optimistic.crux_cls_percentile = 0.08
+        optimistic.lighthouse_tbt = 150.0
+        optimistic.crux_fid_percentile = 80
+
+        matching = PageMetadata(url="https://example.com/matching")
+        matching.lighthouse_lcp = 2000.0
+        matching.crux_lcp_percentile = 2100
+        matching.crux_lcp_category = "FAST"
+
+        lab_only = PageMetadata(url="https://example.com/lab-only")
+        lab_only.lighthouse_lcp = 3000.0
+
+        return {page.url: page for page in (optimistic, matching, lab_only)}
+
+    def test_empty_pages(self, analyzer):
+        """Test analysis with no pages."""
+        comparison, evidence = analyzer.analyze({})
+
+        assert comparison.total_pages == 0
+        assert evidence['record_count'] == 0
+
+    def test_counts_and_tendency(self, analyzer, pages):
+        """Test page counts, gap buckets and lab tendency."""
+        comparison, _ = analyzer.analyze(pages)
+
+        assert comparison.total_pages == 3
+        assert comparison.pages_with_both == 2
+        assert comparison.overall_lab_better == 1
+        assert comparison.overall_match == 1
+        assert comparison.overall_field_better == 0
+        assert comparison.lab_tendency == "optimistic"
+
+    def test_status_mismatch_and_gap(self, analyzer, pages):
+        """Test that disagreeing pages are reported."""
+        comparison, _ = analyzer.analyze(pages)
+
+        assert len(comparison.status_mismatches) == 1
+        mismatch = comparison.status_mismatches[0]
+        assert mismatch['url'] == "https://example.com/fast-lab"
+        assert mismatch['lab_status'] == "good"
+        assert mismatch['field_status'] == "poor"
+
+        assert len(comparison.pages_with_gaps) == 1
+        assert comparison.pages_with_gaps[0]['gap_percentage'] == -64.3
+
+    def test_metric_comparisons(self, analyzer, pages):
+        """Test aggregate metric comparisons."""
+        comparison, _ = analyzer.analyze(pages)
+
+        assert comparison.lcp_comparison.lab_value == 1750.0
+        assert comparison.lcp_comparison.field_value == 3150.0
+        assert comparison.cls_comparison.lab_value == 0.05
+        assert comparison.fid_inp_comparison.lab_status == "good"
+        assert comparison.fid_inp_comparison.insight
+
+    def test_custom_thresholds(self, pages):
+        """Test that configured thresholds drive status and gap checks."""
+        analyzer = LabFieldAnalyzer(
+            AnalysisThresholds(lcp_good=1000, lcp_poor=5000, lab_field_significant_gap=70.0)
+        )
+
+        comparison, _ = analyzer.analyze(pages)
+
+        assert analyzer.lcp_good == 1000
+        assert analyzer.significant_gap == 70.0
+        assert comparison.pages_with_gaps == []
+        assert comparison.overall_match == 2
+        assert comparison.status_mismatches[0]['lab_status'] == "needs-improvement"
+
+    def test_ms_values_round_half_up(self, analyzer):
+        """Test that millisecond averages round halves up."""
+        first = PageMetadata(url="https://example.com/a")
+        first.lighthouse_tbt = 100.0
+        first.crux_fid_percentile = 50
+        second = PageMetadata(url="https://example.com/b")
+        second.lighthouse_tbt = 101.0
+        second.crux_fid_percentile = 51
+
+        comparison, _ = analyzer.analyze({p.url: p for p in (first, second)})
+
+        assert comparison.fid_inp_comparison.lab_value == 101.0
+        assert comparison.fid_inp_comparison.field_value == 51.0
+
+    def test_evidence_records(self, analyzer, pages):
+        """Test evidence for mismatches, gaps and the aggregate summary."""
+        _, evidence = analyzer.analyze(pages)
+
+        findings = [r['finding'] for r in evidence['records']]
+        assert findings == [
+            'lcp_status_mismatch',
+            'lcp_significant_gap',
+            'lab_field_summary',
+        ]
+        assert evidence['record_count'] == 3
+        assert evidence['combined_confidence'] == ConfidenceLevel.HIGH.value
+        assert all(r['source'] == "Lighthouse vs CrUX" for r in evidence['records'])
+
+    def test_repeat_analysis_does_not_leak_evidence(self, analyzer, pages):
+        """Test that evidence from a previous run is not carried over."""
+        analyzer.analyze(pages)
+        _, evidence = analyzer.analyze(pages)
+
+        assert evidence['record_count'] == 3
+
+
+class TestEvidenceCollectionBatch:
+    """Test batched record insertion on EvidenceCollection."""
+
+    def test_add_records(self):
+        """Test that add_records extends and updates confidence."""
+        collection = EvidenceCollection(finding='f', component_id='c')
+        records = [
+            EvidenceRecord.from_api_response('c', 'f', 'Lighthouse', value)
+            for value in range(3)
+        ]
+
+        collection.add_records(records)
+
+        assert collection.records == records
+        assert collection.combined_confidence == ConfidenceLevel.HIGH
@@ -0,0 +1,201 @@
+# tests/test_lighthouse_runner.py
+"""Tests for the Lighthouse CLI runner."""
+
+import os
+import sys
+
+from seo.lighthouse_runner import LighthouseRunner
+
+
+SAMPLE_LHR = {
+    "requestedUrl": "https://example.com/",
+    "finalUrl": "https://example.com/",
+    "userAgent": "test-agent",
+    "categories": {
+        "performance": {"score": 0.91},
+        "seo": {"score": 1.0},
+    },
+    "audits": {
+        "largest-contentful-paint": {"numericValue": 1800.5},
+        "cumulative-layout-shift": {"numericValue": 0.02},
+        "unused-css-rules": {
+            "title": "Reduce unused CSS",
+            "description": "Remove dead rules",
+            "score": 0.5,
+            "details": {
+                "overallSavingsMs": 150,
+                "overallSavingsBytes": 20480,
+                "items": [{}, {}],
+            },
+        },
+        "offscreen-images": {"title": "Defer offscreen images", "details": {}},
+        "dom-size": {"numericValue": 812},
+    },
+}
+
+
+class FakeLighthouseRunner(LighthouseRunner):
+    """Runner whose CLI prints a canned report instead of launching Chrome."""
+
+    def __init__(self, exit_code: int = 0, version: str = "12.0.0", **kwargs):
+        super().__init__(**kwargs)
+        self.exit_code = exit_code
+        self.version = version
+        self.commands = []
+        self.version_checks = 0
+
+    def _version_command(self):
+        self.version_checks += 1
+        return [sys.executable, "-c", f"print({self.version!r})"]
+
+    def _build_command(self, url):
+        self.commands.append(url)
+        script = (
+            "import json, sys\n"
+            f"json.dump({SAMPLE_LHR!r}, sys.stdout)\n"
+            f"sys.exit({self.exit_code})\n"
+        )
+        return [sys.executable, "-c", script]
+
+
+FAKE_CHROME = """#!{python}
+import sys, time, pathlib
+profile = next(a.split("=", 1)[1] for a in sys.argv if a.startswith("--user-data-dir="))
+pathlib.Path(profile, "DevToolsActivePort").write_text("9333\\n/devtools/browser/test")
+time.sleep(60)
+"""
+
+
+class TestLighthouseRunner:
+    """Test suite for LighthouseRunner."""
+
+    def test_build_command(self):
+        """Test the Lighthouse CLI arguments."""
+        runner = LighthouseRunner(only_categories=["performance"])
+        cmd = runner._build_command("https://example.com/")
+
+        assert cmd[:2] == ["lighthouse", "https://example.com/"]
+        assert "--output-path=stdout" in cmd
+        assert "--only-categories=performance" in cmd
+        assert "--skip-audits=full-page-screenshot,final-screenshot,script-treemap-data" in cmd
+
+    def test_build_command_without_skipped_audits(self):
+        """Test that an empty skip list runs every audit."""
+        cmd = LighthouseRunner(skip_audits=[])._build_command("https://example.com/")
+
+        assert not any(arg.startswith("--skip-audits") for arg in cmd)
+
+    def test_shared_chrome(self, tmp_path):
+        """Test that a started Chrome is reused through --port."""
+        chrome = tmp_path / "chrome"
+        chrome.write_text(FAKE_CHROME.format(python=sys.executable))
+        chrome.chmod(0o755)
+
+        runner = LighthouseRunner()
+        assert runner.start_chrome(chrome_path=str(chrome)) == 9333
+        profile_dir = runner._chrome_profile_dir
+
+        cmd = runner._build_command("https://example.com/")
+        assert "--port=9333" in cmd
+        assert not any(arg.startswith("--chrome-flags") for arg in cmd)
+
+        runner.close()
+        assert runner._port is None
+        assert not os.path.exists(profile_dir)
+
+    def test_run_lighthouse(self):
+        """Test a successful synchronous audit."""
+        results = FakeLighthouseRunner().run_lighthouse("https://example.com/")
+
+        assert results["scores"]["performance"] == 91.0
+        assert results["metrics"]["lcp"] == 1800.5
+        assert results["diagnostics"]["dom_size"] == 812
+
+    def test_run_lighthouse_failure(self):
+        """Test that a non-zero exit returns None."""
+        runner = FakeLighthouseRunner(exit_code=1)
+
+        assert runner.run_lighthouse("https://example.com/") is None
+
+    def test_extract_opportunities(self):
+        """Test opportunity extraction from audits."""
+        runner = LighthouseRunner()
+        opportunities = runner._extract_opportunities(SAMPLE_LHR["audits"])
+
+        assert opportunities == [
+            {
+                "id": "unused-css-rules",
+                "title": "Reduce unused CSS",
+                "description": "Remove dead rules",
+                "score": 0.5,
+                "savings_ms": 150,
+                "savings_bytes": 20480,
+                "item_count": 2,
+            }
+        ]
+
+    def test_cache_hit_skips_lighthouse(self, tmp_path):
+        """Test that a fresh cache entry is reused without running the CLI."""
+        runner = FakeLighthouseRunner(cache_dir=tmp_path)
+        first = runner.run_lighthouse("https://example.com/")
+        second = runner.run_lighthouse("https://example.com/")
+
+        assert second == first
+        assert runner.commands == ["https://example.com/"]
+
+    def test_cache_key_includes_categories(self, tmp_path):
+        """Test that different audit settings do not share cache entries."""
+        runner = FakeLighthouseRunner(cache_dir=tmp_path)
+        other = FakeLighthouseRunner(cache_dir=tmp_path, only_categories=["seo"])
+
+        assert runner._cache_path("https://example.com/") != other._cache_path(
+            "https://example.com/"
+        )
+
+    def test_cache_key_includes_lighthouse_version(self, tmp_path):
+        """Test that a Lighthouse upgrade does not reuse old reports."""
+        runner = FakeLighthouseRunner(cache_dir=tmp_path)
+        upgraded = FakeLighthouseRunner(cache_dir=tmp_path, version="13.0.0")
+
+        runner.run_lighthouse("https://example.com/")
+        runner.run_lighthouse("https://example.com/")
+        upgraded.run_lighthouse("https://example.com/")
+
+        assert runner.version_checks == 1
+        assert runner._get_lighthouse_version() == "12.0.0"
+        assert len(runner.commands) == 1
+        assert len(upgraded.commands) == 1
+
+    def test_expired_cache_is_ignored(self, tmp_path):
+        """Test that stale cache entries trigger a new audit."""
+        runner = FakeLighthouseRunner(cache_dir=tmp_path, cache_ttl_s=-1)
+        runner.run_lighthouse("https://example.com/")
+        runner.run_lighthouse("https://example.com/")
+
+        assert len(runner.commands) == 2
+
+    def test_failed_audit_not_cached(self, tmp_path):
+        """Test that failures are not written to the cache."""
+        runner = FakeLighthouseRunner(exit_code=1, cache_dir=tmp_path)
+        runner.run_lighthouse("https://example.com/")
+
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_run_many(self):
+        """Test concurrent audits keep per-URL results."""
+        runner = FakeLighthouseRunner()
+        urls = [f"https://example.com/{i}" for i in range(3)]
+
+        results = await runner.run_many(urls, concurrency=2)
+
+        assert list(results) == urls
+        assert all(r["metrics"]["cls"] == 0.02 for r in results.values())
+        assert sorted(runner.commands) == urls
+
+    async def test_run_many_failure(self):
+        """Test that failed audits map to None."""
+        runner = FakeLighthouseRunner(exit_code=1)
+
+        results = await runner.run_many(["https://example.com/"])
+
+        assert results == {"https://example.com/": None}
@@ -1,8 +1,8 @@
 """Tests for LLM client."""
 
 import pytest
-from unittest.mock import Mock, patch
-from seo.llm import LLMClient
+from unittest.mock import AsyncMock, Mock, patch
+from seo.llm import LLMClient, _PageMetaView
 
 
 class TestLLMClient:
@@ -44,7 +44,7 @@ class TestLLMClient:
         }
 
         prompt = client._build_seo_prompt(
-            "Sample content", metadata, "https://example.com"
+            _PageMetaView.from_metadata(metadata, "Sample content"), "https://example.com"
         )
 
         assert "https://example.com" in prompt
@@ -73,6 +73,59 @@ recommendations[1]: Add keywords
         assert len(result["strengths"]) == 1
         assert len(result["recommendations"]) == 1
 
+    def test_parse_seo_response_strips_surrounding_text(self):
+        """Test that markdown fences and bullet lines around TOON are dropped."""
+        client = LLMClient(api_key="test-key")
+        response = """```toon
+overall_score: 72\r
+  title_score : 65
+- note: ignored
+strengths[2]: Fast, Clear
+```"""
+
+        result = client._parse_seo_response(response)
+
+        assert result["overall_score"] == 72
+        assert result["title_score"] == 65
+        assert result["strengths"] == ["Fast", "Clear"]
+
+    def test_parse_seo_response_malformed_scores(self):
+        """Test that score suffixes are dropped and unparseable scores skipped."""
+        client = LLMClient(api_key="test-key")
+        response = """overall_score: 85/100
+title_score: N/A
+description_score: 70%
+strengths[1]: Good title
+"""
+
+        result = client._parse_seo_response(response)
+
+        assert result["overall_score"] == 85
+        assert "title_score" not in result
+        assert result["description_score"] == 70
+        assert result["strengths"] == ["Good title"]
+        assert "error" not in result
+
+    def test_parse_seo_response_values(self):
+        """Test quoted list items, free-text reasoning and unknown keys."""
+        client = LLMClient(api_key="test-key")
+        response = """overall_score: 7.5
+weaknesses[2]: "Thin content, few links", No H1
+recommendations[0]:
+reasoning: Title at 62 chars: slightly long, word count of 180
+Some prose: not a field
+extra_field: dropped
+"""
+
+        result = client._parse_seo_response(response)
+
+        assert result == {
+            "overall_score": 7.5,
+            "weaknesses": ["Thin content, few links", "No H1"],
+            "recommendations": [],
+            "reasoning": "Title at 62 chars: slightly long, word count of 180",
+        }
+
     def test_parse_seo_response_invalid_json(self):
         """Test parsing invalid JSON response."""
         client = LLMClient(api_key="test-key")
@@ -83,6 +136,7 @@ recommendations[1]: Add keywords
         assert result["overall_score"] == 0
         assert "Failed to parse LLM response" in result["weaknesses"]
         assert "error" in result
+        assert "parse_error" in result
 
     @patch("openai.OpenAI")
     def test_call_openai(self, mock_openai_class):
@@ -98,3 +152,339 @@ recommendations[1]: Add keywords
 
         assert response == "Test response"
         mock_client.chat.completions.create.assert_called_once()
+
+    @patch("openai.OpenAI")
+    def test_call_openai_with_system_prompt(self, mock_openai_class):
+        """Test that the fixed instructions are sent as the system message."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="ok"))]
+        )
+        mock_openai_class.return_value = mock_client
+
+        client = LLMClient(api_key="test-key", provider="openai")
+        user_prompt = client._build_seo_prompt(
+            _PageMetaView.from_metadata({}, "Body"), "https://example.com"
+        )
+        client._call_openai(user_prompt, LLMClient.SEO_SYSTEM_PROMPT)
+
+        messages = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        assert messages[0] == {"role": "system", "content": LLMClient.SEO_SYSTEM_PROMPT}
+        assert messages[1]["content"].startswith("URL: https://example.com")
+        assert "https://example.com" not in LLMClient.SEO_SYSTEM_PROMPT
+
+    @patch("anthropic.Anthropic")
+    def test_anthropic_recommendation_request_shape(self, mock_anthropic_class):
+        """Test that calls without a system prompt send only the user message."""
+        create = mock_anthropic_class.return_value.messages.create
+        create.return_value = Mock(content=[Mock(text="ok")])
+
+        client = LLMClient(api_key="test-key", provider="anthropic", model="claude-test")
+        client._call_llm("Recommend fixes")
+
+        assert create.call_args.kwargs == {
+            "model": "claude-test",
+            "max_tokens": client.max_tokens,
+            "messages": [{"role": "user", "content": "Recommend fixes"}],
+        }
+
+    def test_anthropic_cache_breakpoint_needs_long_prefix(self):
+        """Test that only system prompts long enough to be cached are marked."""
+        client = LLMClient(api_key="test-key", provider="anthropic")
+
+        short = client._anthropic_request("Page", LLMClient.SEO_SYSTEM_PROMPT)["system"]
+        long = client._anthropic_request("Page", "x" * 5000)["system"]
+
+        assert short == [{"type": "text", "text": LLMClient.SEO_SYSTEM_PROMPT}]
+        assert long[0]["cache_control"] == {"type": "ephemeral"}
+
+    @patch("openai.OpenAI")
+    def test_openai_client_is_reused(self, mock_openai_class):
+        """Test that one provider client serves repeated calls."""
+        mock_openai_class.return_value.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="ok"))]
+        )
+
+        client = LLMClient(api_key="test-key", provider="openai")
+        client._call_openai("first")
+        client._call_openai("second")
+
+        mock_openai_class.assert_called_once_with(api_key="test-key")
+
+    @patch("openai.AsyncOpenAI")
+    async def test_analyze_seo_batch(self, mock_async_openai_class):
+        """Test concurrent analysis keeps results in input order."""
+        create = AsyncMock(
+            return_value=Mock(
+                choices=[Mock(message=Mock(content="overall_score: 70\ntitle_score: 60"))]
+            )
+        )
+        mock_async_openai_class.return_value.chat.completions.create = create
+
+        client = LLMClient(api_key="test-key", cache_enabled=False)
+        items = [
+            ("Body", {"title": f"Page {i}"}, f"https://example.com/{i}")
+            for i in range(3)
+        ]
+
+        results = await client.analyze_seo_batch(items, concurrency=2)
+
+        assert [r["overall_score"] for r in results] == [70, 70, 70]
+        assert [r["evidence"]["records"][0]["source_location"] for r in results] == [
+            item[2] for item in items
+        ]
+        assert create.await_count == 3
+        mock_async_openai_class.assert_called_once()
+
+    @patch("seo.llm.HTTP2_AVAILABLE", False)
+    @patch("openai.DefaultAsyncHttpxClient")
+    @patch("openai.AsyncOpenAI")
+    def test_async_openai_client_http2(self, mock_async_openai_class, mock_http_client):
+        """Test that the async client is shared and only uses HTTP/2 with h2."""
+        client = LLMClient(api_key="test-key")
+
+        assert client._get_async_openai_client() is client._get_async_openai_client()
+        mock_http_client.assert_called_once_with(http2=False)
+        mock_async_openai_class.assert_called_once_with(
+            api_key="test-key", http_client=mock_http_client.return_value
+        )
+
+    @patch("openai.AsyncOpenAI")
+    def test_async_openai_client_older_sdk(self, mock_async_openai_class, monkeypatch):
+        """Test that SDKs without DefaultAsyncHttpxClient use their default client."""
+        monkeypatch.delattr("openai.DefaultAsyncHttpxClient")
+        client = LLMClient(api_key="test-key")
+
+        client._get_async_openai_client()
+
+        mock_async_openai_class.assert_called_once_with(api_key="test-key", http_client=None)
+
+    @patch("openai.OpenAI")
+    def test_analyze_seo_served_from_cache(self, mock_openai_class, tmp_path):
+        """Test that a repeated analysis is answered from the cache."""
+        create = mock_openai_class.return_value.chat.completions.create
+        create.return_value = Mock(choices=[Mock(message=Mock(content="overall_score: 80"))])
+
+        client = LLMClient(api_key="test-key", cache_dir=tmp_path)
+        first = client.analyze_seo("Body", {"title": "Home"}, "https://example.com")
+        second = client.analyze_seo("Body", {"title": "Home"}, "https://example.com")
+
+        assert first["from_cache"] is False
+        assert second["from_cache"] is True
+        assert second["overall_score"] == 80
+        assert create.call_count == 1
+        assert client.get_cache_stats()["cache_hits"] == 1
+
+    @patch("openai.OpenAI")
+    def test_unparseable_response_is_not_cached(self, mock_openai_class, tmp_path):
+        """Test that a reply without SEO fields is an error and never cached."""
+        create = mock_openai_class.return_value.chat.completions.create
+        create.return_value = Mock(
+            choices=[Mock(message=Mock(content="Sorry, I cannot analyze this page."))]
+        )
+
+        client = LLMClient(api_key="test-key", cache_dir=tmp_path)
+        first = client.analyze_seo("Body", {"title": "Home"}, "https://example.com")
+        client.close()
+        second = client.analyze_seo("Body", {"title": "Home"}, "https://example.com")
+
+        assert first["error_flag"] is True
+        assert first["error"] == "No SEO fields found in response"
+        assert second["error_flag"] is True
+        assert "from_cache" not in second
+        assert create.call_count == 2
+
+    @patch("openai.OpenAI")
+    def test_analyze_seo_bypasses_cache(self, mock_openai_class, tmp_path):
+        """Test that use_cache=False calls the LLM and refreshes the entry."""
+        create = mock_openai_class.return_value.chat.completions.create
+        create.side_effect = [
+            Mock(choices=[Mock(message=Mock(content="overall_score: 80"))]),
+            Mock(choices=[Mock(message=Mock(content="overall_score: 85"))]),
+        ]
+
+        client = LLMClient(api_key="test-key", cache_dir=tmp_path)
+        client.analyze_seo("Body", {"title": "Home"}, "https://example.com")
+        fresh = client.analyze_seo(
+            "Body", {"title": "Home"}, "https://example.com", use_cache=False
+        )
+        cached = client.analyze_seo("Body", {"title": "Home"}, "https://example.com")
+
+        assert fresh["from_cache"] is False
+        assert create.call_count == 2
+        assert cached["overall_score"] == 85
+
+    @patch("openai.OpenAI")
+    def test_analyze_seo_skips_empty_input(self, mock_openai_class):
+        """Test that empty pages return an error result without an API call."""
+        client = LLMClient(api_key="test-key", cache_enabled=False)
+
+        result = client.analyze_seo("", {"word_count": 0}, "https://example.com/dead")
+
+        assert result["error_flag"] is True
+        assert result["error"].startswith("Empty input")
+        assert result["evidence"]["records"][0]["source_location"] == "https://example.com/dead"
+        mock_openai_class.assert_not_called()
+
+    def test_input_summary_hashes_content_snippet(self):
+        """Test that the content snippet is stored as a digest by default."""
+        content = "x" * 1500
+        page_meta = _PageMetaView.from_metadata({}, content)
+        summary = LLMClient(api_key="test-key")._build_input_summary(
+            page_meta, "https://example.com"
+        )
+        debug_summary = LLMClient(
+            api_key="test-key", include_content_snippet=True
+        )._build_input_summary(page_meta, "https://example.com")
+
+        assert "content_snippet" not in summary
+        assert summary["content_snippet_length"] == 1000
+        assert len(summary["content_snippet_hash"]) == 64
+        assert debug_summary["content_snippet"] == "x" * 1000
+
+    def test_create_evidence_records(self):
+        """Test evidence for the overall score and each sub-score."""
+        client = LLMClient(api_key="test-key", model="gpt-4.1")
+        result = {"overall_score": 80, "title_score": 70, "content_score": 60}
+
+        evidence = client._create_evidence(
+            result, {}, "abc", "raw", "https://example.com"
+        )
+
+        findings = [r["finding"] for r in evidence["records"]]
+        assert findings == ["overall_score:80", "title_score:70", "content_score:60"]
+        assert evidence["combined_confidence"] == "Medium"
+        assert {r["source_api"] for r in evidence["records"][1:]} == {"openai_gpt_4_1"}
+        assert len({r["timestamp"] for r in evidence["records"]}) == 1
+
+    def test_non_retryable_errors(self):
+        """Test classification of errors that should fail fast."""
+        assert LLMClient._is_non_retryable(Exception("401 Unauthorized"))
+        assert LLMClient._is_non_retryable(Exception("Error: Invalid Model 'gpt-x'"))
+        assert not LLMClient._is_non_retryable(Exception("Rate limit exceeded"))
+
+    def test_call_llm_retries_transient_errors(self):
+        """Test that the sync call retries transient errors and fails fast on auth."""
+        client = LLMClient(api_key="test-key")
+        client._call_openai = Mock(side_effect=[Exception("Rate limit exceeded"), "ok"])
+
+        assert client._call_llm("Prompt", retry_delay=0) == "ok"
+        assert client._call_openai.call_count == 2
+
+        client._call_openai = Mock(side_effect=Exception("401 Unauthorized"))
+        with pytest.raises(Exception, match="401"):
+            client._call_llm("Prompt", retry_delay=0)
+        assert client._call_openai.call_count == 1
+
+    async def test_call_llm_async_retries_transient_errors(self):
+        """Test that the async call follows the same retry policy."""
+        client = LLMClient(api_key="test-key")
+        client._call_openai_async = AsyncMock(side_effect=Exception("Timeout"))
+
+        with pytest.raises(Exception, match="Timeout"):
+            await client._call_llm_async("Prompt", max_retries=2, retry_delay=0)
+        assert client._call_openai_async.await_count == 3
+
+    @patch("openai.OpenAI")
+    def test_semantic_cache_reuses_similar_page(self, mock_openai_class):
+        """Test that a near-duplicate page is served from the semantic cache."""
+        mock_client = mock_openai_class.return_value
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="overall_score: 66"))]
+        )
+        mock_client.embeddings.create.side_effect = [
+            Mock(data=[Mock(embedding=[1.0, 0.0])]),
+            Mock(data=[Mock(embedding=[0.99, 0.02])]),
+        ]
+
+        client = LLMClient(
+            api_key="test-key", cache_enabled=False, semantic_cache_threshold=0.92
+        )
+        first = client.analyze_seo("Item list", {"title": "Page 1"}, "https://e.com/p1")
+        second = client.analyze_seo("Item list", {"title": "Page 2"}, "https://e.com/p2")
+
+        assert first["from_cache"] is False
+        assert second["from_cache"] == "semantic"
+        assert second["semantic_match_url"] == "https://e.com/p1"
+        assert second["overall_score"] == 66
+        assert mock_client.chat.completions.create.call_count == 1
+        assert client.get_cache_stats()["semantic_cache_hits"] == 1
+
+    @patch("openai.OpenAI")
+    def test_semantic_cache_skips_failed_analysis(self, mock_openai_class):
+        """Test that an unparseable reply is not reused for similar pages."""
+        mock_client = mock_openai_class.return_value
+        mock_client.chat.completions.create.side_effect = [
+            Mock(choices=[Mock(message=Mock(content="Sorry, I cannot help."))]),
+            Mock(choices=[Mock(message=Mock(content="overall_score: 66"))]),
+        ]
+        mock_client.embeddings.create.side_effect = [
+            Mock(data=[Mock(embedding=[1.0, 0.0])]),
+            Mock(data=[Mock(embedding=[0.99, 0.02])]),
+        ]
+
+        client = LLMClient(
+            api_key="test-key", cache_enabled=False, semantic_cache_threshold=0.92
+        )
+        first = client.analyze_seo("Item list", {"title": "Page 1"}, "https://e.com/p1")
+        second = client.analyze_seo("Item list", {"title": "Page 2"}, "https://e.com/p2")
+
+        assert first["error_flag"] is True
+        assert second["from_cache"] is False
+        assert second["overall_score"] == 66
+        assert len(client._semantic_cache) == 1
+
+    def test_store_semantic_result_rejects_errors(self):
+        """Test that results carrying an error are never stored."""
+        client = LLMClient(
+            api_key="test-key", cache_enabled=False, semantic_cache_threshold=0.92
+        )
+
+        client._store_semantic_result([1.0, 0.0], {"overall_score": 0, "error": "x"}, "a")
+        client._store_semantic_result([1.0, 0.0], {"parse_error": "x"}, "b")
+        client._store_semantic_result([1.0, 0.0], {"overall_score": 70}, "c")
+
+        assert len(client._semantic_cache) == 1
+
+    @patch("openai.OpenAI")
+    def test_cache_writes_flushed_on_close(self, mock_openai_class, tmp_path):
+        """Test that background cache writes reach disk by close()."""
+        create = mock_openai_class.return_value.chat.completions.create
+        create.return_value = Mock(choices=[Mock(message=Mock(content="overall_score: 75"))])
+
+        writer = LLMClient(api_key="test-key", cache_dir=tmp_path)
+        writer.analyze_seo("Body", {"title": "Home"}, "https://example.com")
+        writer.close()
+
+        reader = LLMClient(api_key="test-key", cache_dir=tmp_path)
+        result = reader.analyze_seo("Body", {"title": "Home"}, "https://example.com")
+
+        assert result["from_cache"] is True
+        assert result["overall_score"] == 75
+        assert create.call_count == 1
+
+    @patch("openai.OpenAI")
+    def test_streamed_response_stops_when_complete(self, mock_openai_class):
+        """Test that streaming stops reading once every SEO field arrived."""
+        lines = [
+            "overall_score: 80\ntitle_score: 70\ndescription_score: 60\n",
+            "content_score: 50\ntechnical_score: 40\nstrengths[1]: Fast\n",
+            "weaknesses[1]: Thin\nrecommendations[1]: Add text\nreasoning: Ti",
+            "tle at 20 chars\n",
+            "trailing chatter that should never be read\n",
+        ]
+        stream = Mock()
+        stream.__iter__ = Mock(return_value=iter(
+            Mock(choices=[Mock(delta=Mock(content=text))]) for text in lines
+        ))
+        mock_openai_class.return_value.chat.completions.create.return_value = stream
+
+        client = LLMClient(api_key="test-key", cache_enabled=False, stream_responses=True)
+        result = client.analyze_seo("Body", {"title": "Home"}, "https://example.com")
+
+        assert result["overall_score"] == 80
+        assert result["reasoning"] == "Title at 20 chars"
+        assert "chatter" not in result["evidence"]["records"][0]["evidence_string"]
+        stream.close.assert_called_once()
+        kwargs = mock_openai_class.return_value.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
@@ -0,0 +1,55 @@
+"""Tests for logging configuration."""
+
+import logging
+import logging.handlers
+
+import pytest
+from seo import logging_config
+from seo.logging_config import setup_logging, shutdown_logging
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging."""
+
+    @pytest.fixture(autouse=True)
+    def restore_root_logger(self):
+        """Restore the root logger after each test."""
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        yield
+        shutdown_logging()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    def test_root_logger_uses_queue_handler(self, tmp_path):
+        """Test that the root logger only enqueues records."""
+        setup_logging(level="DEBUG", log_file=str(tmp_path / "seo.log"))
+
+        root = logging.getLogger()
+        assert root.level == logging.DEBUG
+        assert [type(h) for h in root.handlers] == [logging.handlers.QueueHandler]
+
+    def test_records_written_to_file(self, tmp_path):
+        """Test that queued records are formatted once and flushed on shutdown."""
+        log_file = tmp_path / "logs" / "seo.log"
+        setup_logging(log_file=str(log_file), format_string="%(levelname)s:%(message)s")
+
+        logging.getLogger("seo.test").info("crawled %d pages", 3)
+        logging.getLogger("seo.test").debug("hidden")
+        shutdown_logging()
+
+        assert log_file.read_text() == "INFO:crawled 3 pages\n"
+
+    def test_log_file_rotates_and_opens_lazily(self, tmp_path):
+        """Test that the log file rotates and is not created until used."""
+        log_file = tmp_path / "seo.log"
+        setup_logging(log_file=str(log_file))
+
+        file_handler = logging_config._listener.handlers[-1]
+        assert isinstance(file_handler, logging.handlers.RotatingFileHandler)
+        assert file_handler.maxBytes == logging_config.LOG_FILE_MAX_BYTES
+        assert file_handler.backupCount == logging_config.LOG_FILE_BACKUP_COUNT
+
+        shutdown_logging()
+
+        assert not log_file.exists()
@@ -0,0 +1,65 @@
+# tests/test_models.py
+"""Tests for the analysis data models."""
+
+import dataclasses
+
+import pytest
+from seo import models
+from seo.models import PageMetadata
+
+
+class TestModelLayout:
+    """Test suite for the dataclass instance layout."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [obj for obj in vars(models).values() if dataclasses.is_dataclass(obj)],
+    )
+    def test_dataclasses_use_slots(self, model):
+        """Test that every model is slotted (no per-instance __dict__)."""
+        assert "__slots__" in vars(model)
+        assert "__dict__" not in dir(model)
+
+    def test_undeclared_attribute_rejected(self):
+        """Test that typos in attribute names fail instead of adding fields."""
+        page = PageMetadata(url="https://example.com/")
+
+        with pytest.raises(AttributeError):
+            page.not_a_field = 1
+
+
+class TestPageMetadata:
+    """Test suite for PageMetadata."""
+
+    def test_small_vocabulary_strings_interned(self):
+        """Test that repeated category values share one string object."""
+        pages = [
+            PageMetadata(
+                url=f"https://example.com/{i}",
+                tech_web_server="".join(["ng", "inx"]),
+                third_party_domains=["".join(["cdn.", "example.net"])],
+            )
+            for i in range(2)
+        ]
+
+        assert pages[0].tech_web_server is pages[1].tech_web_server
+        assert pages[0].third_party_domains[0] is pages[1].third_party_domains[0]
+
+    def test_rarely_used_lists_share_empty_default(self):
+        """Test that unpopulated optional lists are the shared empty tuple."""
+        page = PageMetadata(url="https://example.com/")
+        other = PageMetadata(url="https://example.com/other", console_errors=["x"])
+
+        assert page.console_errors == () and page.console_errors is other.redirect_chain
+        assert other.console_errors == ["x"]
+        assert page.keywords == [] and page.keywords is not other.keywords
+
+    def test_repr_is_compact(self):
+        """Test that repr only shows the URL and status; full_repr shows all."""
+        page = PageMetadata(url="https://example.com/", status_code=404)
+
+        assert repr(page) == "PageMetadata(url='https://example.com/', status=404)"
+        assert page.full_repr().startswith(
+            "PageMetadata(url='https://example.com/', title=None,"
+        )
+        assert "web_fonts=()" in page.full_repr()
@@ -0,0 +1,311 @@
+# tests/test_output_manager.py
+"""Tests for the crawl output manager."""
+
+import gzip
+import json
+import os
+from dataclasses import asdict
+from datetime import datetime
+
+import pytest
+from seo.models import PageMetadata, SecurityAnalysis, TechnicalIssues
+from seo.output_manager import DateTimeEncoder, OutputManager, load_saved_json
+
+
+@pytest.fixture
+def site_data():
+    """Create a small crawled site."""
+    urls = [
+        "https://example.com/",
+        "https://example.com/about",
+        "https://example.com/blog/post-1",
+    ]
+    return {url: PageMetadata(url=url, title=f"Title {i}") for i, url in enumerate(urls)}
+
+
+class TestOutputManager:
+    """Test suite for OutputManager."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create an OutputManager writing under a temporary directory."""
+        return OutputManager(base_output_dir=str(tmp_path / "crawls"))
+
+    def test_save_json_matches_stdlib_format(self, manager, tmp_path):
+        """Test that saved JSON is 2-space indented UTF-8 with ISO datetimes."""
+        data = {
+            "crawled_at": datetime(2025, 11, 23, 14, 30, 22, 125000),
+            "title": "Café menu",
+            "counts": {"errors": 2, "warnings": 0},
+            "urls": ["https://example.com/", "https://example.com/about"],
+            "empty": [],
+        }
+        path = tmp_path / "data.json"
+
+        manager._save_json(path, data)
+
+        assert path.read_text(encoding="utf-8") == json.dumps(
+            data, indent=2, ensure_ascii=False, cls=DateTimeEncoder
+        )
+
+    def test_save_crawl_results_writes_every_page(self, manager, site_data):
+        """Test that each page is written to its own file under pages/."""
+        crawl_dir = manager.create_crawl_directory("https://example.com/")
+
+        manager.save_crawl_results(
+            crawl_dir, "https://example.com/", site_data, TechnicalIssues(), "None"
+        )
+
+        pages = {
+            path.name: json.loads(path.read_text(encoding="utf-8"))
+            for path in (crawl_dir / "pages").iterdir()
+        }
+        assert sorted(pages) == [
+            "example_com_about.json",
+            "example_com_blog_post-1.json",
+            "example_com_index.json",
+        ]
+        assert pages["example_com_about.json"]["title"] == "Title 1"
+        assert "content_text" not in pages["example_com_index.json"]
+
+    def test_page_metadata_to_dict(self, manager):
+        """Test the page dict matches asdict without content_text."""
+        page = PageMetadata(
+            url="https://example.com/",
+            h1_tags=["Welcome"],
+            images=[{"src": "/a.png", "alt": ""}],
+            content_text="Some page text",
+            crawled_at=datetime(2025, 11, 23, 14, 30),
+        )
+
+        data = manager._page_metadata_to_dict(page)
+
+        expected = asdict(page)
+        del expected["content_text"]
+        expected["crawled_at"] = "2025-11-23T14:30:00"
+        expected["content_text_length"] = 14
+        assert data == expected
+
+    def test_serialize_advanced_analysis(self, manager):
+        """Test dataclass sections become dicts and known sections pass through."""
+        security = SecurityAnalysis(url="https://example.com/", has_https=True)
+        analysis = {
+            "technology": {"cms": "WordPress"},
+            "security": [security, {"url": "https://example.com/about"}],
+            "mobile": {"score": 80},
+            "unknown": {"ignored": True},
+        }
+
+        result = manager._serialize_advanced_analysis(analysis)
+
+        assert list(result) == ["security", "mobile", "technology"]
+        assert result["security"] == [asdict(security), {"url": "https://example.com/about"}]
+        assert result["mobile"] == {"score": 80}
+
+    def test_save_crawl_results_pages_jsonl(self, manager, site_data):
+        """Test that pages_jsonl writes one JSON object per line."""
+        crawl_dir = manager.create_crawl_directory("https://example.com/")
+
+        manager.save_crawl_results(
+            crawl_dir, "https://example.com/", site_data, TechnicalIssues(), "None",
+            pages_jsonl=True,
+        )
+
+        lines = (crawl_dir / "pages.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["url"] for line in lines] == list(site_data)
+        assert list((crawl_dir / "pages").iterdir()) == []
+        assert [p["title"] for p in manager.iter_saved_pages(crawl_dir)] == [
+            "Title 0", "Title 1", "Title 2",
+        ]
+
+    def test_iter_saved_pages_reads_page_files(self, manager, site_data):
+        """Test that per-page crawls are read back from pages/."""
+        crawl_dir = manager.create_crawl_directory("https://example.com/")
+        manager.save_crawl_results(
+            crawl_dir, "https://example.com/", site_data, TechnicalIssues(), "None"
+        )
+
+        urls = {page["url"] for page in manager.iter_saved_pages(crawl_dir)}
+
+        assert urls == set(site_data)
+
+    def test_url_to_filename(self, manager):
+        """Test filename conversion, including non-ASCII and unsafe characters."""
+        assert manager._url_to_filename("https://example.com") == "example_com_index"
+        assert manager._url_to_filename("https://example.com:8080/a/b.html") == (
+            "example_com_8080_a_b_html"
+        )
+        assert manager._url_to_filename("https://example.com/café?q=1") == "example_com_café"
+        assert manager._url_to_filename("https://example.com/a%20b") == "example_com_a_20b"
+
+    def test_save_crawl_results_compressed(self, manager, site_data):
+        """Test that compress=True gzips pages and advanced analysis."""
+        crawl_dir = manager.create_crawl_directory("https://example.com/")
+
+        manager.save_crawl_results(
+            crawl_dir, "https://example.com/", site_data, TechnicalIssues(), "None",
+            advanced_analysis={"mobile": {"score": 80}}, compress=True,
+        )
+
+        with gzip.open(crawl_dir / "advanced_analysis.json.gz", "rt", encoding="utf-8") as f:
+            assert json.load(f) == {"mobile": {"score": 80}}
+        assert not (crawl_dir / "advanced_analysis.json").exists()
+        assert len(list((crawl_dir / "pages").glob("*.json.gz"))) == 3
+        assert {p["url"] for p in manager.iter_saved_pages(crawl_dir)} == set(site_data)
+
+    def test_pages_jsonl_compressed(self, manager, site_data):
+        """Test reading back gzipped JSON Lines pages."""
+        crawl_dir = manager.create_crawl_directory("https://example.com/")
+
+        manager.save_crawl_results(
+            crawl_dir, "https://example.com/", site_data, TechnicalIssues(), "None",
+            pages_jsonl=True, compress=True,
+        )
+
+        assert (crawl_dir / "pages.jsonl.gz").exists()
+        assert [p["url"] for p in manager.iter_saved_pages(crawl_dir)] == list(site_data)
+
+    def test_save_summary(self, manager, site_data, tmp_path):
+        """Test the human-readable summary sections."""
+        path = tmp_path / "summary.txt"
+
+        manager._save_summary(
+            path, "https://example.com/", site_data, TechnicalIssues(), {"pages_crawled": 3}
+        )
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines[1] == "SEO CRAWL SUMMARY"
+        assert "Total pages: 3" in lines
+        assert "pages_crawled: 3" in lines
+        assert "Missing titles: 0" in lines
+        assert lines[-3:] == [
+            "  1. https://example.com/",
+            "  2. https://example.com/about",
+            "  3. https://example.com/blog/post-1",
+        ]
+
+    def test_lighthouse_dir_created_once(self, manager, tmp_path, monkeypatch):
+        """Test that known directories are not re-created on every save."""
+        manager.save_psi_coverage(tmp_path, {"coverage_percentage": 100.0})
+        calls = []
+        monkeypatch.setattr(type(tmp_path), "mkdir", lambda self, **kw: calls.append(self))
+
+        manager.save_lighthouse_reports(tmp_path, {"https://example.com/": {}})
+
+        assert calls == []
+        assert (tmp_path / "lighthouse" / "example_com_index.json").exists()
+
+    def test_save_pages_sharing_a_filename(self, manager):
+        """Test that URLs differing only by query keep the last page."""
+        crawl_dir = manager.create_crawl_directory("https://example.com/")
+        site_data = {
+            f"https://example.com/list?page={i}": PageMetadata(
+                url=f"https://example.com/list?page={i}", title=f"Page {i}"
+            )
+            for i in range(16)
+        }
+
+        manager.save_crawl_results(
+            crawl_dir, "https://example.com/", site_data, TechnicalIssues(), "None"
+        )
+
+        page_files = list((crawl_dir / "pages").iterdir())
+        assert [p.name for p in page_files] == ["example_com_list.json"]
+        page = json.loads(page_files[0].read_text(encoding="utf-8"))
+        assert page["url"] == "https://example.com/list?page=15"
+
+    def test_lighthouse_reports_sharing_a_filename(self, manager, tmp_path):
+        """Test that the last report wins for URLs sharing a filename."""
+        psi_results = {
+            "https://example.com/list?page=1": {"performance_score": 50},
+            "https://example.com/list?page=2": {"performance_score": 90},
+        }
+
+        manager.save_lighthouse_reports(tmp_path, psi_results)
+
+        report = json.loads(
+            (tmp_path / "lighthouse" / "example_com_list.json").read_text(encoding="utf-8")
+        )
+        assert report["url"] == "https://example.com/list?page=2"
+
+    def test_save_lighthouse_reports(self, manager, site_data, tmp_path):
+        """Test that one report file is written per audited URL."""
+        psi_results = {url: {"performance_score": 90} for url in site_data}
+
+        manager.save_lighthouse_reports(tmp_path, psi_results)
+
+        report = json.loads(
+            (tmp_path / "lighthouse" / "example_com_about.json").read_text(encoding="utf-8")
+        )
+        assert report["url"] == "https://example.com/about"
+        assert report["scores"]["performance"] == 90
+        assert len(list((tmp_path / "lighthouse").glob("example_com_*.json"))) == 3
+
+    def test_create_latest_link_replaces_previous(self, manager, tmp_path):
+        """Test that the latest link is swapped to the newest crawl."""
+        first, second = tmp_path / "2025-01-01_000000", tmp_path / "2025-01-02_000000"
+        first.mkdir()
+        second.mkdir()
+
+        manager._create_latest_link(first)
+        manager._create_latest_link(second)
+
+        assert os.readlink(tmp_path / "latest") == "2025-01-02_000000"
+        assert not (tmp_path / ".latest.tmp").exists()
+
+    def test_find_crawls(self, manager):
+        """Test crawl directory discovery, ignoring files and the latest link."""
+        domain_dir = manager.base_output_dir / "example.com"
+        for name in ["2025-01-02_000000", "2025-03-04_000000", "2025-02-03_000000"]:
+            (domain_dir / name).mkdir(parents=True)
+        (domain_dir / "latest").symlink_to("2025-03-04_000000")
+        (domain_dir / "notes.txt").write_text("not a crawl")
+        state = {
+            "version": 1, "status": "paused", "config": {},
+            "progress": {}, "visited_urls": [], "queue": [],
+        }
+        manager.save_crawl_state(domain_dir / "2025-02-03_000000", state)
+
+        assert [d.name for d in manager.get_previous_crawls("example.com")] == [
+            "2025-03-04_000000", "2025-02-03_000000", "2025-01-02_000000",
+        ]
+        assert manager.find_latest_crawl("example.com") == domain_dir / "2025-03-04_000000"
+        assert manager.find_resumable_crawls("example.com") == [domain_dir / "2025-02-03_000000"]
+        assert manager.find_latest_crawl("other.com") is None
+
+    def test_load_saved_json(self, manager, tmp_path):
+        """Test loading plain and gzipped crawl files by their plain name."""
+        manager._save_json(tmp_path / "plain.json", {"a": 1})
+        manager._save_json(tmp_path / "packed.json", {"b": 2}, compress=True)
+
+        assert load_saved_json(tmp_path / "plain.json") == {"a": 1}
+        assert load_saved_json(tmp_path / "packed.json") == {"b": 2}
+        assert load_saved_json(tmp_path / "missing.json") is None
+
+    def test_iter_saved_pages_skips_unreadable_files(self, manager, site_data):
+        """Test that one corrupt page file does not stop the others loading."""
+        crawl_dir = manager.create_crawl_directory("https://example.com/")
+        manager.save_crawl_results(
+            crawl_dir, "https://example.com/", site_data, TechnicalIssues(), "None"
+        )
+        (crawl_dir / "pages" / "example_com_about.json").write_text("{not json")
+
+        urls = {page["url"] for page in manager.iter_saved_pages(crawl_dir)}
+
+        assert urls == {"https://example.com/", "https://example.com/blog/post-1"}
+
+    def test_resume_loads_jsonl_pages(self, manager, site_data):
+        """Test that crawl resume restores pages saved as gzipped JSON Lines."""
+        from seo.async_site_crawler import AsyncSiteCrawler
+
+        crawl_dir = manager.create_crawl_directory("https://example.com/")
+        manager.save_crawl_results(
+            crawl_dir, "https://example.com/", site_data, TechnicalIssues(), "None",
+            pages_jsonl=True, compress=True,
+        )
+        crawler = AsyncSiteCrawler()
+
+        crawler._load_page_data_from_disk(crawl_dir)
+
+        assert list(crawler.site_data) == list(site_data)
+        assert crawler.site_data["https://example.com/about"].title == "Title 1"
@@ -140,6 +140,20 @@ class TestAICache:
         assert cached is not None
         assert cached["answer"] == "Paris"
 
+    def test_put_and_get_by_key(self, cache):
+        """Test storing and retrieving with a caller-supplied key."""
+        key = cache.put_by_key("abc123", {"answer": "Paris"}, model="gpt-4", prompt_hash="f" * 64)
+
+        assert key == "abc123"
+        assert cache.get_by_key("abc123") == {"answer": "Paris"}
+        assert cache.get_by_key("missing") is None
+
+    def test_put_and_get_share_key_space(self, cache):
+        """Test that get_by_key finds entries stored through put."""
+        key = cache.put("Prompt", {"answer": 42}, model="gpt-4", context={"url": "a.com"})
+
+        assert cache.get_by_key(key) == {"answer": 42}
+
     def test_get_cache_miss(self, cache):
         """Test cache miss returns None."""
         result = cache.get("This prompt is not cached")
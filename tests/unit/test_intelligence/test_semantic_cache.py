@@ -0,0 +1,52 @@
+"""Unit tests for SemanticCache."""
+
+import pytest
+
+from seo.intelligence.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Tests for the embedding-similarity cache."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create a cache with a 0.9 similarity threshold."""
+        return SemanticCache(threshold=0.9, max_entries=2)
+
+    def test_similar_embedding_hits(self, cache):
+        """Test that a near-identical vector returns the stored response."""
+        cache.add("a.com", [1.0, 0.0, 0.0], {"score": 80})
+
+        key, response, similarity = cache.query([0.99, 0.05, 0.0])
+
+        assert key == "a.com"
+        assert response == {"score": 80}
+        assert similarity > 0.99
+
+    def test_dissimilar_embedding_misses(self, cache):
+        """Test that vectors below the threshold do not match."""
+        cache.add("a.com", [1.0, 0.0, 0.0], {"score": 80})
+
+        assert cache.query([0.0, 1.0, 0.0]) is None
+
+    def test_best_match_wins(self, cache):
+        """Test that the most similar entry is returned."""
+        cache.add("a.com", [1.0, 0.2, 0.0], {"score": 1})
+        cache.add("b.com", [1.0, 0.0, 0.0], {"score": 2})
+
+        assert cache.query([1.0, 0.01, 0.0])[0] == "b.com"
+
+    def test_oldest_entry_evicted(self, cache):
+        """Test that max_entries bounds the cache."""
+        for i, key in enumerate(["a.com", "b.com", "c.com"]):
+            cache.add(key, [float(i), 1.0], {"score": i})
+
+        assert len(cache) == 2
+        assert cache.query([0.0, 1.0]) is None
+
+    def test_zero_vector_ignored(self, cache):
+        """Test that zero vectors are neither stored nor matched."""
+        cache.add("a.com", [0.0, 0.0], {"score": 1})
+
+        assert len(cache) == 0
+        assert cache.query([0.0, 0.0]) is None